@@ -0,0 +1,5 @@
+"""
+Benchmarks, run offline against generated OpenSea payloads.
+Each module can be run on its own, for instance: python -m open_sea_v1.benchmarks.bench_json_backends
+or all of them at once, with their results emitted as JSON: python -m open_sea_v1.benchmarks --output results.json
+"""
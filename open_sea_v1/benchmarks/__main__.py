@@ -0,0 +1,72 @@
+"""
+Runs the benchmarks, and emits their results as JSON, along with the version they measured,
+so that the results of successive versions can be compared to track regressions:
+    python -m open_sea_v1.benchmarks --output benchmarks.json
+    python -m open_sea_v1.benchmarks bench_endpoints bench_json_backends
+"""
+import json
+import pkgutil
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Optional
+
+BENCHMARKS_PACKAGE = 'open_sea_v1.benchmarks'
+
+
+def discover_benchmarks() -> list[str]:
+    return sorted(module.name for module in pkgutil.iter_modules([str(Path(__file__).parent)])
+                  if module.name.startswith('bench_'))
+
+
+def package_version() -> Optional[str]:
+    try:
+        return version('opensea_api_wrapper')
+    except PackageNotFoundError:
+        return None
+
+
+def git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=Path(__file__).parent,
+                                   capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def run_benchmarks(names: list[str]) -> dict:
+    return dict(
+        version=package_version(),
+        commit=git_commit(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        started_at=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        results={name: import_module(f'{BENCHMARKS_PACKAGE}.{name}').run() for name in names},
+    )
+
+
+def main() -> None:
+    available = discover_benchmarks()
+    parser = ArgumentParser(prog=f'python -m {BENCHMARKS_PACKAGE}', description='Runs the benchmarks.')
+    parser.add_argument('benchmarks', nargs='*', metavar='benchmark',
+                        help=f'Benchmarks to run, among {", ".join(available)}. Defaults to all of them.')
+    parser.add_argument('--output', type=Path, help='JSON file to write the results to, instead of stdout.')
+    arguments = parser.parse_args()
+    if unknown := set(arguments.benchmarks) - set(available):
+        parser.error(f'Unknown benchmarks: {", ".join(sorted(unknown))}.')
+
+    report = json.dumps(run_benchmarks(arguments.benchmarks or available), indent=2)
+    if arguments.output is None:
+        sys.stdout.write(report + '\n')
+    else:
+        arguments.output.write_text(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Measures the crawls of each endpoint against a LocalOpenSeaServer, at several page sizes, numbers of pages
+and concurrency limits: pages and items per second, p50 and p99 request latency, rate limiter utilization,
+parse time per page and peak RSS.
+Each crawl runs in a fresh process, so that its peak RSS is its own, while the server runs in this process.
+"""
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from itertools import product
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Mapping, Optional
+
+from open_sea_v1.endpoints.assets import AssetsEndpoint
+from open_sea_v1.endpoints.client import BaseClient, ClientParams
+from open_sea_v1.endpoints.collections import CollectionsEndpoint
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.orders import OrdersEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.rate_limiter import RateLimiter
+from open_sea_v1.helpers.testing_payloads import SAMPLE_CONTRACT
+from open_sea_v1.helpers.testing_server import LocalOpenSeaServer, patch_endpoint_urls
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENDPOINTS = ('AssetsEndpoint', 'EventsEndpoint', 'CollectionsEndpoint', 'OrdersEndpoint')
+PAGE_SIZES = (20, 50)
+MAX_PAGES = (5, 20)
+CONCURRENCY_LIMITS = (1, 5)
+RATE_LIMIT = 200  # requests per second, high enough for the latency of the server to be the bottleneck
+SERVER_LATENCY = 0.01  # seconds per response
+
+
+@dataclass(frozen=True)
+class CrawlSettings:
+    page_size: int
+    max_pages: int
+    concurrency_limit: int
+    rate_limit: int = RATE_LIMIT
+
+
+class TimedRateLimiter:
+    """Rate limiter recording how long each request waited for its turn, then how long it took to be answered and decoded."""
+
+    def __init__(self, rate_limiter: RateLimiter):
+        self.rate_limiter = rate_limiter
+        self.wait_seconds: list[float] = list()
+        self.request_seconds: list[float] = list()
+
+    @asynccontextmanager
+    async def throttle(self, cost: float = 1):
+        queued_at = perf_counter()
+        async with self.rate_limiter.throttle(cost):
+            sent_at = perf_counter()
+            self.wait_seconds.append(sent_at - queued_at)
+            try:
+                yield
+            finally:
+                self.request_seconds.append(perf_counter() - sent_at)
+
+    def on_response(self, status: int, headers: Mapping[str, str]) -> None:
+        self.rate_limiter.on_response(status, headers)
+
+
+def mk_endpoint(endpoint_name: str, settings: CrawlSettings, session: OpenSeaSession) -> BaseClient:
+    client_params = ClientParams(page_size=settings.page_size, limit=settings.page_size, max_pages=settings.max_pages,
+                                 concurrent_pagination=settings.concurrency_limit > 1)
+    if endpoint_name == 'AssetsEndpoint':
+        return AssetsEndpoint(client_params=client_params, session=session, asset_contract_address=SAMPLE_CONTRACT)
+    endpoint = dict(EventsEndpoint=EventsEndpoint, CollectionsEndpoint=CollectionsEndpoint,
+                    OrdersEndpoint=OrdersEndpoint)[endpoint_name]
+    return endpoint(client_params=client_params, session=session)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # bytes on macOS, kilobytes elsewhere
+    return round(max_rss / 1_024 ** (2 if sys.platform == 'darwin' else 1), 1)
+
+
+async def crawl(endpoint_name: str, settings: CrawlSettings) -> dict:
+    async with OpenSeaSession(rate_limit=settings.rate_limit, concurrency_limit=settings.concurrency_limit,
+                              adaptive_rate_limit=False) as session:
+        endpoint = mk_endpoint(endpoint_name, settings, session)
+        rate_limiter = TimedRateLimiter(session.rate_limiter)
+        parse_seconds, items_count = list(), 0
+        started_at = perf_counter()
+        json_pages = endpoint._aiter_pages_jsons(session.http_session, rate_limiter=rate_limiter)  # type: ignore
+        async for json_resp in json_pages:
+            parse_started_at = perf_counter()
+            items_count += len(endpoint._parse_json(json_resp))
+            parse_seconds.append(perf_counter() - parse_started_at)
+        elapsed = perf_counter() - started_at
+
+    requests_count = len(rate_limiter.request_seconds)
+    return dict(
+        endpoint=endpoint_name,
+        **asdict(settings),
+        pages=len(parse_seconds),
+        items=items_count,
+        requests=requests_count,
+        seconds=round(elapsed, 3),
+        pages_per_second=round(len(parse_seconds) / elapsed, 1),
+        items_per_second=round(items_count / elapsed, 1),
+        latency_p50_ms=round(percentile(rate_limiter.request_seconds, 0.5) * 1_000, 2),
+        latency_p99_ms=round(percentile(rate_limiter.request_seconds, 0.99) * 1_000, 2),
+        throttle_wait_p50_ms=round(percentile(rate_limiter.wait_seconds, 0.5) * 1_000, 2),
+        limiter_utilization=round(requests_count / (elapsed * settings.rate_limit), 3),
+        parse_ms_per_page=round(sum(parse_seconds) / len(parse_seconds) * 1_000, 3),
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def measure_crawl(endpoint_name: str, settings: CrawlSettings, urls: dict[EndpointURLS, str]) -> dict:
+    with patch_endpoint_urls(urls):
+        return asyncio.run(crawl(endpoint_name, settings))
+
+
+def run(endpoints: tuple[str, ...] = ENDPOINTS, page_sizes: tuple[int, ...] = PAGE_SIZES,
+        max_pages: tuple[int, ...] = MAX_PAGES, concurrency_limits: tuple[int, ...] = CONCURRENCY_LIMITS,
+        server_latency: float = SERVER_LATENCY, isolated: bool = True) -> list[dict]:
+    """With isolated=False, the crawls run in this process, faster, but peak_rss_mb is then the peak of the whole run."""
+    server = LocalOpenSeaServer(total_items=max(page_sizes) * max(max_pages), latency=server_latency)
+    results = list()
+    try:
+        for endpoint_name, page_size, pages, concurrency_limit in product(endpoints, page_sizes, max_pages,
+                                                                         concurrency_limits):
+            settings = CrawlSettings(page_size=page_size, max_pages=pages, concurrency_limit=concurrency_limit)
+            if not isolated:
+                results.append(measure_crawl(endpoint_name, settings, server.urls))
+                continue
+            with get_context('spawn').Pool(processes=1) as pool:
+                results.append(pool.apply(measure_crawl, (endpoint_name, settings, server.urls)))
+    finally:
+        server.stop()
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print(result)
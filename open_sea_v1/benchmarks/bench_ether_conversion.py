@@ -0,0 +1,36 @@
+"""
+Compares converting wei amounts to ether one EtherConverter at a time, as the event responses used to,
+with a single EtherArrayConverter call, in float and exact mode.
+"""
+from time import perf_counter
+from typing import Callable
+
+from open_sea_v1.helpers.ether_converter import EtherArrayConverter, EtherConverter, EtherUnit, wei_to_ether
+from open_sea_v1.helpers.testing_payloads import mk_wei_price
+
+VALUES_COUNT = 1_000_000
+
+
+def bench(name: str, convert: Callable[[list[str]], object], wei_values: list[str]) -> dict:
+    started_at = perf_counter()
+    convert(wei_values)
+    elapsed = perf_counter() - started_at
+    return dict(path=name, values=len(wei_values), seconds=round(elapsed, 3),
+                values_per_second=round(len(wei_values) / elapsed))
+
+
+def run(values_count: int = VALUES_COUNT) -> list[dict]:
+    wei_values = [mk_wei_price(seed) for seed in range(values_count)]
+    return [
+        bench('EtherConverter per value', lambda values: [
+            EtherConverter(quantity=v, unit=EtherUnit.WEI).ether for v in values], wei_values),
+        bench('wei_to_ether per value', lambda values: [wei_to_ether(v) for v in values], wei_values),
+        bench('EtherArrayConverter', lambda values: EtherArrayConverter(values).ether, wei_values),
+        bench('EtherArrayConverter exact', lambda values: EtherArrayConverter(values, exact=True).ether, wei_values),
+        bench('EtherArrayConverter usd', lambda values: EtherArrayConverter(values).to_usd(3182.84), wei_values),
+    ]
+
+
+if __name__ == '__main__':
+    for result in run():
+        print(result)
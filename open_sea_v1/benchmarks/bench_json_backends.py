@@ -0,0 +1,39 @@
+"""
+Compares the decoding speed of the installed JSON backends on OpenSea shaped pages.
+"""
+from timeit import Timer
+
+from open_sea_v1.helpers.json_backend import JsonBackend, get_installed_json_backends
+from open_sea_v1.helpers.testing_payloads import mk_assets_page, mk_events_page
+
+PAGE_SIZE = 50
+
+
+def bench_decoding(backend: JsonBackend, encoded_page: bytes, repeat: int = 5, number: int = 20) -> float:
+    """Returns the best time to decode the page, in milliseconds."""
+    timer = Timer(lambda: backend.loads(encoded_page))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1_000
+
+
+def run() -> list[dict]:
+    pages = dict(
+        events=mk_events_page(first_event_id=0, size=PAGE_SIZE),
+        assets=mk_assets_page(token_ids=list(range(PAGE_SIZE))),
+    )
+    stdlib = next(b for b in get_installed_json_backends() if b.name == 'json')
+    results = list()
+    for page_name, page in pages.items():
+        encoded_page = stdlib.dumps(page).encode()
+        for backend in get_installed_json_backends():
+            results.append(dict(
+                page=page_name,
+                page_kb=round(len(encoded_page) / 1_024, 1),
+                backend=backend.name,
+                decode_ms=round(bench_decoding(backend, encoded_page), 3),
+            ))
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print(result)
@@ -0,0 +1,52 @@
+"""
+Compares encoding the querystring of every page with requests.PreparedRequest, as the clients used to,
+with mk_querystring, which only encodes the offset of each page once the other params are encoded.
+"""
+from datetime import datetime
+from importlib.util import find_spec
+from time import perf_counter
+from typing import Callable
+
+from open_sea_v1.endpoints.events import EventType
+from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.querystring import encode_params, mk_querystring
+
+PAGES_COUNT = 100_000
+PARAMS = dict(asset_contract_address='0x76be3b62873462d2142405439777e971754e8e77', token_id=None,
+              account_address=None, event_type=EventType.SUCCESSFUL, only_opensea=False, auction_type=None,
+              occurred_after=datetime(2021, 8, 1), occurred_before=datetime(2021, 9, 1), offset=0, limit=50)
+
+
+def prepared_request_querystring(url: str, params: dict) -> str:
+    from requests.models import PreparedRequest
+    prepared_request = PreparedRequest()
+    prepared_request.prepare_url(url, params)
+    return prepared_request.url
+
+
+def uncached_querystring(url: str, params: dict) -> str:
+    return f'{url}?{encode_params(params)}'
+
+
+def bench(name: str, mk: Callable[[str, dict], str]) -> dict:
+    url = EndpointURLS.EVENTS.value
+    started_at = perf_counter()
+    for page in range(PAGES_COUNT):
+        mk(url, {**PARAMS, 'offset': page * 50})
+    elapsed = perf_counter() - started_at
+    return dict(path=name, pages=PAGES_COUNT, seconds=round(elapsed, 3),
+                us_per_page=round(elapsed / PAGES_COUNT * 1e6, 2))
+
+
+def run() -> list[dict]:
+    results = list()
+    if find_spec('requests') is not None:
+        results.append(bench('PreparedRequest', prepared_request_querystring))
+    results.append(bench('encode_params per page', uncached_querystring))
+    results.append(bench('mk_querystring', mk_querystring))
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print(result)
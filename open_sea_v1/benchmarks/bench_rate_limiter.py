@@ -0,0 +1,58 @@
+"""
+Measures the throughput achieved by the RateLimiter against its configured rate, and the jitter of the request spacing,
+with many tasks throttled concurrently by one limiter, and with many limiters sharing one event loop.
+"""
+import asyncio
+from statistics import mean, pstdev
+from time import monotonic
+
+from open_sea_v1.helpers.rate_limiter import RateLimiter
+
+DURATION = 2.0  # seconds of requests per measure
+
+
+async def throttled_send_times(limiter: RateLimiter, requests_count: int, tasks_count: int) -> list[float]:
+    send_times = list()
+
+    async def send() -> None:
+        while len(send_times) < requests_count:
+            async with limiter.throttle():
+                send_times.append(monotonic())
+
+    await asyncio.gather(*(send() for _ in range(tasks_count)))
+    return sorted(send_times)
+
+
+def summarize(send_times: list[float], rate: float) -> dict:
+    intervals = [later - earlier for earlier, later in zip(send_times, send_times[1:])]
+    deviations_ms = sorted(abs(interval - 1 / rate) * 1_000 for interval in intervals)
+    return dict(
+        achieved_rate=round((len(send_times) - 1) / (send_times[-1] - send_times[0]), 2),
+        jitter_mean_ms=round(mean(deviations_ms), 3),
+        jitter_stdev_ms=round(pstdev(intervals) * 1_000, 3),
+        jitter_p99_ms=round(deviations_ms[int(len(deviations_ms) * 0.99)], 3),
+    )
+
+
+async def bench_one_limiter(rate: int, tasks_count: int = 10) -> dict:
+    limiter = RateLimiter(rate_limit=rate, concurrency_limit=tasks_count, adaptive=False)
+    send_times = await throttled_send_times(limiter, int(rate * DURATION), tasks_count)
+    return dict(limiters=1, configured_rate=rate, tasks=tasks_count, **summarize(send_times, rate))
+
+
+async def bench_many_limiters(limiters_count: int, rate: int) -> dict:
+    """Only one limiter sends requests, while the others stay idle, as with many endpoints created in one process."""
+    limiters = [RateLimiter(rate_limit=rate, concurrency_limit=5, adaptive=False) for _ in range(limiters_count)]
+    send_times = await throttled_send_times(limiters[0], int(rate * DURATION), tasks_count=5)
+    return dict(limiters=limiters_count, configured_rate=rate, tasks=5, **summarize(send_times, rate))
+
+
+def run() -> list[dict]:
+    results = [asyncio.run(bench_one_limiter(rate)) for rate in (5, 18, 100, 500)]
+    results.append(asyncio.run(bench_many_limiters(limiters_count=1_000, rate=18)))
+    return results
+
+
+if __name__ == '__main__':
+    for result in run():
+        print(result)
@@ -0,0 +1,54 @@
+"""
+Compares the memory and CPU cost of the response objects, which read their fields from the JSON lazily,
+with objects which copy every field into their instance dict on construction, as the response objects used to.
+"""
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable
+
+from open_sea_v1.helpers.testing_payloads import mk_event_json
+from open_sea_v1.responses.abc import JsonField
+from open_sea_v1.responses.event import EventResponse
+
+EVENTS_COUNT = 100_000
+DISTINCT_PAYLOADS = 1_000  # payloads are reused, as only the response objects themselves are measured
+
+_EVENT_FIELDS = {name: field for name, field in vars(EventResponse).items() if isinstance(field, JsonField)}
+
+
+class EagerEventResponse:
+    """Copies every field of EventResponse on construction."""
+
+    def __init__(self, _json: dict):
+        self._json = _json
+        for name, field in _EVENT_FIELDS.items():
+            setattr(self, name, field.__get__(self, EagerEventResponse))
+
+
+def bench(response_type: Callable[[dict], object], payloads: list[dict]) -> dict:
+    start()
+    started_at = perf_counter()
+    events = [response_type(payloads[i % len(payloads)]) for i in range(EVENTS_COUNT)]
+    built_at = perf_counter()
+    _, peak_bytes = get_traced_memory()
+    stop()
+    for event in events:
+        event.id, event.total_price  # type: ignore
+    read_at = perf_counter()
+    return dict(
+        response_type=getattr(response_type, '__name__'),
+        events=EVENTS_COUNT,
+        build_s=round(built_at - started_at, 3),
+        read_id_and_total_price_s=round(read_at - built_at, 3),
+        peak_mb=round(peak_bytes / 1_024 ** 2, 1),
+    )
+
+
+def run() -> list[dict]:
+    payloads = [mk_event_json(i) for i in range(DISTINCT_PAYLOADS)]
+    return [bench(EagerEventResponse, payloads), bench(EventResponse, payloads)]
+
+
+if __name__ == '__main__':
+    for result in run():
+        print(result)
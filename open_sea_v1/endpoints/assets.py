@@ -5,6 +5,7 @@ from typing import Optional
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
 from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.columnar import Column, ColumnKind
 from open_sea_v1.responses.asset import AssetResponse
 
 
@@ -37,7 +38,8 @@ class AssetsEndpoint(BaseClient, BaseEndpoint):
         The address of the owner of the assets
 
     token_ids:
-        List of token IDs to search for
+        List of token IDs to search for.
+        Longer lists than the API accepts are split into batches, crawled concurrently. Assets follow the order of the list.
 
     asset_contract_address:
         The NFT contract address for the assets
@@ -66,6 +68,20 @@ class AssetsEndpoint(BaseClient, BaseEndpoint):
     order_direction: str = None
     _response_type = AssetResponse
     _json_resp_key = 'assets'
+    _batched_param = 'token_ids'
+    _batched_item_path = 'token_id'
+    _columns = dict(
+        id=Column('id', ColumnKind.INT),
+        token_id=Column('token_id'),
+        name=Column('name'),
+        contract_address=Column('asset_contract.address', ColumnKind.ADDRESS),
+        collection=Column('collection.slug'),
+        owner=Column('owner.address', ColumnKind.ADDRESS),
+        num_sales=Column('num_sales', ColumnKind.INT),
+        last_sale_total_price=Column('last_sale.total_price', ColumnKind.WEI),
+        last_sale_timestamp=Column('last_sale.event_timestamp', ColumnKind.DATETIME),
+        permalink=Column('permalink'),
+    )
 
     def __post_init__(self):
         self._validate_request_params()
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Hashable, Mapping, Optional
+
+from open_sea_v1.endpoints.client import BaseClient
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.rate_limiter import RateLimiter
+from open_sea_v1.responses.abc import BaseResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryHandle:
+    """
+    Result of one query run by a BulkExecutor: its parsed items once it is done, or the exception which failed it.
+    The failure of a query does not interrupt the other queries.
+    """
+    endpoint: BaseClient
+    items: list[BaseResponse] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    done: bool = False
+
+    def result(self) -> list[BaseResponse]:
+        """The parsed items of the query. Raises the exception which failed it, if any."""
+        if not self.done:
+            raise RuntimeError('The query has not been run yet.')
+        if self.error is not None:
+            raise self.error
+        return self.items
+
+
+class FairScheduler:
+    """
+    Grants a number of request slots to the queries in turn, so that no query monopolizes the slots
+    with the window of pages it requests ahead: each free slot goes to the waiting query with the fewest
+    requests in flight, and queries with as many requests in flight are served round-robin.
+    """
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self.busy_slots = 0
+        self.in_flight: Counter = Counter()
+        self.waiting: dict[Hashable, deque[asyncio.Future]] = dict()
+
+    @asynccontextmanager
+    async def turn(self, query: Hashable):
+        if self.busy_slots < self.slots and not self.waiting:
+            self._grant(query)
+        else:
+            granted = asyncio.get_running_loop().create_future()
+            self.waiting.setdefault(query, deque()).append(granted)
+            try:
+                await granted
+            except asyncio.CancelledError:
+                if granted.done() and not granted.cancelled():  # granted meanwhile
+                    self._release(query)
+                raise
+        try:
+            yield
+        finally:
+            self._release(query)
+
+    def _grant(self, query: Hashable) -> None:
+        self.busy_slots += 1
+        self.in_flight[query] += 1
+
+    def _release(self, query: Hashable) -> None:
+        self.busy_slots -= 1
+        self.in_flight[query] -= 1
+        self._grant_waiting_queries()
+
+    def _grant_waiting_queries(self) -> None:
+        while self.busy_slots < self.slots and self.waiting:
+            query = min(self.waiting, key=lambda q: self.in_flight[q])  # the first of the ties waited the longest
+            waiters = self.waiting.pop(query)
+            granted = waiters.popleft()
+            if waiters:
+                self.waiting[query] = waiters  # back at the end of the round
+            if granted.cancelled():
+                continue
+            self._grant(query)
+            granted.set_result(None)
+
+
+class FairRateLimiter:
+    """Rate limiter of one query of a BulkExecutor: waits for the turn of the query, then for the shared rate limiter."""
+
+    def __init__(self, rate_limiter: RateLimiter, scheduler: FairScheduler, query: Hashable):
+        self.rate_limiter = rate_limiter
+        self.scheduler = scheduler
+        self.query = query
+
+    @asynccontextmanager
+    async def throttle(self, cost: float = 1):
+        async with self.scheduler.turn(self.query):
+            async with self.rate_limiter.throttle(cost):
+                yield
+
+    def on_response(self, status: int, headers: Mapping[str, str]) -> None:
+        self.rate_limiter.on_response(status, headers)
+
+
+@dataclass
+class BulkExecutor:
+    """
+    Runs the paginations of many endpoint queries concurrently, on a single event loop, HTTP session and rate limiter,
+    instead of opening an event loop and a session per query, and running them one after the other.
+
+        executor = BulkExecutor(session)
+        handles = {address: executor.add(EventsEndpoint(client_params=ClientParams(), asset_contract_address=address))
+                   for address in addresses}
+        executor.run()
+        events = {address: handle.result() for address, handle in handles.items()}
+
+    Parameters
+    ----------
+    session:
+        OpenSeaSession on which the queries run, and whose rate limit budget they share.
+        If None, a session is opened for the duration of each run.
+
+    max_concurrent_queries:
+        Number of queries running at once. Defaults to the concurrency limit of the session.
+        The requests of the running queries are scheduled fairly (see FairScheduler),
+        and a new query starts as soon as one is over.
+
+    Each query paginates as its client params say. As the queries already run concurrently,
+    ClientParams(concurrent_pagination=False) saves the pages requested past the last page of each query.
+    """
+    session: Optional[OpenSeaSession] = None
+    max_concurrent_queries: Optional[int] = None
+
+    def __post_init__(self):
+        self.handles: list[QueryHandle] = list()
+
+    def add(self, endpoint: BaseClient) -> QueryHandle:
+        """Queues the query of the endpoint instance, whose own session, if any, is not used."""
+        handle = QueryHandle(endpoint)
+        self.handles.append(handle)
+        return handle
+
+    def run(self) -> list[QueryHandle]:
+        """Runs the queries which have not been run yet, and returns every handle."""
+        if self.session is None:
+            with OpenSeaSession() as session:
+                return session.run(self._arun_on(session))
+        return self.session.run(self._arun_on(self.session))
+
+    async def arun(self) -> list[QueryHandle]:
+        """Same as run(), from the event loop of an asynchronous session."""
+        if self.session is None:
+            async with OpenSeaSession() as session:
+                return await self._arun_on(session)
+        return await self._arun_on(self.session)
+
+    async def _arun_on(self, session: OpenSeaSession) -> list[QueryHandle]:
+        scheduler = FairScheduler(slots=session.concurrency_limit)
+        queries_slots = asyncio.Semaphore(self.max_concurrent_queries or session.concurrency_limit)
+
+        async def run_query(query_number: int, handle: QueryHandle) -> None:
+            async with queries_slots:
+                rate_limiter = FairRateLimiter(session.rate_limiter, scheduler, query=query_number)
+                await self._run_query(handle, session, rate_limiter)
+
+        pending = [(n, handle) for n, handle in enumerate(self.handles) if not handle.done]
+        await asyncio.gather(*(run_query(n, handle) for n, handle in pending))
+        logger.info(f'Ran {len(pending)} queries, {sum(h.error is not None for _, h in pending)} of which failed.')
+        return self.handles
+
+    @staticmethod
+    async def _run_query(handle: QueryHandle, session: OpenSeaSession, rate_limiter: FairRateLimiter) -> None:
+        endpoint = handle.endpoint
+        endpoint._latest_json_response = None
+        json_pages = endpoint._aiter_pages_jsons(session.http_session, rate_limiter=rate_limiter)  # type: ignore
+        try:
+            async for json_resp in json_pages:
+                handle.items.extend(endpoint._parse_json(json_resp))
+        except Exception as error:
+            logger.warning(f'Query of {type(endpoint).__name__} failed: {error!r}')
+            handle.error = error
+        finally:
+            await json_pages.aclose()
+            handle.done = True
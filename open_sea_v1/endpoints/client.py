@@ -2,37 +2,66 @@ import asyncio
 import logging
 import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field, fields
+from http import HTTPStatus
 from itertools import chain
 from os import environ
-from typing import Optional, Type, Union
-
-import ujson
-from aiohttp import ClientSession
-from requests.models import PreparedRequest
-
+from pathlib import Path
+from threading import Thread
+from time import perf_counter
+from typing import Any, AsyncGenerator, Callable, Generator, Mapping, Optional, Type, Union
+
+from aiohttp import ClientSession, ClientTimeout, ContentTypeError
+
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.checkpoint import CrawlCheckpoint
+from open_sea_v1.helpers.columnar import Column, ColumnarExtractor
+from open_sea_v1.helpers.instrumentation import ClientHooks, RequestTimings, mk_trace_config
+from open_sea_v1.helpers.json_backend import get_json_backend
+from open_sea_v1.helpers.querystring import mk_querystring
 from open_sea_v1.helpers.rate_limiter import RateLimiter
+from open_sea_v1.helpers.record_replay import Cassette
+from open_sea_v1.helpers.response_cache import ResponseCache
+from open_sea_v1.helpers.retry import RETRYABLE_EXCEPTIONS, RetryableStatusError, RetryPolicy
 from open_sea_v1.responses.abc import BaseResponse
 
 logger = logging.getLogger(__name__)
 
+_END_OF_PAGES = object()
+
 @dataclass
 class ClientParams:
     """
     Common OpenSea Endpoint parameters to pass in.
     Will automatically use OPENSEA_API_KEY environment variable as the api_key value, if it exists on the system.
+    Set concurrent_pagination to False to request pages one after the other instead of a window of pages at a time.
+    The retry_policy decides how requests failing transiently (server errors, timeouts...) are sent again.
+    If a checkpoint_dir is given, the pages fetched are persisted in it as the crawl goes (see CrawlCheckpoint).
+    With resume=True, the crawl then continues from the last checkpoint of the same query, without refetching its pages.
+    A response_cache serves the pages of repeated queries without requesting them again (see ResponseCache).
+    A cassette records the responses received, or replays recorded responses instead of requesting them (see Cassette).
+    The hooks are called with the timings of every request and the parsing of every page (see ClientHooks, MetricsHooks).
     """
     offset: int = 0
     page_size: int = 50
     limit: int = 50
     max_pages: Optional[int] = None
     api_key: Optional[str] = None
+    concurrent_pagination: bool = True
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    checkpoint_dir: Optional[Union[str, Path]] = None
+    resume: bool = False
+    response_cache: Optional[ResponseCache] = None
+    cassette: Optional[Cassette] = None
+    hooks: Optional[ClientHooks] = None
 
     def __post_init__(self):
         # if self.max_pages:
         #     self.max_pages += 1  # prevent paginator from ending one page early
         self._attempt_setting_the_api_key()
         self._validate_attrs()
+        self._initial_offset, self._initial_max_pages = self.offset, self.max_pages  # offset and max_pages advance as pages are fetched
 
     def _validate_attrs(self) -> None:
         if not 0 < self.limit <= 300:
@@ -50,6 +79,9 @@ class ClientParams:
         if self.max_pages is not None and self.max_pages < 0:
             raise ValueError(f'{self.max_pages=} must be greater than or equal to 0.')
 
+        if self.resume and self.checkpoint_dir is None:
+            raise ValueError(f'{self.resume=} requires a checkpoint_dir.')
+
     def _decrement_max_pages_attr(self) -> None:
         """
         For OpenSea, the max pages attribute starts at zero.
@@ -75,21 +107,40 @@ class BaseClient(ABC):
         ClientParams instance.
 
     _rate_limit: int
-        Rate limit for the API is 20 when you have an API key.
-        However, you run the risk of losing a a few seconds if you get throttled by the server.
+        Initial rate limit, in requests per second. Rate limit for the API is 20 when you have an API key.
         After some testing, it seems 18 is the sweet spot.
+        The rate then adapts to the server: it slows down when requests are throttled (HTTP 429),
+        and speeds up while they are not. See RateLimiter.
 
     _concurrency_limit: int
         Concurrency limit: number of simultaneous connections at a time.
         Best results obtained by using the largest multiple of _rate_limit, or second largest multiple.
         Otherwise you risk more throttling on the serverside than necessary.
+
+    _max_throttled_attempts: int
+        Number of times a request throttled by the server is sent, before giving up with a ConnectionError.
+
+    session: Optional[OpenSeaSession]
+        Long-lived session to share connections and the rate limit budget with other endpoints.
+        When it is passed, its rate and concurrency limits apply instead of _rate_limit and _concurrency_limit.
+        Otherwise, a new session is opened and closed for every call.
     """
 
     client_params: ClientParams
     url = None
+    _batched_param = None
+    """
+    Name of a list param which is split into batches of at most _batch_size values, each crawled as a separate query,
+    as the API rejects longer lists. _batched_item_path is the dotted path of the value in the items returned.
+    Batched queries do not support an offset, max_pages, an order_by nor checkpoints (see _validate_batched_query).
+    """
+    _batched_item_path = None
+    _batch_size = 30
 
     _rate_limit: int = 18
     _concurrency_limit: int = 5
+    _max_throttled_attempts: int = 5
+    session: Optional[OpenSeaSession] = None
 
     def __post_init__(self):
         self.processed_pages: int = 0
@@ -105,6 +156,16 @@ class BaseClient(ABC):
         """To access the contents of a page from the contents of an OpenSea HTTP response,
          you need to use a dictionnary key."""
 
+    @property
+    @abstractmethod
+    def _columns(self) -> dict[str, Column]:
+        """Columns exported by to_columns(), to_dataframe() and to_arrow() when none are selected."""
+
+    @property
+    def _pages_window(self) -> int:
+        """Number of pages the concurrent paginator requests ahead."""
+        return self.session.concurrency_limit if self.session else self._concurrency_limit
+
     @property
     def http_headers(self) -> dict:
         headers = dict()
@@ -114,9 +175,83 @@ class BaseClient(ABC):
 
     def get_parsed_pages(self, flat: bool = True) -> list:
         """Wraps a call to _get_parsed_pages() in a try block to catch various network errors and log them."""
-        from aiohttp.client_exceptions import ContentTypeError
-        try:
+        with self._server_errors_as_connection_errors():
             return self._get_parsed_pages(flat)
+
+    def iter_pages(self, prefetch: Optional[int] = None) -> Generator[list[BaseResponse], None, None]:
+        """
+        Synchronous counterpart of aiter_pages(), for non-async callers.
+        The event loop runs on a background thread, and the parsed pages are pulled from aiter_pages() one at a time,
+        so the crawl keeps going in the background, at most `prefetch` pages ahead of the consumer.
+        """
+        return self._iter_processed_pages(self._parse_json, prefetch=prefetch)
+
+    def iter_items(self, prefetch: Optional[int] = None) -> Generator[BaseResponse, None, None]:
+        """Same as iter_pages(), but yields the parsed items one by one."""
+        for page in self.iter_pages(prefetch=prefetch):
+            yield from page
+
+    def to_columns(self, columns: Optional[dict[str, Column]] = None) -> dict[str, Any]:
+        """
+        Crawls the pages, and returns the selected columns as NumPy arrays, keyed by column name.
+        Values are extracted from the raw JSON pages, without building any response object.
+        Defaults to the usual columns of the endpoint.
+        """
+        return self._extract_columns(columns).to_numpy()
+
+    def to_dataframe(self, columns: Optional[dict[str, Column]] = None) -> Any:
+        """Same as to_columns(), as a pandas DataFrame."""
+        return self._extract_columns(columns).to_pandas()
+
+    def to_arrow(self, columns: Optional[dict[str, Column]] = None) -> Any:
+        """Same as to_columns(), as a pyarrow Table."""
+        return self._extract_columns(columns).to_arrow()
+
+    def _extract_columns(self, columns: Optional[dict[str, Column]]) -> ColumnarExtractor:
+        extractor = ColumnarExtractor(columns or self._columns)
+        for json_items in self._iter_processed_pages(self._json_items):
+            extractor.extend(json_items)
+        return extractor
+
+    def _iter_processed_pages(self, process_page: Callable, prefetch: Optional[int] = None) -> Generator:
+        with self._background_event_loop() as loop:
+            pages = self._aiter_processed_pages(process_page, prefetch=prefetch)
+            try:
+                with self._server_errors_as_connection_errors():
+                    while True:
+                        try:
+                            yield asyncio.run_coroutine_threadsafe(pages.__anext__(), loop).result()
+                        except StopAsyncIteration:
+                            return
+            finally:
+                asyncio.run_coroutine_threadsafe(pages.aclose(), loop).result()
+
+    @contextmanager
+    def _background_event_loop(self) -> Generator[asyncio.AbstractEventLoop, None, None]:
+        """Yields the event loop of the shared session, or runs a new one on a background thread for the duration."""
+        if self.session:
+            self.session.assert_usable_from_sync_code()
+            yield self.session.loop
+            return
+
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # prevents closed loops errors on windows
+        loop = asyncio.new_event_loop()
+        loop_thread = Thread(target=loop.run_forever, name=f'{type(self).__name__}-event-loop', daemon=True)
+        loop_thread.start()
+        try:
+            yield loop
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+
+    @staticmethod
+    @contextmanager
+    def _server_errors_as_connection_errors() -> Generator[None, None, None]:
+        """HTML pages received instead of JSON, once they are no longer retried, are raised with the pages to check."""
+        try:
+            yield
         except ContentTypeError as err:
             message = f'The request likely encountered a server side error.\n' \
                       f'Check https://status.opensea.io/ and https://twitter.com/apiopensea for updates.\n' \
@@ -130,73 +265,465 @@ class BaseClient(ABC):
         if sys.platform == 'win32':
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # prevents closed loops errors on windows
         self._latest_json_response = None  # reset: required for pagination function
-        results = asyncio.run(self._aget_parsed_pages())
+        results = self.session.run(self._aget_parsed_pages()) if self.session else asyncio.run(self._aget_parsed_pages())
         if not flat:
             return results
         flattened = list(chain.from_iterable(results))
         return flattened
 
     async def _aget_parsed_pages(self) -> list[list[Type[BaseResponse]]]:
+        """Joins an identical crawl in flight on the session, if any, instead of crawling again."""
+        single_flight = self.session.single_flight if self.session else None
+        if single_flight is None or self.client_params.checkpoint_dir is not None:
+            return await self._acrawl_parsed_pages()
+        return list(await single_flight.do(self._crawl_key, self._acrawl_parsed_pages))
+
+    @property
+    def _crawl_key(self) -> tuple:
+        """Identical crawls have the same querystring for their first page, and paginate the same way."""
+        querystring = self.mk_querystring(self.url, params=self.get_params)
+        return (type(self).__name__, querystring, self.client_params.page_size, self.client_params.max_pages,
+                *self._coalescing_key)
+
+    @property
+    def _coalescing_key(self) -> tuple:
+        """
+        The client params which decide the outcome of a request or a crawl, beside its querystring:
+        calls only join an identical call of a client with the same response cache, cassette and hooks,
+        and a retry policy with the same settings. Most clients have none of them, and share the default settings.
+        """
+        retry_policy = self.client_params.retry_policy
+        retry_settings = tuple(getattr(retry_policy, f.name) for f in fields(retry_policy) if f.compare)
+        return (id(self.client_params.response_cache), id(self.client_params.cassette), id(self.client_params.hooks),
+                retry_settings)
+
+    async def _acrawl_parsed_pages(self) -> list[list[Type[BaseResponse]]]:
         all_parsed_jsons = list()
 
-        async with RateLimiter(rate_limit=self._rate_limit, concurrency_limit=self._concurrency_limit) as rate_limiter:
-            async with ClientSession(headers=self.http_headers, json_serialize=ujson.dumps) as session:
-                json_batch = await self._async_get_pages_jsons(session, rate_limiter=rate_limiter)
-                parsed_json_batch = [self._parse_json(j) for j in json_batch]
-                all_parsed_jsons.extend(parsed_json_batch)
+        async with self._open_session() as (session, rate_limiter):
+            json_batch = await self._async_get_pages_jsons(session, rate_limiter=rate_limiter)
+            parsed_json_batch = [self._parse_json(j) for j in json_batch]
+            all_parsed_jsons.extend(parsed_json_batch)
 
         return all_parsed_jsons
 
+    def aiter_pages(self, prefetch: Optional[int] = None) -> AsyncGenerator[list[BaseResponse], None]:
+        """
+        Yields each parsed page as soon as it is fetched, instead of waiting for the whole crawl to be over.
+        The fetcher keeps at most `prefetch` parsed pages waiting on the consumer (defaults to the concurrency limit),
+        on top of the window of pages being requested, so memory usage does not grow with the number of pages.
+        """
+        return self._aiter_processed_pages(self._parse_json, prefetch=prefetch)
+
+    async def aiter_items(self, prefetch: Optional[int] = None) -> AsyncGenerator[BaseResponse, None]:
+        """Same as aiter_pages(), but yields the parsed items one by one."""
+        pages = self.aiter_pages(prefetch=prefetch)
+        try:
+            async for page in pages:
+                for item in page:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def _aiter_processed_pages(self, process_page: Callable, prefetch: Optional[int] = None) -> AsyncGenerator:
+        prefetch = prefetch or self._pages_window
+        async with self._open_session() as (session, rate_limiter):
+            pages_queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+            producer = asyncio.create_task(self._produce_pages(session, rate_limiter, pages_queue, process_page))
+            try:
+                while (page := await pages_queue.get()) is not _END_OF_PAGES:
+                    if isinstance(page, BaseException):
+                        raise page
+                    yield page
+            finally:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+    async def _produce_pages(self, session, rate_limiter: RateLimiter, pages_queue: asyncio.Queue,
+                             process_page: Callable) -> None:
+        """Feeds the processed pages to the consumer, followed by either the raised exception or the end of pages marker."""
+        json_pages = self._aiter_pages_jsons(session, rate_limiter=rate_limiter)
+        try:
+            async for json_resp in json_pages:
+                if processed_page := process_page(json_resp):
+                    await pages_queue.put(processed_page)
+        except Exception as err:
+            await pages_queue.put(err)
+            return
+        finally:
+            await json_pages.aclose()
+        await pages_queue.put(_END_OF_PAGES)
+
+    @asynccontextmanager
+    async def _open_session(self) -> AsyncGenerator[tuple[ClientSession, RateLimiter], None]:
+        """Opens the HTTP session and the rate limiter which are shared by every page request of a crawl."""
+        if self.session:
+            self.session.assert_usable_from_running_loop()
+            yield self.session.http_session, self.session.rate_limiter
+            return
+
+        async with RateLimiter(rate_limit=self._rate_limit, concurrency_limit=self._concurrency_limit) as rate_limiter:
+            async with ClientSession(headers=self.http_headers, json_serialize=get_json_backend().dumps,
+                                     trace_configs=[mk_trace_config()]) as session:
+                yield session, rate_limiter
+
     async def _async_get_pages_jsons(self, session, *, rate_limiter: RateLimiter) -> Optional[list[dict]]:
-        responses = list()
-        processed_pages = 0
-        while self._remaining_pages():
+        return [json_resp async for json_resp in self._aiter_pages_jsons(session, rate_limiter=rate_limiter)]
 
-            params = {**self.get_params, **{'offset': self.client_params.offset}}  # type: ignore
-            querystring = self.mk_querystring(self.url, params=params)
+    def _aiter_pages_jsons(self, session, *, rate_limiter: RateLimiter) -> AsyncGenerator[Union[dict, list], None]:
+        """
+        Splits the batched param into batches if it holds more values than a request accepts,
+        otherwise goes through the checkpoint of the crawl, if the client params have a checkpoint directory.
+        """
+        if self._param_batches is not None:
+            self._validate_batched_query()
+            return self._aiter_batched_pages_jsons(session, rate_limiter=rate_limiter)
+        if self.client_params.checkpoint_dir is not None:
+            return self._aiter_checkpointed_pages_jsons(session, rate_limiter=rate_limiter)
+        return self._aiter_fetched_pages_jsons(session, rate_limiter=rate_limiter)
+
+    async def _aiter_checkpointed_pages_jsons(self, session, *, rate_limiter: RateLimiter) -> AsyncGenerator:
+        """
+        If the crawl is resumed, first yields the pages of the last checkpoint of the query,
+        then fetches the following pages from the cursor of the checkpoint.
+        Every page fetched is added to the checkpoint before it is yielded.
+        """
+        checkpoint = CrawlCheckpoint.for_query(self.client_params.checkpoint_dir, self._checkpoint_query)
+        if not self.client_params.resume:
+            checkpoint.clear()
+
+        for json_resp in checkpoint.iter_pages():
+            self._latest_json_response = json_resp
+            yield json_resp
+        if checkpoint.is_complete:
+            return
+        if checkpoint.exists:
+            self.client_params.offset = checkpoint.state['next_offset']
+            self.client_params.max_pages = checkpoint.state['max_pages']
+            if self.client_params.max_pages is not None and self.client_params.max_pages <= 0:
+                await asyncio.to_thread(checkpoint.mark_complete)  # interrupted right after its last page was saved
+                return
+            logger.info(f'Resuming the crawl at offset {self.client_params.offset}, after {checkpoint.pages_count} pages.')
+
+        async for json_resp in self._aiter_fetched_pages_jsons(session, rate_limiter=rate_limiter):
+            next_offset, max_pages = self.client_params.offset, self.client_params.max_pages
+            await asyncio.to_thread(checkpoint.save_page, json_resp, next_offset=next_offset, max_pages=max_pages)
+            yield json_resp
+        await asyncio.to_thread(checkpoint.mark_complete)
+
+    @property
+    def _checkpoint_query(self) -> dict:
+        """Identifies the checkpoints of the crawl, which are only resumed by the same query."""
+        params = {**self.get_params, 'offset': self.client_params._initial_offset}  # type: ignore
+        return dict(
+            endpoint=type(self).__name__,
+            url=self.url,
+            params=params,
+            page_size=self.client_params.page_size,
+            max_pages=self.client_params._initial_max_pages,
+        )
+
+    @property
+    def _param_batches(self) -> Optional[list[list]]:
+        """Batches of the values of the batched param, or None if they fit in a single request."""
+        values = getattr(self, self._batched_param) if self._batched_param else None
+        if not values or len(values) <= self._batch_size:
+            return None
+        return [values[i:i + self._batch_size] for i in range(0, len(values), self._batch_size)]
+
+    def _validate_batched_query(self) -> None:
+        """
+        Each batch is crawled as a separate query, from offset 0 and through all of its pages,
+        and the batches are merged in the order of the requested values. The params which apply to the whole result
+        rather than to each batch, an offset, max_pages or an order_by, are rejected, as are checkpoints.
+        """
+        params = dict(offset=self.client_params.offset or None, max_pages=self.client_params.max_pages,
+                      order_by=getattr(self, 'order_by', None), checkpoint_dir=self.client_params.checkpoint_dir)
+        if unsupported := [name for name, value in params.items() if value is not None]:
+            raise ValueError(f'{", ".join(unsupported)} cannot be used when {self._batched_param} is split '
+                             f'into batches of {self._batch_size} values.')
 
-            async with rate_limiter.throttle():
-                resp = await session.get(querystring)
-                json_resp = await resp.json()
+    async def _aiter_batched_pages_jsons(self, session, *, rate_limiter: RateLimiter) -> AsyncGenerator:
+        """
+        Crawls the batches concurrently, as many at a time as the pages window, under the rate limiter of the crawl.
+        Yields a single page per batch, in batch order, holding the items of every page of the batch
+        in the order of the requested values, so that the items of the whole crawl follow the requested order.
+        """
+        batches = self._param_batches
+        in_flight: dict[int, asyncio.Task] = dict()
+        next_batch_to_request = 0
+        try:
+            for batch_number in range(len(batches)):
+                while next_batch_to_request < min(len(batches), batch_number + self._pages_window):
+                    coro = self._crawl_batch(session, rate_limiter=rate_limiter, batch=batches[next_batch_to_request])
+                    in_flight[next_batch_to_request] = asyncio.create_task(coro)
+                    next_batch_to_request += 1
+                json_resp = await in_flight.pop(batch_number)
                 self._latest_json_response = json_resp
-                self.client_params._decrement_max_pages_attr()
-                processed_pages += 1
-                
-            self.client_params.offset += self.client_params.page_size
+                logger.info(f'Fetched batch #{batch_number + 1} of {len(batches)} ({self._batched_param})')
+                yield json_resp
+        finally:
+            for task in in_flight.values():
+                task.cancel()
+            await asyncio.gather(*in_flight.values(), return_exceptions=True)
+
+    async def _crawl_batch(self, session, *, rate_limiter: RateLimiter, batch: list) -> dict:
+        """Fetches every page of the batch."""
+        extra_params = {self._batched_param: batch}
+        json_items: list[dict] = list()
+        offset = 0
+        while True:
+            json_resp = await self._fetch_page_json(session, rate_limiter=rate_limiter, offset=offset,
+                                                    extra_params=extra_params)
+            json_items.extend(self._json_items(json_resp))
+            if self._is_last_page(json_resp):
+                break
+            offset += self.client_params.page_size
+
+        positions = {str(value): position for position, value in enumerate(batch)}
+        keys = self._batched_item_path.split('.')
+
+        def requested_position(json_item: dict) -> int:
+            value = json_item
+            for key in keys:
+                value = value.get(key) if isinstance(value, dict) else None
+            return positions.get(str(value), len(batch))
+
+        return {self._json_resp_key: sorted(json_items, key=requested_position)}
+
+    def _aiter_fetched_pages_jsons(self, session, *, rate_limiter: RateLimiter) -> AsyncGenerator:
+        """Dispatches to the concurrent or the sequential paginator, depending on the client params."""
+        if self.client_params.concurrent_pagination:
+            return self._aiter_pages_jsons_concurrently(session, rate_limiter=rate_limiter)
+        return self._aiter_pages_jsons_sequentially(session, rate_limiter=rate_limiter)
+
+    async def _aiter_pages_jsons_sequentially(self, session, *, rate_limiter: RateLimiter) -> AsyncGenerator:
+        self._latest_json_response = None
+        processed_pages = 0
+        while self._remaining_pages():
+            json_resp = await self._fetch_page_json(session, rate_limiter=rate_limiter, offset=self.client_params.offset)
+            processed_pages += 1
+            self._register_fetched_page(json_resp, page_number=processed_pages)
+            yield json_resp
+
+    async def _aiter_pages_jsons_concurrently(self, session, *, rate_limiter: RateLimiter) -> AsyncGenerator:
+        """
+        Speculatively requests a window of upcoming pages at once, as wide as the concurrency limit.
+        The window slides forward as pages are yielded, so at most that many pages are in flight or buffered.
+        It only opens once the first page turns out to be full, so that single page queries do not waste requests.
+        The rate limiter still spaces out the requests, but no longer waits on the previous page to be received.
+        As soon as a page shorter than page_size is received, no further pages are requested,
+        requests already sent past it are cancelled, and pages which were fetched past it are discarded.
+        A page which failed only fails the crawl once it is the next page to yield: the failures of pages
+        past the last page are ignored, as the crawl does not need them.
+        Pages are yielded in offset order.
+        """
+        first_offset = self.client_params.offset
+        max_pages = self.client_params.max_pages
+        in_flight: dict[asyncio.Task, int] = dict()
+        fetched: dict[int, Union[dict, list, BaseException]] = dict()
+        next_page_to_request, next_page_to_yield = 0, 0
+        last_page: Optional[int] = None
+        cancelled: list[asyncio.Task] = list()
+
+        def may_request(page: int) -> bool:
+            if last_page is not None and page > last_page:
+                return False
+            return max_pages is None or page < max_pages
 
-            if potential_error_occurred := isinstance(json_resp, dict) and 'detail' in json_resp.keys():
-                raise ConnectionError(f'{(error_msg := json_resp["detail"])}')
+        try:
+            while True:
+                window = self._pages_window if next_page_to_yield else 1
+                while next_page_to_request < next_page_to_yield + window and may_request(next_page_to_request):
+                    offset = first_offset + next_page_to_request * self.client_params.page_size
+                    coro = self._fetch_page_json(session, rate_limiter=rate_limiter, offset=offset)
+                    in_flight[asyncio.create_task(coro)] = next_page_to_request
+                    next_page_to_request += 1
+
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task not in in_flight:  # dropped past a last page received at the same time
+                        continue
+                    page = in_flight.pop(task)
+                    fetched[page] = json_resp = task.exception() or task.result()
+                    if isinstance(json_resp, BaseException) or not self._is_last_page(json_resp):
+                        continue
+                    if last_page is None or page < last_page:
+                        last_page = page
+                        for extra_task in [t for t, p in in_flight.items() if p > last_page]:
+                            extra_task.cancel()
+                            cancelled.append(extra_task)
+                            del in_flight[extra_task]
+                        for extra_page in [p for p in fetched if p > last_page]:
+                            del fetched[extra_page]
+
+                while next_page_to_yield in fetched and may_request(next_page_to_yield):
+                    json_resp = fetched.pop(next_page_to_yield)
+                    if isinstance(json_resp, BaseException):
+                        raise json_resp
+                    next_page_to_yield += 1
+                    self._register_fetched_page(json_resp, page_number=next_page_to_yield)
+                    yield json_resp
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, *cancelled, return_exceptions=True)
+
+    async def _fetch_page_json(self, session, *, rate_limiter: RateLimiter, offset: int,
+                               extra_params: Optional[dict] = None) -> Union[dict, list]:
+        """extra_params override the params of the endpoint, for instance the time window of a time-sliced crawl."""
+        params = {**self.get_params, **{'offset': offset}, **(extra_params or dict())}  # type: ignore
+        querystring = self.mk_querystring(self.url, params=params)
+        return await self._request_json(session, querystring, rate_limiter=rate_limiter)
+
+    async def _request_json(self, session, url: str, *, rate_limiter: RateLimiter) -> Union[dict, list]:
+        """
+        Joins an identical request in flight on the session, if any (see _coalescing_key).
+        Otherwise, serves the page from the response cache of the client params, if any, or requests it,
+        through the cassette of the client params, if any.
+        """
+        async def send(headers: dict) -> tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]:
+            return await self._request_with_retries(session, url, rate_limiter=rate_limiter, headers=headers)
+
+        async def request(headers: dict) -> tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]:
+            cassette = self.client_params.cassette
+            if cassette is None:
+                return await send(headers)
+            return await cassette.fetch(url, headers, request=send)
+
+        async def request_through_cache() -> Union[dict, list]:
+            cache = self.client_params.response_cache
+            if cache is None:
+                json_resp, _, _ = await request(dict())
+                return json_resp
+            return await cache.fetch(url, ttl=cache.ttl_for(type(self).__name__), request=request)
+
+        single_flight = self.session.single_flight if self.session else None
+        if single_flight is None:
+            return await request_through_cache()
+        return await single_flight.do((url, *self._coalescing_key), request_through_cache)
+
+    async def _request_with_retries(self, session, url: str, *, rate_limiter: RateLimiter,
+                                    headers: dict) -> tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]:
+        """Sends the request, and sends it again if it fails transiently, according to the retry policy."""
+        retry_policy = self.client_params.retry_policy
+        retry_policy.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                return await self._send_request(session, url, rate_limiter=rate_limiter, headers=headers)
+            except RETRYABLE_EXCEPTIONS as error:
+                if not retry_policy.should_retry(error, attempt):
+                    if isinstance(error, ContentTypeError):
+                        raise  # explained by _server_errors_as_connection_errors
+                    raise ConnectionError(f'Request failed after {attempt} attempt(s): {error!r} ({url})') from error
+                delay = retry_policy.backoff(attempt, retry_after=getattr(error, 'retry_after', None))
+                logger.warning(f'Retrying in {delay:.2f}s, after attempt #{attempt} failed: {error!r} ({url})')
+                if self.client_params.hooks is not None:
+                    self.client_params.hooks.on_retry(type(self).__name__, url, attempt, error, delay)
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _send_request(self, session, url: str, *, rate_limiter: RateLimiter,
+                            headers: dict) -> tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]:
+        """Returns the JSON, the raw body and the headers of the response. The JSON is None if it is 304 Not Modified."""
+        hooks = self.client_params.hooks
+        for _ in range(self._max_throttled_attempts):
+            timings = RequestTimings(endpoint=type(self).__name__, url=url)
+            try:
+                response = await self._send_request_once(session, url, rate_limiter=rate_limiter, headers=headers,
+                                                         timings=timings)
+            except Exception as error:
+                timings.error = error
+                raise
+            finally:
+                if hooks is not None:
+                    hooks.on_request(timings)
+            if response is not None:
+                break
+            if hooks is not None:
+                hooks.on_throttled(type(self).__name__, url)
+        else:
+            raise ConnectionError(f'Throttled by the server {self._max_throttled_attempts} times in a row: {url}')
+
+        json_resp, _, _ = response
+        if potential_error_occurred := isinstance(json_resp, dict) and 'detail' in json_resp.keys():
+            raise ConnectionError(f'{(error_msg := json_resp["detail"])}')
+        return response
+
+    async def _send_request_once(self, session, url: str, *, rate_limiter: RateLimiter, headers: dict,
+                                 timings: RequestTimings
+                                 ) -> Optional[tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]]:
+        """Sends the request once, and times its phases. Returns None if it was throttled by the server."""
+        retry_policy = self.client_params.retry_policy
+        timeout = ClientTimeout(total=retry_policy.timeout)
+        queued_at = perf_counter()
+        async with rate_limiter.throttle():
+            sent_at = perf_counter()
+            timings.queue_wait = sent_at - queued_at
+            async with session.get(url, timeout=timeout, headers=headers, trace_request_ctx=timings) as resp:
+                timings.ttfb = perf_counter() - sent_at - timings.connect
+                timings.status = resp.status
+                rate_limiter.on_response(resp.status, resp.headers)
+                if resp.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    return None  # sent again once the rate limiter resumes
+                if resp.status in retry_policy.retryable_statuses:
+                    raise RetryableStatusError(resp.status, url, retry_after=resp.headers.get('Retry-After'))
+                if resp.status == HTTPStatus.NOT_MODIFIED and headers:
+                    return None, b'', resp.headers
+                download_started_at = perf_counter()
+                body = await resp.read()
+                decode_started_at = perf_counter()
+                timings.download, timings.received_bytes = decode_started_at - download_started_at, len(body)
+                json_resp = await resp.json(loads=get_json_backend().loads)  # the body is already read
+                timings.decode = perf_counter() - decode_started_at
+                return json_resp, body, resp.headers
+
+    def _register_fetched_page(self, json_resp: Union[dict, list], *, page_number: int) -> None:
+        """Advances the pagination state of the client params by one page."""
+        self._latest_json_response = json_resp
+        self.client_params._decrement_max_pages_attr()
+        self.client_params.offset += self.client_params.page_size
+        logger.info(f'Fetched page #{page_number} (~{self.client_params.page_size} elements)')
 
-            logger.info(f'Fetched page #{processed_pages} (~{self.client_params.page_size} elements)')
-            responses.append(json_resp)
+    def _parse_json(self, the_json: Union[dict, list]) -> list[Type[BaseResponse]]:
+        started_at = perf_counter()
+        responses = [self._response_type(element) for element in self._json_items(the_json)]  # type: ignore
+        if self.client_params.hooks is not None:
+            self.client_params.hooks.on_parse(type(self).__name__, len(responses), perf_counter() - started_at)
         return responses
 
-    def _parse_json(self, the_json: Union[dict, list]) -> list[Type[BaseResponse]]:
+    def _json_items(self, the_json: Union[dict, list]) -> list[dict]:
+        """Extracts the raw JSON elements from a page, without parsing them into response objects."""
         if not the_json:
             return list()
 
         if isinstance(the_json, dict):
-            json_list = the_json[self._json_resp_key]  # type: ignore
-
-        if isinstance(the_json, list):
-            flattened = list(chain.from_iterable(the_json)) if isinstance(the_json[0], list) else the_json  # just in case multiple pages
-            json_list = list(chain.from_iterable(j.get(self._json_resp_key) or [j] for j in flattened))
+            return the_json[self._json_resp_key]  # type: ignore
 
-        responses = [self._response_type(element) for element in json_list]  # type: ignore
-        return responses
+        flattened = list(chain.from_iterable(the_json)) if isinstance(the_json[0], list) else the_json  # just in case multiple pages
+        return list(chain.from_iterable(j.get(self._json_resp_key) or [j] for j in flattened))
 
     def _remaining_pages(self) -> bool:
         if self._latest_json_response is None:
             return True
-        if is_the_last_page := len(self._parse_json(self._latest_json_response)) < self.client_params.page_size:
+        if self._is_last_page(self._latest_json_response):
             return False
         max_pages_reached: bool = self.client_params.max_pages is not None and self.client_params.max_pages <= 0
         if max_pages_reached:
             return False
         return True
 
+    def _is_last_page(self, json_resp: Union[dict, list]) -> bool:
+        """Decided from the raw JSON, as pages are parsed only once, after being fetched."""
+        if isinstance(json_resp, dict) and 'next' in json_resp:
+            return json_resp['next'] is None  # cursor paginated responses
+        return len(self._json_items(json_resp)) < self.client_params.page_size
+
     @staticmethod
     def mk_querystring(url, params) -> str:
-        url_prepper = PreparedRequest()
-        url_prepper.prepare_url(url, params)
-        return url_prepper.url
+        """The params other than the offset are only encoded once per query, see helpers.querystring."""
+        return mk_querystring(url, params)
@@ -4,6 +4,7 @@ from typing import Optional
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
 from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.columnar import Column, ColumnKind
 from open_sea_v1.responses.collection import CollectionResponse
 
 
@@ -40,6 +41,17 @@ class CollectionsEndpoint(BaseClient, BaseEndpoint):
     asset_owner: Optional[str] = None
     _response_type = CollectionResponse
     _json_resp_key = 'collections'
+    _columns = dict(
+        slug=Column('slug'),
+        name=Column('name'),
+        created_date=Column('created_date', ColumnKind.DATETIME),
+        owned_asset_count=Column('owned_asset_count', ColumnKind.INT),
+        floor_price=Column('stats.floor_price', ColumnKind.FLOAT),
+        average_price=Column('stats.average_price', ColumnKind.FLOAT),
+        total_volume=Column('stats.total_volume', ColumnKind.FLOAT),
+        total_sales=Column('stats.total_sales', ColumnKind.FLOAT),
+        num_owners=Column('stats.num_owners', ColumnKind.INT),
+    )
 
     def __post_init__(self):
         self._validate_request_params()
@@ -1,13 +1,23 @@
+import asyncio
+import logging
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from itertools import takewhile
+from pathlib import Path
+from typing import Optional, Union
 
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
 from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.checkpoint import SyncWatermark
+from open_sea_v1.helpers.columnar import Column, ColumnKind, to_datetime
 from open_sea_v1.helpers.extended_classes import ExtendedStrEnum
+from open_sea_v1.helpers.rate_limiter import RateLimiter
+from open_sea_v1.helpers.time_windows import TimeWindow
 from open_sea_v1.responses.event import EventResponse
 
+logger = logging.getLogger(__name__)
+
 
 class EventType(ExtendedStrEnum):
     """
@@ -76,6 +86,22 @@ class EventsEndpoint(BaseClient, BaseEndpoint):
     only_opensea: bool = False
     _response_type = EventResponse
     _json_resp_key = 'asset_events'
+    _columns = dict(
+        id=Column('id', ColumnKind.INT),
+        event_type=Column('event_type'),
+        created_date=Column('created_date', ColumnKind.DATETIME),
+        token_id=Column('asset.token_id'),
+        contract_address=Column('contract_address', ColumnKind.ADDRESS),
+        total_price=Column('total_price', ColumnKind.WEI),
+        quantity=Column('quantity', ColumnKind.INT),
+        payment_token=Column('payment_token.symbol'),
+        payment_token_usd_price=Column('payment_token.usd_price', ColumnKind.FLOAT),
+        seller=Column('seller.address', ColumnKind.ADDRESS),
+        winner=Column('winner_account.address', ColumnKind.ADDRESS),
+        transaction_hash=Column('transaction.transaction_hash'),
+        transaction_timestamp=Column('transaction.timestamp', ColumnKind.DATETIME),
+    )
+    _time_slice_overlap = timedelta(seconds=1)
 
     def __post_init__(self):
         self._validate_request_params()
@@ -86,6 +112,139 @@ class EventsEndpoint(BaseClient, BaseEndpoint):
     def url(self) -> str:
         return EndpointURLS.EVENTS.value
 
+    def get_time_sliced_events(self, slices: Optional[int] = None, min_window: timedelta = timedelta(minutes=1),
+                               newest_first: bool = True) -> list[EventResponse]:
+        """Synchronous counterpart of aget_time_sliced_events()."""
+        coro = self.aget_time_sliced_events(slices=slices, min_window=min_window, newest_first=newest_first)
+        with self._server_errors_as_connection_errors():
+            return self.session.run(coro) if self.session else asyncio.run(coro)
+
+    async def aget_time_sliced_events(self, slices: Optional[int] = None, min_window: timedelta = timedelta(minutes=1),
+                                      newest_first: bool = True) -> list[EventResponse]:
+        """
+        Crawls the events between occurred_after and occurred_before concurrently, one time window per request,
+        instead of walking the offsets of the whole range one page after the other.
+        Deep offsets are slow, and capped by OpenSea, so long ranges are only crawled in full this way.
+
+        The range is first split into `slices` windows, which defaults to the concurrency limit.
+        Windows whose first page is full are bisected, and both halves are fetched concurrently,
+        until they are shorter than min_window: the following pages of such windows are fetched by offset.
+        Every request goes through the rate limiter of the crawl, so the windows share its budget.
+        The offset and max_pages of the client params do not apply.
+
+        The events are deduplicated by id, and sorted by date, newest first like OpenSea unless newest_first is False.
+        """
+        if not (self.occurred_after and self.occurred_before):
+            raise ValueError('Time-sliced crawls require both occurred_after and occurred_before.',
+                             f"{self.occurred_before=}, {self.occurred_after=}")
+        if min_window <= 2 * self._time_slice_overlap:
+            raise ValueError(f'{min_window=} must be longer than twice {self._time_slice_overlap=}.')
+
+        windows = TimeWindow(self.occurred_after, self.occurred_before).split(
+            slices or self._pages_window, overlap=self._time_slice_overlap)
+        async with self._open_session() as (session, rate_limiter):
+            events_by_id = await self._crawl_time_windows(session, rate_limiter, windows, min_window=min_window)
+        json_events = sorted(events_by_id.values(), key=lambda e: (e['created_date'], e['id']), reverse=newest_first)
+        return self._parse_json({self._json_resp_key: json_events})
+
+    def get_new_events(self, watermarks_dir: Union[str, Path]) -> list[EventResponse]:
+        """Synchronous counterpart of aget_new_events()."""
+        coro = self.aget_new_events(watermarks_dir)
+        with self._server_errors_as_connection_errors():
+            return self.session.run(coro) if self.session else asyncio.run(coro)
+
+    async def aget_new_events(self, watermarks_dir: Union[str, Path]) -> list[EventResponse]:
+        """
+        Incremental sync: returns only the events which occurred since the previous sync of the same query, newest first.
+        The latest event seen is persisted per query in watermarks_dir (see SyncWatermark).
+        Pages are requested newest first from the watermark on, and the pagination stops at the first event already seen,
+        so a sync without new events costs a single request.
+        The first sync of a query returns every event matching it, from occurred_after if it is set.
+        The watermark is only saved once every new event is fetched, so the events of a failed sync are fetched again.
+        Events repeated by the next pages, when events occur during the sync, are only returned once.
+        """
+        watermark = await asyncio.to_thread(SyncWatermark.for_query, watermarks_dir, self._sync_query)
+        extra_params = dict()
+        if watermark.created_date is not None:
+            # the bounds of the API are exclusive, and less precise than created_date
+            synced_after = to_datetime(watermark.created_date) - self._time_slice_overlap
+            if not self.occurred_after or self.occurred_after < synced_after:
+                extra_params['occurred_after'] = synced_after
+
+        new_json_events: list[dict] = list()
+        fetched_ids: set[int] = set()  # events occurring during the sync shift the pages, which then repeat events
+        async with self._open_session() as (session, rate_limiter):
+            offset = self.client_params.offset
+            while True:
+                json_resp = await self._fetch_page_json(session, rate_limiter=rate_limiter, offset=offset,
+                                                        extra_params=extra_params)
+                json_events = self._json_items(json_resp)
+                unseen_json_events = list(takewhile(lambda json_event: not watermark.is_seen(json_event), json_events))
+                new_json_events.extend(
+                    json_event for json_event in unseen_json_events if json_event['id'] not in fetched_ids)
+                fetched_ids.update(json_event['id'] for json_event in unseen_json_events)
+                if len(unseen_json_events) < len(json_events) or self._is_last_page(json_resp):
+                    break
+                offset += self.client_params.page_size
+
+        watermark.advance(new_json_events)
+        await asyncio.to_thread(watermark.save)
+        logger.info(f'Synced {len(new_json_events)} new events, up to {watermark.created_date}.')
+        return self._parse_json({self._json_resp_key: new_json_events})
+
+    @property
+    def _sync_query(self) -> dict:
+        """Identifies the watermarks of incremental syncs, which do not depend on the pagination nor on occurred_after."""
+        params = {k: v for k, v in self.get_params.items() if k not in ('offset', 'limit', 'occurred_after')}
+        return dict(endpoint=type(self).__name__, url=self.url, params=params)
+
+    async def _crawl_time_windows(self, session, rate_limiter: RateLimiter, windows: list[TimeWindow], *,
+                                  min_window: timedelta) -> dict[int, dict]:
+        """Crawls the windows, and the windows they are bisected into, at most as many at a time as the pages window."""
+        events_by_id: dict[int, dict] = dict()
+        pending_windows = list(reversed(windows))
+        in_flight: dict[asyncio.Task, TimeWindow] = dict()
+        try:
+            while pending_windows or in_flight:
+                while pending_windows and len(in_flight) < self._pages_window:
+                    window = pending_windows.pop()
+                    coro = self._crawl_time_window(session, rate_limiter, window, min_window=min_window)
+                    in_flight[asyncio.create_task(coro)] = window
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    window = in_flight.pop(task)
+                    json_events, sub_windows = task.result()
+                    events_by_id.update((json_event['id'], json_event) for json_event in json_events)
+                    if sub_windows:
+                        logger.info(f'Bisected the full window {window.start} - {window.end}.')
+                    pending_windows.extend(reversed(sub_windows))
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        return events_by_id
+
+    async def _crawl_time_window(self, session, rate_limiter: RateLimiter, window: TimeWindow, *,
+                                 min_window: timedelta) -> tuple[list[dict], list[TimeWindow]]:
+        """
+        Fetches the first page of the window. If it is full, returns the halves of the window to fetch them,
+        unless the window is shorter than min_window: its following pages are then fetched by offset.
+        Returns the raw events fetched, and the windows left to fetch.
+        """
+        window_params = dict(occurred_after=window.start, occurred_before=window.end)
+        json_events: list[dict] = list()
+        offset = 0
+        while True:
+            json_resp = await self._fetch_page_json(session, rate_limiter=rate_limiter, offset=offset,
+                                                    extra_params=window_params)
+            json_events.extend(self._json_items(json_resp))
+            if self._is_last_page(json_resp):
+                return json_events, list()
+            if offset == 0 and window.duration > min_window:
+                return json_events, window.split(2, overlap=self._time_slice_overlap)
+            offset += self.client_params.page_size
+
     @property
     def get_params(self) -> dict:
         return dict(
@@ -4,6 +4,7 @@ from datetime import datetime
 from open_sea_v1.endpoints.abc import BaseEndpoint
 from open_sea_v1.endpoints.client import BaseClient, ClientParams
 from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.columnar import Column, ColumnKind
 from open_sea_v1.responses.asset import OrderResponse
 
 
@@ -63,6 +64,7 @@ class OrdersEndpoint(BaseClient, BaseEndpoint):
     token_ids: list[str]
         Filter by a list of token IDs for the order's asset.
         Needs to be defined together with asset_contract_address.
+        Longer lists than the API accepts are split into batches, crawled concurrently. Orders follow the order of the list.
 
     side: int
         Filter by the side of the order.
@@ -104,6 +106,23 @@ class OrdersEndpoint(BaseClient, BaseEndpoint):
     order_direction: str = None
     _response_type = OrderResponse
     _json_resp_key = 'orders'
+    _batched_param = 'token_ids'
+    _batched_item_path = 'asset.token_id'
+    _columns = dict(
+        id=Column('id', ColumnKind.INT),
+        order_hash=Column('order_hash'),
+        created_date=Column('created_date', ColumnKind.DATETIME),
+        token_id=Column('asset.token_id'),
+        side=Column('side', ColumnKind.INT),
+        sale_kind=Column('sale_kind', ColumnKind.INT),
+        current_price=Column('current_price', ColumnKind.WEI),
+        base_price=Column('base_price', ColumnKind.WEI),
+        payment_token=Column('payment_token_contract.symbol'),
+        maker=Column('maker.address', ColumnKind.ADDRESS),
+        taker=Column('taker.address', ColumnKind.ADDRESS),
+        cancelled=Column('cancelled', ColumnKind.BOOL),
+        finalized=Column('finalized', ColumnKind.BOOL),
+    )
 
     def __post_init__(self):
         self._validate_request_params()
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from os import environ
+from threading import Thread
+from typing import Any, Coroutine, Optional
+
+from aiohttp import ClientSession, TCPConnector
+
+from open_sea_v1.helpers.instrumentation import mk_trace_config
+from open_sea_v1.helpers.json_backend import get_json_backend
+from open_sea_v1.helpers.rate_limit_backends import RateLimitBackend
+from open_sea_v1.helpers.rate_limiter import RateLimiter
+from open_sea_v1.helpers.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OpenSeaSession:
+    """
+    Long-lived HTTP session and rate limiter, shared by every endpoint instance it is passed to.
+    Connections are kept alive and DNS lookups are cached between calls,
+    and all the endpoints sharing the session consume the same rate limit budget.
+
+    Use it as a context manager:
+        with OpenSeaSession() as session:
+            EventsEndpoint(client_params=ClientParams(), session=session, ...).get_parsed_pages()
+
+    The synchronous context manager runs the event loop on a background thread, on which all the calls are made.
+    The asynchronous context manager (async with) uses the running event loop instead,
+    in which case only the asynchronous methods of the endpoints may be used (aiter_pages, aiter_items).
+
+    Parameters
+    ----------
+    api_key:
+        Defaults to the OPENSEA_API_KEY environment variable.
+
+    rate_limit:
+        Initial requests per second, for all endpoints combined. Defaults to 18 with an API key, 2 without.
+
+    concurrency_limit:
+        Number of simultaneous requests, for all endpoints combined.
+
+    limit_per_host:
+        Number of simultaneous connections kept open to OpenSea. Defaults to the concurrency limit.
+
+    keepalive_timeout:
+        Seconds an idle connection is kept open for reuse.
+
+    ttl_dns_cache:
+        Seconds a DNS lookup is cached for.
+
+    adaptive_rate_limit:
+        Whether the rate adapts to the throttling of the server. See RateLimiter.
+
+    rate_limit_burst:
+        Number of requests which may be sent at once after an idle period. 1 spaces every request evenly.
+
+    rate_limit_backend:
+        Shares the rate limit budget with the sessions of other processes or hosts using the same backend,
+        for instance a FileLockBackend or a RedisBackend. See helpers.rate_limit_backends.
+        Its connections are closed with the session.
+
+    coalesce_requests:
+        Whether identical requests in flight at the same time, from the endpoints sharing the session, are sent once,
+        and identical get_parsed_pages() calls crawl once: later callers join the one in flight. See SingleFlight.
+        Calls are only identical if their endpoints also share their response cache, cassette and hooks, if any,
+        and the settings of their retry policy.
+    """
+    api_key: Optional[str] = None
+    rate_limit: Optional[int] = None
+    concurrency_limit: int = 5
+    limit_per_host: Optional[int] = None
+    keepalive_timeout: float = 60
+    ttl_dns_cache: int = 600
+    adaptive_rate_limit: bool = True
+    rate_limit_burst: int = 1
+    rate_limit_backend: Optional[RateLimitBackend] = None
+    coalesce_requests: bool = True
+
+    def __post_init__(self):
+        self.api_key = self.api_key or environ.get('OPENSEA_API_KEY')
+        self.rate_limit = self.rate_limit or (18 if self.api_key else 2)
+        self.limit_per_host = self.limit_per_host or self.concurrency_limit
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.http_session: Optional[ClientSession] = None
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.single_flight: Optional[SingleFlight] = None
+        self._loop_thread: Optional[Thread] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.http_session is not None and not self.http_session.closed
+
+    @property
+    def http_headers(self) -> dict:
+        headers = dict()
+        if self.api_key:
+            headers['X-API-Key'] = self.api_key
+        return headers
+
+    def __enter__(self) -> 'OpenSeaSession':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'OpenSeaSession':
+        self.loop = asyncio.get_running_loop()
+        await self._aopen()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._aclose()
+        self.loop = None
+
+    def open(self) -> None:
+        """Starts the background event loop thread, then opens the HTTP session and the rate limiter on it."""
+        if self.is_open:
+            return
+        if sys.platform == 'win32':
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # prevents closed loops errors on windows
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = Thread(target=self.loop.run_forever, name=f'{type(self).__name__}-event-loop', daemon=True)
+        self._loop_thread.start()
+        self.run(self._aopen())
+
+    def close(self) -> None:
+        if self._loop_thread is None:
+            return
+        try:
+            self.run(self._aclose())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._loop_thread.join()
+            self.loop.close()
+            self.loop, self._loop_thread = None, None
+
+    def run(self, coro: Coroutine) -> Any:
+        """Runs the coroutine on the background event loop of the session, and waits for its result."""
+        try:
+            self.assert_usable_from_sync_code()
+        except RuntimeError:
+            coro.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def assert_usable_from_sync_code(self) -> None:
+        if self._loop_thread is None:
+            raise RuntimeError(f'{type(self).__name__} must be opened with a synchronous context manager '
+                               f'(with statement) to be used from synchronous code.')
+
+    def assert_usable_from_running_loop(self) -> None:
+        if not self.is_open:
+            raise RuntimeError(f'{type(self).__name__} is not open.')
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError(f'{type(self).__name__} is bound to another event loop.')
+
+    async def _aopen(self) -> None:
+        connector = TCPConnector(
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        self.rate_limiter = RateLimiter(
+            rate_limit=self.rate_limit,
+            concurrency_limit=self.concurrency_limit,
+            burst=self.rate_limit_burst,
+            adaptive=self.adaptive_rate_limit,
+            backend=self.rate_limit_backend,
+        )
+        self.http_session = ClientSession(connector=connector, headers=self.http_headers, json_serialize=get_json_backend().dumps,
+                                          trace_configs=[mk_trace_config()])
+        self.single_flight = SingleFlight() if self.coalesce_requests else None
+        logger.debug(f'Opened {type(self).__name__} ({self.rate_limit=}, {self.concurrency_limit=}).')
+
+    async def _aclose(self) -> None:
+        if self.http_session is not None:
+            await self.http_session.close()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.close()
+        self.http_session, self.rate_limiter, self.single_flight = None, None, None
@@ -0,0 +1,81 @@
+import asyncio
+from unittest import TestCase
+
+from open_sea_v1.endpoints.bulk import BulkExecutor, FairScheduler
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+
+
+class TestBulkExecutor(LocalServerTestCase):
+
+    @staticmethod
+    def mk_endpoint(token_id: int) -> EventsEndpoint:
+        return EventsEndpoint(client_params=ClientParams(limit=5, page_size=5, concurrent_pagination=False), token_id=token_id)
+
+    def test_queries_run_on_a_single_session(self):
+        with OpenSeaSession(rate_limit=200, concurrency_limit=3) as session:
+            executor = BulkExecutor(session)
+            handles = [executor.add(self.mk_endpoint(token_id)) for token_id in range(20)]
+            executor.run()
+        self.assertTrue(all(len(handle.result()) == 12 for handle in handles))
+        self.assertEqual(20 * 3, self.server.served_requests)
+        self.assertLessEqual(len(self.server.client_ports), 3)
+
+    def test_failed_queries_do_not_interrupt_the_others(self):
+        self.server.inject_faults(5, 404)
+        executor = BulkExecutor(OpenSeaSession(rate_limit=200))
+        with executor.session:
+            handles = [executor.add(self.mk_endpoint(token_id)) for token_id in range(4)]
+            executor.run()
+        failed = [handle for handle in handles if handle.error is not None]
+        self.assertEqual(1, len(failed))
+        self.assertRaises(ConnectionError, failed[0].result)
+        self.assertTrue(all(len(handle.result()) == 12 for handle in handles if handle not in failed))
+
+    def test_executor_runs_on_an_asynchronous_session(self):
+        async def run() -> list:
+            async with OpenSeaSession(rate_limit=200) as session:
+                executor = BulkExecutor(session)
+                executor.add(self.mk_endpoint(1))
+                return await executor.arun()
+
+        [handle] = asyncio.run(run())
+        self.assertEqual(12, len(handle.result()))
+
+    def test_result_of_a_query_not_run_yet_raises(self):
+        handle = BulkExecutor().add(self.mk_endpoint(1))
+        self.assertRaises(RuntimeError, handle.result)
+
+
+class TestFairScheduler(TestCase):
+
+    def test_slots_go_to_the_queries_in_turn(self):
+        granted = list()
+
+        async def request(scheduler: FairScheduler, query: str) -> None:
+            async with scheduler.turn(query):
+                granted.append(query)
+                await asyncio.sleep(0.001)
+
+        async def run() -> None:
+            scheduler = FairScheduler(slots=1)
+            await asyncio.gather(*[request(scheduler, 'a') for _ in range(3)], *[request(scheduler, 'b') for _ in range(3)])
+
+        asyncio.run(run())
+        self.assertEqual(['a', 'a', 'b', 'a', 'b', 'b'], granted)  # without the scheduler: a, a, a, b, b, b
+
+    def test_cancelled_waiters_release_their_turn(self):
+        async def run() -> FairScheduler:
+            scheduler = FairScheduler(slots=1)
+            async with scheduler.turn('a'):
+                waiter = asyncio.create_task(scheduler.turn('b').__aenter__())
+                await asyncio.sleep(0)
+                waiter.cancel()
+            async with scheduler.turn('c'):
+                pass
+            return scheduler
+
+        scheduler = asyncio.run(run())
+        self.assertEqual(0, scheduler.busy_slots)
@@ -1,8 +1,22 @@
+import asyncio
+import threading
+from functools import partial
+from importlib.util import find_spec
+from itertools import chain
 from os import environ
+from tempfile import TemporaryDirectory
+from time import perf_counter
 from unittest import TestCase, skipIf
+from unittest.mock import patch
 
+from open_sea_v1.endpoints.assets import AssetsEndpoint, AssetsOrderBy
 from open_sea_v1.endpoints.client import ClientParams
 from open_sea_v1.endpoints.events import EventsEndpoint, EventType
+from open_sea_v1.endpoints.orders import OrdersEndpoint
+from open_sea_v1.helpers.checkpoint import CrawlCheckpoint
+from open_sea_v1.helpers.columnar import Column, ColumnKind
+from open_sea_v1.helpers.testing_payloads import SAMPLE_CONTRACT, mk_assets_page, mk_event_json, mk_order_json
+from open_sea_v1.responses.asset import AssetResponse
 from open_sea_v1.responses.event import EventResponse
 from open_sea_v1.tests.run_tests import SKIP_SLOW_TESTS
 
@@ -119,3 +133,379 @@ class TestBaseClientAsyncWithAPIKey(TestCase):
         event_ids = [n.id for n in parsed]
         unique_event_ids = set(event_ids)
         self.assertEqual(len(event_ids), len(unique_event_ids))
+
+
+class OfflineClientTestCase(TestCase):
+    """Runs the client offline against a fake page fetcher which serves total_items events."""
+
+    total_items = 23
+    failing_offset = 10
+
+    def setUp(self) -> None:
+        self.sample_client = EventsEndpoint(client_params=ClientParams(limit=5, page_size=5))
+        self.sample_client._fetch_page_json = self.fake_fetch_page_json
+        self.sample_client._latest_json_response = None
+        self.requested_offsets = list()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fake_fetch_page_json(self, session, *, rate_limiter, offset: int) -> dict:
+        self.requested_offsets.append(offset)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01 if offset % 2 else 0.02)  # pages complete out of order
+        self.in_flight -= 1
+        ids = range(offset, min(offset + self.sample_client.client_params.page_size, self.total_items))
+        return {'asset_events': [mk_event_json(i) for i in ids]}
+
+    async def failing_fetch_page_json(self, session, *, rate_limiter, offset: int) -> dict:
+        """Fails the page at failing_offset, and serves the others as fake_fetch_page_json does."""
+        if offset == self.failing_offset:
+            self.requested_offsets.append(offset)
+            raise ConnectionError('boom')
+        return await self.fake_fetch_page_json(session, rate_limiter=rate_limiter, offset=offset)
+
+
+class TestBaseClientPagination(OfflineClientTestCase):
+
+    def get_pages_jsons(self) -> list[dict]:
+        return asyncio.run(self.sample_client._async_get_pages_jsons(None, rate_limiter=None))  # type: ignore
+
+    def get_ids(self, pages: list[dict]) -> list[int]:
+        return [e['id'] for page in pages for e in page['asset_events']]
+
+    def test_concurrent_pagination_returns_pages_in_offset_order(self):
+        pages = self.get_pages_jsons()
+        self.assertEqual(list(range(self.total_items)), self.get_ids(pages))
+
+    def test_concurrent_pagination_requests_several_pages_at_once(self):
+        self.get_pages_jsons()
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, self.sample_client._concurrency_limit)
+
+    def test_concurrent_pagination_stops_requesting_after_the_last_page(self):
+        self.sample_client._concurrency_limit = 3
+        self.total_items = 12  # the third page is the last one
+        pages = self.get_pages_jsons()
+        self.assertEqual(3, len(pages))
+        self.assertLessEqual(max(self.requested_offsets), 10 + 5 * self.sample_client._concurrency_limit)
+
+    def test_concurrent_pagination_requests_a_single_page_for_single_page_results(self):
+        self.total_items = 4
+        self.get_pages_jsons()
+        self.assertEqual([0], self.requested_offsets)
+
+    def test_concurrent_pagination_respects_max_pages(self):
+        self.sample_client.client_params.max_pages = 2
+        pages = self.get_pages_jsons()
+        self.assertEqual(list(range(10)), self.get_ids(pages))
+        self.assertEqual([0, 5], sorted(self.requested_offsets))
+
+    def test_concurrent_pagination_advances_client_params_like_sequential_pagination(self):
+        self.sample_client.client_params.max_pages = 3
+        self.get_pages_jsons()
+        concurrent_state = self.sample_client.client_params.offset, self.sample_client.client_params.max_pages
+
+        self.sample_client.client_params = ClientParams(limit=5, page_size=5, max_pages=3, concurrent_pagination=False)
+        self.sample_client._latest_json_response = None
+        self.get_pages_jsons()
+        sequential_state = self.sample_client.client_params.offset, self.sample_client.client_params.max_pages
+        self.assertEqual(sequential_state, concurrent_state)
+
+    def test_sequential_pagination_requests_one_page_at_a_time(self):
+        self.sample_client.client_params.concurrent_pagination = False
+        pages = self.get_pages_jsons()
+        self.assertEqual(list(range(self.total_items)), self.get_ids(pages))
+        self.assertEqual(1, self.max_in_flight)
+
+    def test_concurrent_pagination_propagates_fetch_errors(self):
+        self.sample_client._fetch_page_json = self.failing_fetch_page_json
+        self.assertRaises(ConnectionError, self.get_pages_jsons)
+
+    def test_concurrent_pagination_ignores_failures_of_pages_past_the_last_page(self):
+        self.total_items, self.failing_offset = 12, 15  # the third page is the last one, the fourth one fails
+        self.sample_client._fetch_page_json = self.failing_fetch_page_json
+        pages = self.get_pages_jsons()
+        self.assertEqual(list(range(self.total_items)), self.get_ids(pages))
+        self.assertIn(self.failing_offset, self.requested_offsets)
+
+    def test_concurrent_pagination_cancels_requests_past_the_last_page(self):
+        self.total_items = 12  # the third page is the last one
+
+        async def stalling_fetch(session, *, rate_limiter, offset):
+            if offset >= 15:
+                await asyncio.sleep(10)
+                raise ConnectionError('boom')
+            return await self.fake_fetch_page_json(session, rate_limiter=rate_limiter, offset=offset)
+        self.sample_client._fetch_page_json = stalling_fetch
+        started_at = perf_counter()
+        pages = self.get_pages_jsons()
+        self.assertEqual(list(range(self.total_items)), self.get_ids(pages))
+        self.assertLess(perf_counter() - started_at, 1)
+
+
+class TestBaseClientStreaming(OfflineClientTestCase):
+
+    total_items = 48
+
+    def collect(self, async_iterable, stop_after: int = None, consumer_delay: float = 0) -> list:
+        async def consume():
+            results = list()
+            async for result in async_iterable:
+                results.append(result)
+                await asyncio.sleep(consumer_delay)
+                if stop_after and len(results) >= stop_after:
+                    break
+            return results
+        return asyncio.run(consume())
+
+    def test_aiter_pages_yields_parsed_pages_in_offset_order(self):
+        pages = self.collect(self.sample_client.aiter_pages())
+        self.assertEqual(10, len(pages))
+        self.assertTrue(all(isinstance(e, EventResponse) for page in pages for e in page))
+        self.assertEqual([str(i) for i in range(self.total_items)], [e.id for page in pages for e in page])
+
+    def test_aiter_items_yields_parsed_items(self):
+        items = self.collect(self.sample_client.aiter_items())
+        self.assertEqual([str(i) for i in range(self.total_items)], [e.id for e in items])
+
+    def test_aiter_pages_fetcher_does_not_run_ahead_of_a_slow_consumer(self):
+        prefetch = 1
+        self.collect(self.sample_client.aiter_pages(prefetch=prefetch), stop_after=2, consumer_delay=0.1)
+        max_pages_ahead = 2 + prefetch + self.sample_client._concurrency_limit
+        self.assertLessEqual(len(self.requested_offsets), max_pages_ahead)
+
+    def test_aiter_items_stops_fetching_when_the_consumer_stops(self):
+        self.total_items = 10_000
+        self.collect(self.sample_client.aiter_items(prefetch=1), stop_after=3)
+        requested = len(self.requested_offsets)
+        self.assertLessEqual(requested, 1 + 1 + self.sample_client._concurrency_limit)
+
+    def test_aiter_pages_propagates_fetch_errors(self):
+        self.sample_client._fetch_page_json = self.failing_fetch_page_json
+        self.assertRaises(ConnectionError, self.collect, self.sample_client.aiter_pages())
+
+
+class TestBaseClientSyncStreaming(OfflineClientTestCase):
+
+    total_items = 48
+
+    def test_iter_items_yields_parsed_items_in_offset_order(self):
+        items = list(self.sample_client.iter_items())
+        self.assertEqual([str(i) for i in range(self.total_items)], [e.id for e in items])
+
+    def test_iter_pages_yields_the_first_page_before_the_crawl_is_over(self):
+        self.total_items = 10_000
+        pages = self.sample_client.iter_pages(prefetch=1)
+        first_page = next(pages)
+        self.assertEqual(5, len(first_page))
+        self.assertLess(len(self.requested_offsets), self.total_items // 5)
+        pages.close()
+
+    def test_iter_items_stops_the_event_loop_thread_when_the_consumer_stops(self):
+        self.total_items = 10_000
+        threads_before = threading.active_count()
+        for i, _ in enumerate(self.sample_client.iter_items(prefetch=1)):
+            if i == 7:
+                break
+        self.assertEqual(threads_before, threading.active_count())
+        self.assertLessEqual(len(self.requested_offsets), 2 + 1 + self.sample_client._concurrency_limit)
+
+    def test_iter_items_propagates_fetch_errors(self):
+        self.sample_client._fetch_page_json = self.failing_fetch_page_json
+        self.assertRaises(ConnectionError, list, self.sample_client.iter_items())
+
+
+class TestBaseClientCheckpoints(OfflineClientTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.checkpoint_dir = TemporaryDirectory()
+        self.addCleanup(self.checkpoint_dir.cleanup)
+        self.failing_offsets = set()
+
+    async def fake_fetch_page_json(self, session, *, rate_limiter, offset: int) -> dict:
+        if offset in self.failing_offsets:
+            raise ConnectionError(f'Injected failure at {offset=}')
+        return await super().fake_fetch_page_json(session, rate_limiter=rate_limiter, offset=offset)
+
+    def mk_client(self, **client_params_kwargs) -> EventsEndpoint:
+        client_params = ClientParams(limit=5, page_size=5, checkpoint_dir=self.checkpoint_dir.name, **client_params_kwargs)
+        client = EventsEndpoint(client_params=client_params)
+        client._fetch_page_json = self.fake_fetch_page_json
+        return client
+
+    def test_resumed_crawl_does_not_refetch_checkpointed_pages(self):
+        for concurrent_pagination in (True, False):
+            with self.subTest(concurrent_pagination=concurrent_pagination):
+                self.failing_offsets = {15}
+                self.assertRaises(ConnectionError, self.mk_client(concurrent_pagination=concurrent_pagination).get_parsed_pages)
+
+                self.failing_offsets, self.requested_offsets = set(), list()
+                events = self.mk_client(concurrent_pagination=concurrent_pagination, resume=True).get_parsed_pages()
+                self.assertEqual(list(range(self.total_items)), sorted(int(e.id) for e in events))
+                self.assertNotIn(0, self.requested_offsets)
+                self.assertIn(15, self.requested_offsets)
+
+    def test_complete_crawl_is_resumed_without_requests(self):
+        self.mk_client().get_parsed_pages()
+        self.requested_offsets = list()
+        events = self.mk_client(resume=True).get_parsed_pages()
+        self.assertEqual(self.total_items, len(events))
+        self.assertEqual([], self.requested_offsets)
+
+    def test_crawl_restarts_from_scratch_without_resume(self):
+        self.mk_client().get_parsed_pages()
+        self.requested_offsets = list()
+        self.mk_client().get_parsed_pages()
+        self.assertIn(0, self.requested_offsets)
+
+    def test_resumed_max_pages_counts_checkpointed_pages(self):
+        self.failing_offsets = {10}
+        self.assertRaises(ConnectionError, self.mk_client(max_pages=3, concurrent_pagination=False).get_parsed_pages)
+        self.failing_offsets = set()
+        events = self.mk_client(max_pages=3, concurrent_pagination=False, resume=True).get_parsed_pages()
+        self.assertEqual(15, len(events))
+
+    def test_crawl_interrupted_after_its_last_page_is_resumed_without_requests(self):
+        with patch.object(CrawlCheckpoint, 'mark_complete', side_effect=ConnectionError('Injected crash')):
+            self.assertRaises(ConnectionError, self.mk_client(max_pages=3, concurrent_pagination=False).get_parsed_pages)
+        self.requested_offsets = list()
+        events = self.mk_client(max_pages=3, concurrent_pagination=False, resume=True).get_parsed_pages()
+        self.assertEqual(15, len(events))
+        self.assertEqual([], self.requested_offsets)
+
+    def test_other_queries_do_not_resume_the_checkpoint(self):
+        self.mk_client().get_parsed_pages()
+        self.requested_offsets = list()
+        client = self.mk_client(resume=True)
+        client.event_type = EventType.TRANSFER
+        client.get_parsed_pages()
+        self.assertIn(0, self.requested_offsets)
+
+    def test_resume_requires_a_checkpoint_dir(self):
+        self.assertRaises(ValueError, ClientParams, resume=True)
+
+
+class TestBaseClientBatching(TestCase):
+    """Runs the assets and orders endpoints offline, against a fake page fetcher serving the requested token ids."""
+
+    token_ids = list(reversed(range(70)))
+
+    def setUp(self) -> None:
+        self.requests = list()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def mk_client(self, endpoint_type, **client_params_kwargs):
+        client_params = ClientParams(**dict(limit=50, page_size=50) | client_params_kwargs)
+        client = endpoint_type(client_params=client_params, asset_contract_address=SAMPLE_CONTRACT,
+                               token_ids=self.token_ids)
+        client._fetch_page_json = partial(self.fake_fetch_page_json, client._json_resp_key)
+        return client
+
+    async def fake_fetch_page_json(self, json_resp_key: str, session, *, rate_limiter, offset: int,
+                                   extra_params: dict) -> dict:
+        """Serves the items of the requested token ids by ascending token id, like the API does by default."""
+        token_ids = sorted(extra_params['token_ids'])
+        self.requests.append((offset, token_ids))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if json_resp_key == 'assets':
+            items = mk_assets_page(token_ids)['assets']
+        else:  # two orders per token
+            items = [mk_order_json(seed) for token_id in token_ids for seed in (token_id, token_id + 10_000)]
+        return {json_resp_key: items[offset:offset + 50]}
+
+    @staticmethod
+    def get_token_ids(client) -> list[int]:
+        items = client.get_parsed_pages()
+        return [int(item.token_id if isinstance(item, AssetResponse) else item.asset.token_id) for item in items]
+
+    def test_token_ids_are_split_into_batches_crawled_concurrently(self):
+        self.get_token_ids(self.mk_client(AssetsEndpoint))
+        self.assertEqual([30, 30, 10], [len(token_ids) for _, token_ids in self.requests])
+        self.assertEqual(sorted(self.token_ids), sorted(chain.from_iterable(ids for _, ids in self.requests)))
+        self.assertGreater(self.max_in_flight, 1)
+
+    def test_items_follow_the_requested_token_order(self):
+        self.assertEqual(self.token_ids, self.get_token_ids(self.mk_client(AssetsEndpoint)))
+
+    def test_every_page_of_each_batch_is_fetched(self):
+        token_ids = self.get_token_ids(self.mk_client(OrdersEndpoint))
+        self.assertEqual([token_id for token_id in self.token_ids for _ in range(2)], token_ids)
+        self.assertEqual([0, 0, 0, 50, 50], sorted(offset for offset, _ in self.requests))
+
+    def test_short_token_id_lists_are_not_batched(self):
+        self.token_ids = self.token_ids[:30]
+        self.assertIsNone(self.mk_client(AssetsEndpoint)._param_batches)
+
+    def test_batched_crawls_cannot_be_checkpointed(self):
+        with TemporaryDirectory() as checkpoint_dir:
+            client = self.mk_client(AssetsEndpoint, checkpoint_dir=checkpoint_dir)
+            self.assertRaises(ValueError, client.get_parsed_pages)
+
+    def test_batched_crawls_reject_the_params_of_the_whole_result(self):
+        for client in (self.mk_client(AssetsEndpoint, offset=50), self.mk_client(OrdersEndpoint, max_pages=1)):
+            with self.subTest(client_params=client.client_params):
+                self.assertRaisesRegex(ValueError, 'offset|max_pages', client.get_parsed_pages)
+        client = self.mk_client(AssetsEndpoint)
+        client.order_by = AssetsOrderBy.SALE_PRICE
+        self.assertRaisesRegex(ValueError, 'order_by', client.get_parsed_pages)
+        self.assertEqual(list(), self.requests)
+
+
+class TestBaseClientParsing(OfflineClientTestCase):
+
+    total_items = 1000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.sample_client.client_params = ClientParams(limit=50, page_size=50)
+        self.parsed_items = 0
+
+        def counting_response_type(_json: dict) -> EventResponse:
+            self.parsed_items += 1
+            return EventResponse(_json)
+        self.sample_client._response_type = counting_response_type
+
+    def test_each_page_is_parsed_exactly_once(self):
+        for get_results in (self.sample_client.get_parsed_pages, lambda: list(self.sample_client.iter_items())):
+            with self.subTest(get_results=get_results):
+                self.parsed_items = 0
+                self.sample_client.client_params = ClientParams(limit=50, page_size=50)
+                results = get_results()
+                self.assertEqual(self.total_items, len(results))
+                parse_count_per_page = self.parsed_items / len(results)
+                self.assertEqual(1, parse_count_per_page)
+
+    def test_sequential_pagination_parses_each_page_exactly_once(self):
+        self.sample_client.client_params.concurrent_pagination = False
+        results = self.sample_client.get_parsed_pages()
+        self.assertEqual(self.total_items, self.parsed_items)
+        self.assertEqual(self.total_items, len(results))
+
+    def test_last_page_is_detected_without_parsing(self):
+        self.assertTrue(self.sample_client._is_last_page({'asset_events': [{'id': 1}]}))
+        self.assertFalse(self.sample_client._is_last_page({'asset_events': [{'id': i} for i in range(50)]}))
+        self.assertEqual(0, self.parsed_items)
+
+    def test_last_page_is_detected_from_the_next_cursor_when_present(self):
+        full_page = [{'id': i} for i in range(50)]
+        self.assertTrue(self.sample_client._is_last_page({'asset_events': full_page, 'next': None}))
+        self.assertFalse(self.sample_client._is_last_page({'asset_events': full_page[:3], 'next': 'cursor'}))
+
+    @skipIf(find_spec('numpy') is None, 'numpy is not installed')
+    def test_columnar_export_does_not_parse_response_objects(self):
+        columns = self.sample_client.to_columns()
+        self.assertEqual(0, self.parsed_items)
+        self.assertEqual(list(range(self.total_items)), sorted(columns['id'].tolist()))
+        self.assertEqual(set(self.sample_client._columns), set(columns))
+
+    @skipIf(find_spec('numpy') is None, 'numpy is not installed')
+    def test_columnar_export_of_selected_columns(self):
+        columns = self.sample_client.to_columns(columns=dict(price=Column('total_price', ColumnKind.WEI)))
+        self.assertEqual(['price'], list(columns))
+        self.assertEqual(self.total_items, len(columns['price']))
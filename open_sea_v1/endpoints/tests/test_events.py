@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
+from tempfile import TemporaryDirectory
 
 from open_sea_v1.endpoints.client import ClientParams
 from open_sea_v1.endpoints.events import EventsEndpoint, EventType, AuctionType
-from open_sea_v1.helpers.testing_class import QueryTestCase
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.testing_class import LocalServerTestCase, QueryTestCase
 
 
 class TestEventsEndpoint(QueryTestCase):
@@ -103,4 +105,97 @@ class TestEventsEndpoint(QueryTestCase):
         updated_kwargs = self.events_default_kwargs | kwargs
         events = self.create_and_get(**updated_kwargs)
         transaction_datetimes = [datetime.fromisoformat(event.transaction['timestamp']) for event in events]
-        self.assertTrue(all(occurred_after <= trans_date <= occurred_before for trans_date in transaction_datetimes))
\ No newline at end of file
+        self.assertTrue(all(occurred_after <= trans_date <= occurred_before for trans_date in transaction_datetimes))
+
+
+class TestEventsEndpointTimeSlicing(LocalServerTestCase):
+    """Against a local server holding one event per minute from 2021-08-01, which rejects offsets over 200."""
+    total_events = 600
+    occurred_after = datetime(2021, 7, 31, 23)
+    occurred_before = datetime(2021, 8, 1, 11)  # split in 4 windows, whose boundaries fall on events
+    server_kwargs = dict(total_items=total_events, max_offset=200)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.session = OpenSeaSession(rate_limit=200, concurrency_limit=4)
+        self.session.open()
+        self.addCleanup(self.session.close)
+
+    def mk_endpoint(self, **kwargs) -> EventsEndpoint:
+        return EventsEndpoint(client_params=ClientParams(limit=50, page_size=50), session=self.session,
+                              occurred_after=self.occurred_after, occurred_before=self.occurred_before, **kwargs)
+
+    def test_offset_pagination_of_the_whole_range_reaches_the_offset_cap(self):
+        self.assertRaises(ConnectionError, self.mk_endpoint().get_parsed_pages)
+
+    def test_full_windows_are_bisected_until_every_event_is_crawled(self):
+        events = self.mk_endpoint().get_time_sliced_events(slices=4, min_window=timedelta(minutes=10))
+        self.assertEqual(list(reversed(range(self.total_events))), [int(event.id) for event in events])
+
+    def test_windows_shorter_than_min_window_are_paginated_by_offset(self):
+        events = self.mk_endpoint().get_time_sliced_events(slices=4, min_window=timedelta(hours=4), newest_first=False)
+        self.assertEqual(list(range(self.total_events)), [int(event.id) for event in events])
+        self.assertEqual(14, self.server.served_requests)  # 3 or 4 pages for each window of 119 to 180 events
+
+    def test_time_sliced_crawls_require_both_bounds(self):
+        endpoint = EventsEndpoint(client_params=ClientParams(), occurred_after=self.occurred_after)
+        self.assertRaises(ValueError, endpoint.get_time_sliced_events)
+
+
+class TestEventsEndpointIncrementalSync(LocalServerTestCase):
+    """Against a local server serving one event per minute from 2021-08-01, newest first, whose events are added to."""
+    server_kwargs = dict(total_items=0, newest_first=True)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.server.total_items = 120
+        self.watermarks_dir = TemporaryDirectory()
+        self.addCleanup(self.watermarks_dir.cleanup)
+        self.session = OpenSeaSession(rate_limit=200, concurrency_limit=4)
+        self.session.open()
+        self.addCleanup(self.session.close)
+
+    def sync(self, **kwargs) -> list[int]:
+        self.server.reset()
+        endpoint = EventsEndpoint(client_params=ClientParams(limit=50, page_size=50), session=self.session, **kwargs)
+        return [int(event.id) for event in endpoint.get_new_events(self.watermarks_dir.name)]
+
+    def test_first_sync_returns_every_event(self):
+        self.assertEqual(list(reversed(range(120))), self.sync())
+        self.assertEqual(3, self.server.served_requests)
+
+    def test_sync_without_new_events_costs_a_single_request(self):
+        self.sync()
+        self.assertEqual(list(), self.sync())
+        self.assertEqual(1, self.server.served_requests)
+
+    def test_syncs_return_only_the_new_events(self):
+        self.sync()
+        self.server.total_items = 125
+        self.assertEqual([124, 123, 122, 121, 120], self.sync())
+        self.assertEqual(1, self.server.served_requests)
+
+        self.server.total_items = 260
+        self.assertEqual(list(reversed(range(125, 260))), self.sync())
+        self.assertEqual(3, self.server.served_requests)  # pagination stops at the page holding the watermark
+
+    def test_events_added_during_a_sync_are_returned_once(self):
+        endpoint = EventsEndpoint(client_params=ClientParams(limit=50, page_size=50), session=self.session)
+        fetch_page_json = endpoint._fetch_page_json
+
+        async def fetch_page_json_then_add_events(*args, **kwargs):
+            json_resp = await fetch_page_json(*args, **kwargs)
+            self.server.total_items += 10  # shifts the next pages, which repeat the end of this one
+            return json_resp
+        endpoint._fetch_page_json = fetch_page_json_then_add_events
+        self.assertEqual(list(reversed(range(120))),
+                         [int(event.id) for event in endpoint.get_new_events(self.watermarks_dir.name)])
+        self.assertEqual(list(reversed(range(120, 150))), self.sync())
+
+    def test_each_query_has_its_own_watermark(self):
+        self.sync(event_type=EventType.SUCCESSFUL)
+        self.assertEqual(120, len(self.sync(event_type=EventType.TRANSFER)))
+        self.assertEqual(list(), self.sync(event_type=EventType.SUCCESSFUL))
+
+    def test_first_sync_starts_from_occurred_after(self):
+        self.assertEqual([119, 118], self.sync(occurred_after=datetime(2021, 8, 1, 1, 57, 30)))
@@ -0,0 +1,113 @@
+import asyncio
+from itertools import chain
+
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.instrumentation import MetricsHooks
+from open_sea_v1.helpers.response_cache import ResponseCache
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+
+
+class TestOpenSeaSession(LocalServerTestCase):
+
+    @staticmethod
+    def mk_endpoint(session: OpenSeaSession = None) -> EventsEndpoint:
+        return EventsEndpoint(client_params=ClientParams(limit=5, page_size=5), session=session)
+
+    @staticmethod
+    def mk_sequential_endpoint(session: OpenSeaSession) -> EventsEndpoint:
+        client_params = ClientParams(limit=5, page_size=5, concurrent_pagination=False)
+        return EventsEndpoint(client_params=client_params, session=session)
+
+    def test_endpoints_sharing_a_session_reuse_its_connections(self):
+        with OpenSeaSession(rate_limit=100, concurrency_limit=2) as session:
+            for _ in range(5):
+                events = self.mk_endpoint(session).get_parsed_pages()
+                self.assertEqual(12, len(events))
+        self.assertLessEqual(len(self.server.client_ports), 2)
+
+    def test_endpoints_without_a_session_open_new_connections_for_each_call(self):
+        for _ in range(3):
+            self.mk_endpoint().get_parsed_pages()
+        self.assertGreaterEqual(len(self.server.client_ports), 3)
+
+    def test_session_is_closed_on_exit(self):
+        with OpenSeaSession(rate_limit=100) as session:
+            self.assertTrue(session.is_open)
+            http_session = session.http_session
+        self.assertTrue(http_session.closed)
+        self.assertFalse(session.is_open)
+
+    def test_iter_items_runs_on_the_session_event_loop(self):
+        with OpenSeaSession(rate_limit=100) as session:
+            events = list(self.mk_endpoint(session).iter_items())
+            self.assertEqual(12, len(events))
+            self.assertTrue(session.is_open)
+
+    def test_async_context_manager_shares_the_session_between_async_calls(self):
+        async def crawl_twice() -> list:
+            async with OpenSeaSession(rate_limit=100, concurrency_limit=2) as session:
+                return [[e async for e in self.mk_endpoint(session).aiter_items()] for _ in range(2)]
+        crawls = asyncio.run(crawl_twice())
+        self.assertEqual([12, 12], [len(events) for events in crawls])
+        self.assertLessEqual(len(self.server.client_ports), 2)
+
+    def test_sync_calls_raise_if_the_session_was_opened_asynchronously(self):
+        async def call_sync_method():
+            async with OpenSeaSession(rate_limit=100) as session:
+                self.mk_endpoint(session).get_parsed_pages()
+        self.assertRaises(RuntimeError, asyncio.run, call_sync_method())
+
+    def test_identical_crawls_in_flight_are_coalesced(self):
+        async def crawl_concurrently(session: OpenSeaSession) -> list:
+            return await asyncio.gather(*(self.mk_sequential_endpoint(session)._aget_parsed_pages() for _ in range(5)))
+
+        with OpenSeaSession(rate_limit=100) as session:
+            crawls = session.run(crawl_concurrently(session))
+            self.assertEqual(4, session.single_flight.joined_calls)
+        self.assertTrue(all(len(list(chain.from_iterable(pages))) == 12 for pages in crawls))
+        self.assertEqual(3, self.server.served_requests)
+
+    def test_identical_requests_in_flight_are_coalesced(self):
+        async def stream_concurrently() -> list:
+            async with OpenSeaSession(rate_limit=100) as session:
+                async def stream() -> list:
+                    return [event async for event in self.mk_sequential_endpoint(session).aiter_items()]
+                return await asyncio.gather(stream(), stream())
+
+        self.assertEqual([12, 12], [len(events) for events in asyncio.run(stream_concurrently())])
+        self.assertEqual(3, self.server.served_requests)
+
+    def test_crawls_are_not_coalesced_with_those_of_endpoints_with_other_hooks(self):
+        async def crawl_concurrently(session: OpenSeaSession) -> list:
+            endpoints = [self.mk_sequential_endpoint(session) for _ in range(2)]
+            endpoints[1].client_params.hooks = MetricsHooks()
+            return await asyncio.gather(*(endpoint._aget_parsed_pages() for endpoint in endpoints))
+
+        with OpenSeaSession(rate_limit=100) as session:
+            session.run(crawl_concurrently(session))
+            self.assertEqual(0, session.single_flight.joined_calls)
+        self.assertEqual(6, self.server.served_requests)
+
+    def test_requests_are_not_coalesced_with_those_of_endpoints_with_another_response_cache(self):
+        async def stream_concurrently() -> list:
+            async with OpenSeaSession(rate_limit=100) as session:
+                async def stream(response_cache: ResponseCache = None) -> list:
+                    endpoint = self.mk_sequential_endpoint(session)
+                    endpoint.client_params.response_cache = response_cache
+                    return [event async for event in endpoint.aiter_items()]
+                return await asyncio.gather(stream(), stream(ResponseCache()))
+
+        self.assertEqual([12, 12], [len(events) for events in asyncio.run(stream_concurrently())])
+        self.assertEqual(6, self.server.served_requests)
+
+    def test_requests_are_not_coalesced_if_disabled(self):
+        async def stream_concurrently() -> list:
+            async with OpenSeaSession(rate_limit=100, coalesce_requests=False) as session:
+                async def stream() -> list:
+                    return [event async for event in self.mk_sequential_endpoint(session).aiter_items()]
+                return await asyncio.gather(stream(), stream())
+
+        asyncio.run(stream_concurrently())
+        self.assertEqual(6, self.server.served_requests)
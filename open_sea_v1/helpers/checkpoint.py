@@ -0,0 +1,132 @@
+"""
+Checkpoints of crawls, persisted in a local directory so that a crawl which crashed can be resumed without refetching,
+and watermarks of incremental syncs, so that each sync only fetches the events which are new since the previous one.
+"""
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from open_sea_v1.helpers.json_backend import get_json_backend
+
+
+class CrawlCheckpoint:
+    """
+    Pages fetched by a crawl, and the cursor of the next page to fetch, stored in one directory per query:
+        state.json: the cursor (next_offset, remaining max_pages), the number of pages fetched, and whether the crawl is complete.
+        page-000001.json...: the raw JSON pages, as received from OpenSea.
+    The state is only updated once its pages are written, and is replaced atomically,
+    so the checkpoint stays consistent whenever the process is interrupted.
+    """
+    state_filename = 'state.json'
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.state: Optional[dict] = self._read_state()
+
+    @classmethod
+    def for_query(cls, root_directory: Union[str, Path], query: dict) -> 'CrawlCheckpoint':
+        """The checkpoint of the query, in a subdirectory of root_directory named after a hash of the query."""
+        return cls(Path(root_directory) / _query_hash(query))
+
+    @property
+    def exists(self) -> bool:
+        return self.state is not None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.exists and self.state['complete']
+
+    @property
+    def pages_count(self) -> int:
+        return self.state['pages'] if self.exists else 0
+
+    def iter_pages(self) -> Iterator[Union[dict, list]]:
+        loads = get_json_backend().loads
+        for page_number in range(1, self.pages_count + 1):
+            yield loads(self._page_path(page_number).read_bytes())
+
+    def save_page(self, json_resp: Union[dict, list], *, next_offset: int, max_pages: Optional[int]) -> None:
+        page_number = self.pages_count + 1
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._page_path(page_number).write_text(get_json_backend().dumps(json_resp))
+        self._write_state(dict(pages=page_number, next_offset=next_offset, max_pages=max_pages, complete=False))
+
+    def mark_complete(self) -> None:
+        if not self.exists:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write_state(dict(pages=0, next_offset=None, max_pages=None, complete=True))
+            return
+        self._write_state({**self.state, 'complete': True})
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.state = None
+
+    def _page_path(self, page_number: int) -> Path:
+        return self.directory / f'page-{page_number:06d}.json'
+
+    def _read_state(self) -> Optional[dict]:
+        try:
+            return get_json_backend().loads((self.directory / self.state_filename).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def _write_state(self, state: dict[str, Any]) -> None:
+        _write_json_atomically(self.directory / self.state_filename, state)
+        self.state = state
+
+
+class SyncWatermark:
+    """
+    Latest event seen by the incremental syncs of a query: its created_date,
+    and the ids of the events seen at that date, as several events may share it.
+    Stored in one JSON file per query, which is replaced atomically.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        try:
+            state = get_json_backend().loads(self.path.read_bytes())
+        except FileNotFoundError:
+            state = dict(created_date=None, ids=list())
+        self.created_date: Optional[str] = state['created_date']
+        self.ids: set = set(state['ids'])
+
+    @classmethod
+    def for_query(cls, root_directory: Union[str, Path], query: dict) -> 'SyncWatermark':
+        """The watermark of the query, in root_directory, in a file named after a hash of the query."""
+        return cls(Path(root_directory) / f'{_query_hash(query)}.watermark.json')
+
+    def is_seen(self, json_event: dict) -> bool:
+        """Whether the raw event is older than the watermark, or is one of the events at the watermark."""
+        if self.created_date is None:
+            return False
+        created_date = json_event['created_date']
+        return created_date < self.created_date or (created_date == self.created_date and json_event['id'] in self.ids)
+
+    def advance(self, json_events: Iterable[dict]) -> None:
+        """Moves the watermark to the latest of the raw events, if it is more recent."""
+        for json_event in json_events:
+            created_date = json_event['created_date']
+            if self.created_date is None or created_date > self.created_date:
+                self.created_date, self.ids = created_date, set()
+            if created_date == self.created_date:
+                self.ids.add(json_event['id'])
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomically(self.path, dict(created_date=self.created_date, ids=sorted(self.ids)))
+
+
+def _query_hash(query: dict) -> str:
+    encoded_query = json.dumps(query, sort_keys=True, default=str)
+    return hashlib.sha256(encoded_query.encode()).hexdigest()[:32]
+
+
+def _write_json_atomically(path: Path, content: Any) -> None:
+    temporary_path = path.with_name(f'{path.name}.tmp')
+    temporary_path.write_text(get_json_backend().dumps(content))
+    os.replace(temporary_path, path)
@@ -0,0 +1,119 @@
+"""
+Columnar export of raw OpenSea JSON elements, without building a response object per element.
+NumPy, pandas and pyarrow are optional dependencies: each one is only imported by the export which needs it.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+from open_sea_v1.helpers.ether_converter import to_exact_int
+from open_sea_v1.helpers.extended_classes import ExtendedStrEnum
+
+ADDRESS_WIDTH = 42  # '0x' followed by 40 hexadecimal characters
+WEI_DECIMAL_PRECISION = 38  # largest decimal128 precision, about 10^20 ether
+
+
+class ColumnKind(ExtendedStrEnum):
+    """
+    How the values of a column are typed once exported.
+    WEI values are kept as exact integers: Python ints in NumPy and pandas, decimal128 in Arrow.
+    INT and FLOAT columns containing missing values are exported as float64 with NaN to NumPy and pandas.
+    """
+    STR = 'str'
+    INT = 'int'
+    FLOAT = 'float'
+    BOOL = 'bool'
+    WEI = 'wei'
+    DATETIME = 'datetime'
+    ADDRESS = 'address'
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    path:
+        Dotted path of the value inside a JSON element, for instance 'asset.token_id'.
+        The value is missing (None) if any key of the path is missing.
+    """
+    path: str
+    kind: ColumnKind = ColumnKind.STR
+
+
+class ColumnarExtractor:
+    """Accumulates the values of the selected columns, page after page of raw JSON elements."""
+
+    def __init__(self, columns: dict[str, Column]):
+        if not columns:
+            raise ValueError('At least one column must be selected.')
+        self.columns = columns
+        self.values: dict[str, list] = {name: list() for name in columns}
+        self._paths = [(self.values[name], tuple(column.path.split('.'))) for name, column in columns.items()]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.values.values())))
+
+    def extend(self, json_items: Iterable[dict]) -> None:
+        for item in json_items:
+            for column_values, keys in self._paths:
+                value = item
+                for key in keys:
+                    value = value.get(key) if isinstance(value, dict) else None
+                column_values.append(value)
+
+    def to_numpy(self) -> dict[str, Any]:
+        import numpy as np
+        return {name: _to_numpy_array(np, self.values[name], column.kind) for name, column in self.columns.items()}
+
+    def to_pandas(self) -> Any:
+        import pandas as pd
+        return pd.DataFrame(self.to_numpy(), columns=list(self.columns))
+
+    def to_arrow(self) -> Any:
+        import pyarrow as pa
+        arrays = [_to_arrow_array(pa, self.values[name], column.kind) for name, column in self.columns.items()]
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+
+def to_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Naive UTC datetime of an ISO 8601 timestamp. Timestamps without offset, as OpenSea sends them, are UTC."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _to_numpy_array(np, values: list, kind: ColumnKind):
+    has_missing_values = any(v is None for v in values)
+    if kind == ColumnKind.WEI:
+        return np.array([to_exact_int(v) for v in values], dtype=object)
+    if kind == ColumnKind.DATETIME:
+        return np.array([to_datetime(v) or 'NaT' for v in values], dtype='datetime64[us]')
+    if kind == ColumnKind.ADDRESS:
+        return np.array([(v or '').encode() for v in values], dtype=f'S{ADDRESS_WIDTH}')
+    if kind == ColumnKind.INT and not has_missing_values:
+        return np.array([int(v) for v in values], dtype=np.int64)
+    if kind in (ColumnKind.INT, ColumnKind.FLOAT):
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+    if kind == ColumnKind.BOOL and not has_missing_values:
+        return np.array(values, dtype=bool)
+    return np.array(values, dtype=object)
+
+
+def _to_arrow_array(pa, values: list, kind: ColumnKind):
+    if kind == ColumnKind.WEI:
+        wei_values = [None if (wei := to_exact_int(v)) is None else Decimal(wei) for v in values]
+        return pa.array(wei_values, type=pa.decimal128(WEI_DECIMAL_PRECISION, 0))
+    if kind == ColumnKind.DATETIME:
+        return pa.array([to_datetime(v) for v in values], type=pa.timestamp('us'))
+    if kind == ColumnKind.ADDRESS:
+        return pa.array([None if v is None else v.encode() for v in values], type=pa.binary(ADDRESS_WIDTH))
+    if kind == ColumnKind.INT:
+        return pa.array([None if v is None else int(v) for v in values], type=pa.int64())
+    if kind == ColumnKind.FLOAT:
+        return pa.array([None if v is None else float(v) for v in values], type=pa.float64())
+    if kind == ColumnKind.BOOL:
+        return pa.array(values, type=pa.bool_())
+    return pa.array([None if v is None else str(v) for v in values], type=pa.string())
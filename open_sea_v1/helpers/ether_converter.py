@@ -1,6 +1,11 @@
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from decimal import Context, Decimal
 from enum import IntEnum
-from typing import Union
+from typing import Any, Optional, Sequence, Union
+
+# Wide enough for any uint256 wei amount, so that Decimal operations are never rounded.
+_EXACT_CONTEXT = Context(prec=100)
 
 
 class EtherUnit(IntEnum):
@@ -16,24 +21,17 @@ class EtherUnit(IntEnum):
     PWEI = 1_000_000_000_000_000
     ETHER = 1_000_000_000_000_000_000
 
+    @property
+    def exponent(self) -> int:
+        return len(str(self.value)) - 1
 
-@dataclass
-class EtherConverter:
-    """
-    Convenience class that helps convert Ether and its sub-units (gwei, twei etc.) into other sub-units.
-    """
-
-    quantity: Union[str, int, float]
-    unit: EtherUnit
 
-    def __post_init__(self):
-        if isinstance(self.quantity, str):
-            self.quantity = float(self.quantity)
+class _EtherUnits(ABC):
+    """The quantities in each unit, all converted by convert_to()."""
 
-    def convert_to(self, unit: EtherUnit) -> float:
-        if unit == self.unit:
-            return self.quantity
-        return self.unit / unit * self.quantity
+    @abstractmethod
+    def convert_to(self, unit: EtherUnit):
+        """"""
 
     @property
     def ether(self):
@@ -62,3 +60,116 @@ class EtherConverter:
     @property
     def wei(self):
         return self.convert_to(EtherUnit.WEI)
+
+
+@dataclass
+class EtherConverter(_EtherUnits):
+    """
+    Convenience class that helps convert Ether and its sub-units (gwei, twei etc.) into other sub-units.
+    """
+
+    quantity: Union[str, int, float]
+    unit: EtherUnit
+
+    def __post_init__(self):
+        if isinstance(self.quantity, str):
+            self.quantity = to_exact_int(self.quantity) if _is_integer_str(self.quantity) else float(self.quantity)
+
+    def convert_to(self, unit: EtherUnit) -> float:
+        if unit == self.unit:
+            return self.quantity
+        return self.quantity * self.unit / unit  # wei amounts are only rounded once, by the true division
+
+
+@dataclass
+class EtherArrayConverter(_EtherUnits):
+    """
+    Converts many quantities of the same unit at once, for instance the total_price of every event of a crawl.
+    Quantities may be a sequence of str, int or float, or a NumPy array.
+
+    By default quantities are converted to float64 NumPy arrays with vectorized operations,
+    which round each value at most twice: when parsed, then when converted.
+    With exact=True, quantities are converted to lists of Decimal which are never rounded, for accounting.
+    Missing quantities (None or empty strings) are converted to NaN, or None with exact=True.
+    NumPy is only required when exact=False.
+    """
+
+    quantities: Union[Sequence[Union[str, int, float, None]], Any]
+    unit: EtherUnit = EtherUnit.WEI
+    exact: bool = False
+    _values: Any = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.exact:
+            self._values = [to_exact_decimal(q) for q in self.quantities]
+        else:
+            self._values = _to_float_array(self.quantities)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def convert_to(self, unit: EtherUnit) -> Union[Any, list[Optional[Decimal]]]:
+        if self.exact:
+            shift = self.unit.exponent - unit.exponent
+            return [None if d is None else d.scaleb(shift, context=_EXACT_CONTEXT) for d in self._values]
+        if unit == self.unit:
+            return self._values.copy()
+        if self.unit > unit:
+            return self._values * float(self.unit // unit)
+        return self._values / float(unit // self.unit)
+
+    def to_usd(self, usd_per_ether: Union[float, str, Sequence, Any]) -> Union[Any, list[Optional[Decimal]]]:
+        """
+        usd_per_ether:
+            Either a single ETH price, or one price per quantity, such as the payment_token.usd_price of each event.
+        """
+        ether = self.convert_to(EtherUnit.ETHER)
+        if not self.exact:
+            import numpy as np
+            return ether * np.asarray(usd_per_ether, dtype=np.float64)
+        if isinstance(usd_per_ether, (str, int, float, Decimal)):
+            usd_per_ether = [usd_per_ether] * len(ether)
+        return [
+            None if (eth is None or usd is None) else _EXACT_CONTEXT.multiply(eth, Decimal(str(usd)))
+            for eth, usd in zip(ether, usd_per_ether)
+        ]
+
+
+def wei_to_ether(wei: Union[str, int]) -> float:
+    """Converts a single wei amount, without the overhead of an EtherConverter."""
+    return to_exact_int(wei) / EtherUnit.ETHER
+
+
+def to_exact_int(value: Any) -> Optional[int]:
+    """Parses integers serialized as int, str or decimal str (for instance OpenSea order prices: '1500.000')."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        return int(Decimal(value))
+
+
+def to_exact_decimal(value: Any) -> Optional[Decimal]:
+    if hasattr(value, 'item'):  # NumPy scalars, such as the items of an int64 array
+        value = value.item()
+    if value is None or value == '':
+        return None
+    if isinstance(value, float):
+        return Decimal(str(value))  # the shortest repr, rather than the binary expansion of the float
+    return Decimal(value)
+
+
+def _is_integer_str(value: str) -> bool:
+    return value.isdigit() or (value[:1] == '-' and value[1:].isdigit())
+
+
+def _to_float_array(quantities):
+    import numpy as np
+    # NumPy parses each str with a single correct rounding, python ints beyond int64 included, and None as NaN.
+    try:
+        return np.array(quantities, dtype=np.float64)
+    except ValueError:  # empty strings
+        return np.array(['nan' if q == '' else q for q in quantities], dtype=np.float64)
@@ -0,0 +1,258 @@
+"""
+Instrumentation of the clients: hooks called with the timings of every request and the parsing of every page,
+an in-process registry of counters and histograms fed by them, and its exports to Prometheus and OpenTelemetry.
+OpenTelemetry is an optional dependency, only imported by OpenTelemetryHooks when no meter is given.
+"""
+from dataclasses import dataclass
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from aiohttp import TraceConfig
+
+
+@dataclass
+class RequestTimings:
+    """
+    Timings of one HTTP request, in seconds, from the point of view of the client.
+    Phases which did not happen are 0: connect when a kept-alive connection is reused,
+    download and decode when the request failed or was throttled.
+    """
+    endpoint: str
+    url: str
+    status: Optional[int] = None
+    queue_wait: float = 0.0
+    """Waiting for the rate limiter to let the request go."""
+    connect: float = 0.0
+    """Opening the connection: DNS resolution, TCP and TLS handshakes."""
+    ttfb: float = 0.0
+    """From the request being sent, once connected, to the headers of the response being received."""
+    download: float = 0.0
+    decode: float = 0.0
+    received_bytes: int = 0
+    error: Optional[BaseException] = None
+
+    @property
+    def phases(self) -> dict[str, float]:
+        return dict(queue_wait=self.queue_wait, connect=self.connect, ttfb=self.ttfb, download=self.download,
+                    decode=self.decode)
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+class ClientHooks:
+    """
+    Called by the clients whose client params hold them (ClientParams(hooks=...)), from their event loop.
+    Does nothing: override the methods of interest. Hooks should be quick, as they delay the crawl.
+    """
+
+    def on_request(self, timings: RequestTimings) -> None:
+        """Every request sent, whether it succeeded, failed or was throttled. Cached or replayed pages are not sent."""
+
+    def on_throttled(self, endpoint: str, url: str) -> None:
+        """A request was throttled by the server (HTTP 429), and will be sent again once the rate limiter resumes."""
+
+    def on_retry(self, endpoint: str, url: str, attempt: int, error: BaseException, delay: float) -> None:
+        """A request failed transiently on its attempt-th attempt, and will be sent again after delay seconds."""
+
+    def on_parse(self, endpoint: str, items: int, seconds: float) -> None:
+        """A page of items was parsed into response objects."""
+
+
+def mk_trace_config() -> TraceConfig:
+    """Measures the time spent opening connections, into the RequestTimings passed as trace_request_ctx."""
+    trace_config = TraceConfig()
+
+    async def on_connection_create_start(_session, context: SimpleNamespace, _params) -> None:
+        context.connect_started_at = perf_counter()
+
+    async def on_connection_create_end(_session, context: SimpleNamespace, _params) -> None:
+        if isinstance(context.trace_request_ctx, RequestTimings):
+            context.trace_request_ctx.connect += perf_counter() - context.connect_started_at
+
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+
+def _labels_key(label_names: tuple[str, ...], labels: dict[str, Any]) -> tuple[str, ...]:
+    if set(labels) != set(label_names):
+        raise ValueError(f'{labels=} must be exactly {label_names=}.')
+    return tuple(str(labels[name]) for name in label_names)
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values: dict[tuple[str, ...], float] = dict()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _labels_key(self.label_names, labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self.values.get(_labels_key(self.label_names, labels), 0)
+
+
+class Histogram:
+    """Counts of the observations by upper bound (non-cumulative), with their count and sum, per set of labels."""
+    default_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = default_buckets):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self.counts: dict[tuple[str, ...], list[int]] = dict()
+        self.sums: dict[tuple[str, ...], float] = dict()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _labels_key(self.label_names, labels)
+        counts = self.counts.setdefault(key, [0] * len(self.buckets))
+        counts[next(i for i, bound in enumerate(self.buckets) if value <= bound)] += 1
+        self.sums[key] = self.sums.get(key, 0.0) + value
+
+    def count(self, **labels) -> int:
+        return sum(self.counts.get(_labels_key(self.label_names, labels), ()))
+
+    def sum(self, **labels) -> float:
+        return self.sums.get(_labels_key(self.label_names, labels), 0.0)
+
+
+class MetricsRegistry:
+    """Counters and histograms of a process, by name, which can be exported in the Prometheus text format."""
+
+    def __init__(self):
+        self.metrics: dict[str, Any] = dict()
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = Histogram.default_buckets) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def _register(self, metric):
+        if (registered := self.metrics.get(metric.name)) is not None:
+            if type(registered) is not type(metric) or registered.label_names != metric.label_names:
+                raise ValueError(f'{metric.name} is already registered with other labels or another type.')
+            return registered
+        self.metrics[metric.name] = metric
+        return metric
+
+    def to_prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format, to be served on a /metrics route."""
+        lines = list()
+        for metric in self.metrics.values():
+            kind = 'counter' if isinstance(metric, Counter) else 'histogram'
+            lines += [f'# HELP {metric.name} {metric.documentation}', f'# TYPE {metric.name} {kind}']
+            if isinstance(metric, Counter):
+                lines += [f'{metric.name}{_prometheus_labels(metric.label_names, key)} {value}'
+                          for key, value in metric.values.items()]
+                continue
+            for key, counts in metric.counts.items():
+                cumulated = 0
+                for bound, count in zip(metric.buckets, counts):
+                    cumulated += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{metric.name}_bucket{_prometheus_labels(metric.label_names, key, le=le)} {cumulated}')
+                lines.append(f'{metric.name}_sum{_prometheus_labels(metric.label_names, key)} {metric.sums[key]}')
+                lines.append(f'{metric.name}_count{_prometheus_labels(metric.label_names, key)} {cumulated}')
+        return '\n'.join(lines) + '\n'
+
+
+def _prometheus_labels(label_names: tuple[str, ...], key: tuple[str, ...], **extra_labels: str) -> str:
+    labels = {**dict(zip(label_names, key)), **extra_labels}
+    if not labels:
+        return ''
+    escaped = {name: value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n') for name, value in labels.items()}
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped.items()) + '}'
+
+
+class MetricsHooks(ClientHooks):
+    """
+    Records the requests and the parsing of the clients into a MetricsRegistry, labelled by endpoint class name:
+        hooks = MetricsHooks()
+        EventsEndpoint(client_params=ClientParams(hooks=hooks), ...).get_parsed_pages()
+        print(hooks.registry.to_prometheus())
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.requests = self.registry.counter(
+            'opensea_requests_total', 'Requests sent, by status (error if no response was received).',
+            ('endpoint', 'status'))
+        self.received_bytes = self.registry.counter(
+            'opensea_received_bytes_total', 'Bytes of the response bodies received.', ('endpoint',))
+        self.request_phases = self.registry.histogram(
+            'opensea_request_phase_seconds', 'Time spent in each phase of the requests.', ('endpoint', 'phase'))
+        self.throttled = self.registry.counter(
+            'opensea_throttled_requests_total', 'Requests throttled by the server (HTTP 429).', ('endpoint',))
+        self.retries = self.registry.counter(
+            'opensea_retries_total', 'Requests sent again after failing transiently.', ('endpoint',))
+        self.parse_seconds = self.registry.histogram(
+            'opensea_parse_seconds', 'Time spent parsing a page into response objects.', ('endpoint',))
+        self.parsed_items = self.registry.counter(
+            'opensea_parsed_items_total', 'Items parsed into response objects.', ('endpoint',))
+
+    def on_request(self, timings: RequestTimings) -> None:
+        status = 'error' if timings.status is None else timings.status
+        self.requests.inc(endpoint=timings.endpoint, status=status)
+        self.received_bytes.inc(timings.received_bytes, endpoint=timings.endpoint)
+        for phase, seconds in timings.phases.items():
+            self.request_phases.observe(seconds, endpoint=timings.endpoint, phase=phase)
+
+    def on_throttled(self, endpoint: str, url: str) -> None:
+        self.throttled.inc(endpoint=endpoint)
+
+    def on_retry(self, endpoint: str, url: str, attempt: int, error: BaseException, delay: float) -> None:
+        self.retries.inc(endpoint=endpoint)
+
+    def on_parse(self, endpoint: str, items: int, seconds: float) -> None:
+        self.parse_seconds.observe(seconds, endpoint=endpoint)
+        self.parsed_items.inc(items, endpoint=endpoint)
+
+
+class OpenTelemetryHooks(ClientHooks):
+    """
+    Records the same metrics as MetricsHooks with OpenTelemetry instruments, exported by its configured readers.
+    Defaults to the meter of the global meter provider, which requires the opentelemetry-api package.
+    """
+
+    def __init__(self, meter: Optional[Any] = None):
+        if meter is None:
+            from opentelemetry import metrics
+            meter = metrics.get_meter('open_sea_v1')
+        self.requests = meter.create_counter('opensea.requests', description='Requests sent.')
+        self.received_bytes = meter.create_counter('opensea.received_bytes', unit='By',
+                                                   description='Bytes of the response bodies received.')
+        self.request_phases = meter.create_histogram('opensea.request.phase.duration', unit='s',
+                                                     description='Time spent in each phase of the requests.')
+        self.throttled = meter.create_counter('opensea.throttled_requests',
+                                              description='Requests throttled by the server (HTTP 429).')
+        self.retries = meter.create_counter('opensea.retries', description='Requests sent again.')
+        self.parse_duration = meter.create_histogram('opensea.parse.duration', unit='s',
+                                                     description='Time spent parsing a page into response objects.')
+        self.parsed_items = meter.create_counter('opensea.parsed_items', description='Items parsed.')
+
+    def on_request(self, timings: RequestTimings) -> None:
+        status = 'error' if timings.status is None else timings.status
+        self.requests.add(1, {'endpoint': timings.endpoint, 'status': str(status)})
+        self.received_bytes.add(timings.received_bytes, {'endpoint': timings.endpoint})
+        for phase, seconds in timings.phases.items():
+            self.request_phases.record(seconds, {'endpoint': timings.endpoint, 'phase': phase})
+
+    def on_throttled(self, endpoint: str, url: str) -> None:
+        self.throttled.add(1, {'endpoint': endpoint})
+
+    def on_retry(self, endpoint: str, url: str, attempt: int, error: BaseException, delay: float) -> None:
+        self.retries.add(1, {'endpoint': endpoint})
+
+    def on_parse(self, endpoint: str, items: int, seconds: float) -> None:
+        self.parse_duration.record(seconds, {'endpoint': endpoint})
+        self.parsed_items.add(items, {'endpoint': endpoint})
@@ -0,0 +1,72 @@
+"""
+JSON encoding and decoding, delegated to the fastest library installed.
+OpenSea pages embed whole asset, account and transaction objects for every element, so decoding them is costly.
+orjson only handles 64-bit integers and str dict keys. Documents with wider integers or other keys are encoded
+by the standard library instead, but orjson decodes integers wider than 64 bits as floats, rounding them.
+OpenSea sends wide amounts, such as wei prices, as str: set OPENSEA_JSON_BACKEND to 'ujson' or 'json'
+if the documents read, including checkpoints, cassettes and cached responses, hold wide integers.
+"""
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from os import environ
+from typing import Any, Callable, Optional, Union
+
+JSON_BACKENDS_BY_SPEED = ('orjson', 'ujson', 'json')
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], str]
+
+
+def _mk_orjson_backend() -> JsonBackend:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:  # integers wider than 64 bits, or dict keys which are not str
+            return json.dumps(obj, separators=(',', ':'))
+
+    return JsonBackend(name='orjson', loads=orjson.loads, dumps=dumps)
+
+
+def _mk_ujson_backend() -> JsonBackend:
+    import ujson
+    return JsonBackend(name='ujson', loads=ujson.loads, dumps=ujson.dumps)
+
+
+def _mk_stdlib_backend() -> JsonBackend:
+    return JsonBackend(name='json', loads=json.loads, dumps=json.dumps)
+
+
+_BACKEND_FACTORIES = dict(orjson=_mk_orjson_backend, ujson=_mk_ujson_backend, json=_mk_stdlib_backend)
+
+
+@lru_cache(maxsize=None)
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Returns the requested JSON backend: 'orjson', 'ujson' or 'json' (standard library).
+    When no name is given, uses the OPENSEA_JSON_BACKEND environment variable if it exists on the system,
+    otherwise the fastest backend installed.
+    """
+    name = name or environ.get('OPENSEA_JSON_BACKEND')
+    if name is not None:
+        if name not in _BACKEND_FACTORIES:
+            raise ValueError(f'{name=} must be one of {JSON_BACKENDS_BY_SPEED}.')
+        return _BACKEND_FACTORIES[name]()
+    return get_installed_json_backends()[0]
+
+
+def get_installed_json_backends() -> list[JsonBackend]:
+    """Installed JSON backends, fastest first."""
+    backends = list()
+    for name in JSON_BACKENDS_BY_SPEED:
+        try:
+            backends.append(_BACKEND_FACTORIES[name]())
+        except ImportError:
+            continue
+    return backends
@@ -0,0 +1,94 @@
+"""
+Querystrings of the requests, encoded as requests.PreparedRequest used to, without requests.
+The params of the pages of a query only differ by their offset: the other params are encoded once per query,
+and each page only encodes its offset.
+"""
+from functools import lru_cache
+from typing import Any, Hashable, Mapping, Optional
+from urllib.parse import urlencode, urlsplit
+
+PAGED_PARAM = 'offset'
+
+
+def encode_params(params: Mapping[str, Any]) -> str:
+    """
+    None values are left out, and lists (or any iterable but strings) repeat their key for each value which is not None.
+    Other values are encoded as their str(): booleans as True or False, datetimes as '2021-08-01 00:00:00',
+    and str enums as their value.
+    """
+    encoded_params = list()
+    for key, values in params.items():
+        if isinstance(values, (str, bytes)) or not hasattr(values, '__iter__'):
+            values = [values]
+        for value in values:
+            if value is not None:
+                encoded_params.append((_utf8(key), _utf8(value)))
+    return urlencode(encoded_params, doseq=True)
+
+
+def mk_querystring(url: str, params: Mapping[str, Any]) -> str:
+    """
+    The url with the params as querystring. The params other than the offset are encoded once,
+    and their encoding is reused by the next querystrings of the same url and params, whatever their offset.
+    """
+    offset = params.get(PAGED_PARAM)
+    if offset is None or not isinstance(offset, int) or isinstance(offset, bool):
+        return _join(url, encode_params(params))
+    try:
+        head, tail = _encoded_around_offset(url, _frozen_params(params))
+    except TypeError:  # unhashable params, such as dicts, are encoded every time
+        return _join(url, encode_params(params))
+    return _join(url, '&'.join(part for part in (head, f'{PAGED_PARAM}={offset}', tail) if part))
+
+
+@lru_cache(maxsize=1_024)
+def _encoded_around_offset(url: str, frozen_params: tuple) -> tuple[str, str]:
+    """The params encoded before the offset, and those after, so that the querystring keeps the order of the params."""
+    keys = [key for key, _ in frozen_params]
+    offset_position = keys.index(PAGED_PARAM)
+    params = {key: _thawed(frozen_value) for key, frozen_value in frozen_params if key != PAGED_PARAM}
+    return (encode_params({key: params[key] for key in keys[:offset_position]}),
+            encode_params({key: params[key] for key in keys[offset_position + 1:]}))
+
+
+def _frozen_params(params: Mapping[str, Any]) -> tuple:
+    """
+    Hashable form of the params, without the value of the offset. Values are tagged with their type,
+    as 1 and True, or 1 and 1.0, are equal and hash alike but are encoded differently.
+    """
+    frozen_params = list()
+    for key, value in params.items():
+        if key == PAGED_PARAM:
+            frozen_params.append((key, None))
+        elif isinstance(value, (list, tuple)):
+            frozen_params.append((key, (list, tuple(_tagged(item) for item in value))))
+        else:
+            frozen_params.append((key, _tagged(value)))
+    frozen = tuple(frozen_params)
+    hash(frozen)  # raises TypeError if a value is unhashable
+    return frozen
+
+
+def _tagged(value: Any) -> tuple[type, Hashable]:
+    if hasattr(value, '__iter__') and not isinstance(value, (str, bytes)):
+        raise TypeError(f'{type(value)} values are not cached, as they may be consumed or iterate in any order.')
+    return type(value), value
+
+
+def _thawed(frozen_value: Optional[tuple]) -> Any:
+    if frozen_value is None:
+        return None
+    kind, value = frozen_value
+    if kind is list:
+        return [item for _, item in value]
+    return value
+
+
+def _utf8(value: Any) -> Any:
+    return value.encode('utf-8') if isinstance(value, str) else value
+
+
+def _join(url: str, encoded_params: str) -> str:
+    if not encoded_params:
+        return url
+    return f'{url}&{encoded_params}' if urlsplit(url).query else f'{url}?{encoded_params}'
@@ -0,0 +1,248 @@
+"""
+Backends holding the schedule of the requests of a RateLimiter.
+The local backend schedules the requests of a single process. The other backends share one rate limit budget,
+for instance the budget of an API key, between every RateLimiter using the same file or Redis key:
+between processes on one host with FileLockBackend, between hosts with RedisBackend.
+"""
+import asyncio
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def gcra_reserve(theoretical_arrival_time: float, now: float, cost: float, rate: float,
+                 burst: int) -> tuple[float, float]:
+    """
+    Generic cell rate algorithm: reserves the slot of a request from the theoretical arrival time of the next request.
+    Returns the new theoretical arrival time, and the seconds to wait until the slot.
+    The cost delays the requests which follow.
+    """
+    emission_interval = 1 / rate
+    slot = max(theoretical_arrival_time, now)
+    allowed_at = slot - (burst - 1) * emission_interval
+    return slot + cost * emission_interval, max(0.0, allowed_at - now)
+
+
+class RateLimitBackend(ABC):
+    """Schedules the requests of the RateLimiter instances it is passed to."""
+
+    @abstractmethod
+    async def reserve(self, cost: float, rate: float, burst: int) -> float:
+        """
+        Reserves the next slot for a request weighing cost requests, and returns the seconds to wait until it.
+        The slot is consumed even if the caller does not wait for it.
+        """
+
+    async def close(self) -> None:
+        """Releases the connections of the backend, which are opened again if it is used afterwards."""
+
+
+class LocalBackend(RateLimitBackend):
+    """Schedules the requests of the current process only."""
+
+    def __init__(self) -> None:
+        self._theoretical_arrival_time = 0.0
+
+    async def reserve(self, cost: float, rate: float, burst: int) -> float:
+        return self.reserve_at(time.monotonic(), cost=cost, rate=rate, burst=burst)
+
+    def reserve_at(self, now: float, *, cost: float, rate: float, burst: int) -> float:
+        self._theoretical_arrival_time, delay = gcra_reserve(self._theoretical_arrival_time, now, cost, rate, burst)
+        return delay
+
+
+class FileLockBackend(RateLimitBackend):
+    """
+    Schedules the requests of every process of the host using the same file.
+    The theoretical arrival time of the next request is stored in the file, which is locked while it is updated.
+    The file operations run in the default executor of the event loop, not to block it while the file is locked.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+
+    async def reserve(self, cost: float, rate: float, burst: int) -> float:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._reserve_with_lock, cost, rate, burst)
+
+    def _reserve_with_lock(self, cost: float, rate: float, burst: int) -> float:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_file(fd)
+            try:
+                content = os.read(fd, 64)
+                theoretical_arrival_time = float(content) if content else 0.0
+                # Wall clock time, as the monotonic clocks of processes are not comparable on every platform.
+                theoretical_arrival_time, delay = gcra_reserve(theoretical_arrival_time, time.time(), cost, rate, burst)
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, repr(theoretical_arrival_time).encode())
+                return delay
+            finally:
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+
+
+def _lock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:  # LK_LOCK gives up after 10 seconds
+            continue
+
+
+def _unlock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class RedisError(ConnectionError):
+    """Error reply of a Redis server."""
+
+
+class RespConnection:
+    """Minimal client of the Redis serialization protocol (RESP), enough for the commands of RedisBackend."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> 'RespConnection':
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def execute(self, *commands: tuple) -> list:
+        """Sends the commands in a single pipeline, and returns their replies."""
+        async with self._lock:
+            try:
+                self.writer.write(b''.join(encode_resp_command(*command) for command in commands))
+                await self.writer.drain()
+                replies = [await read_resp_reply(self.reader) for _ in commands]
+            except BaseException:  # the replies left unread would be taken for those of the next commands
+                self.abort()
+                raise
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def abort(self) -> None:
+        """Closes the connection without waiting, for instance while its task is being cancelled."""
+        self.writer.close()
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def encode_resp_command(*args: Union[str, int, float, bytes]) -> bytes:
+    encoded = [arg if isinstance(arg, bytes) else str(arg).encode() for arg in args]
+    return b''.join([f'*{len(encoded)}\r\n'.encode()] + [b'$%d\r\n%s\r\n' % (len(arg), arg) for arg in encoded])
+
+
+async def read_resp_reply(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError('Connection closed by the Redis server.')
+    prefix, value = line[:1], line[1:-2]
+    if prefix == b'+':
+        return value.decode()
+    if prefix == b'-':
+        return RedisError(value.decode())
+    if prefix == b':':
+        return int(value)
+    if prefix == b'$':
+        if (length := int(value)) == -1:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b'*':
+        if (length := int(value)) == -1:
+            return None
+        return [await read_resp_reply(reader) for _ in range(length)]
+    raise ConnectionError(f'Unexpected reply from the Redis server: {line!r}')
+
+
+class RedisBackend(RateLimitBackend):
+    """
+    Schedules the requests of every host using the same Redis key.
+    The theoretical arrival time of the next request is stored in the key, and updated in an optimistic transaction
+    (WATCH, MULTI, EXEC), which is retried if another host updated the key meanwhile.
+    The clock of the Redis server is used, so the clocks of the hosts do not need to be synchronized.
+    The key expires once the schedule it holds is over.
+    """
+
+    def __init__(self, host: str = 'localhost', port: int = 6379, *, key: str = 'opensea:rate_limit',
+                 password: Optional[str] = None, db: Optional[int] = None) -> None:
+        self.host = host
+        self.port = port
+        self.key = key
+        self.password = password
+        self.db = db
+        self._connection: Optional[RespConnection] = None
+        self._lock: Optional[asyncio.Lock] = None  # created in the event loop of the first reservation
+        self._clock_offset = 0.0
+
+    async def reserve(self, cost: float, rate: float, burst: int) -> float:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:  # a transaction spans several round trips on the connection
+            connection = await self._connect()
+            try:
+                while True:
+                    _, theoretical_arrival_time = await connection.execute(('WATCH', self.key), ('GET', self.key))
+                    now = time.time() + self._clock_offset
+                    theoretical_arrival_time, delay = gcra_reserve(
+                        float(theoretical_arrival_time or 0), now, cost, rate, burst)
+                    expire_in_ms = math.ceil((theoretical_arrival_time - now) * 1_000) + 1_000
+                    *_, committed = await connection.execute(
+                        ('MULTI',), ('SET', self.key, repr(theoretical_arrival_time), 'PX', expire_in_ms), ('EXEC',))
+                    if committed is not None:
+                        return delay
+            except BaseException:  # the connection may be left watching the key or inside a transaction
+                connection.abort()
+                self._connection = None
+                raise
+
+    async def _connect(self) -> RespConnection:
+        if self._connection is None:
+            connection = await RespConnection.open(self.host, self.port)
+            try:
+                if self.password is not None:
+                    await connection.execute(('AUTH', self.password))
+                if self.db is not None:
+                    await connection.execute(('SELECT', self.db))
+                sent_at = time.time()
+                [[seconds, microseconds]] = await connection.execute(('TIME',))
+                received_at = time.time()
+            except BaseException:
+                await connection.close()
+                raise
+            server_time = int(seconds) + int(microseconds) / 1_000_000
+            self._clock_offset = server_time - (sent_at + received_at) / 2
+            self._connection = connection
+        return self._connection
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+        self._connection, self._lock = None, None
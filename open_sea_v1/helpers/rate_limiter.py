@@ -1,96 +1,174 @@
 import asyncio
+import logging
 import math
 import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Mapping, Optional
+
+from open_sea_v1.helpers.rate_limit_backends import LocalBackend, RateLimitBackend
+
+logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
     """
-    RateLimiter with concurrency limiter, using asyncio.Queue().
-    Credits: https://medium.com/analytics-vidhya/async-python-client-rate-limiter-911d7982526b
+    RateLimiter with concurrency limiter, using the generic cell rate algorithm (GCRA).
+    Instead of draining a queue of tokens with a background task, each request computes the time at which
+    it may be sent from a single timestamp, the theoretical arrival time of the next request,
+    and sleeps until then. Idle limiters never wake up, and requests are spaced precisely.
+
+    The rate adapts to the responses of the server, which are reported with on_response():
+    it increases additively while requests succeed, up to max_rate,
+    and decreases multiplicatively when the server throttles requests (HTTP 429), down to min_rate.
+    Retry-After headers, and X-RateLimit-Remaining headers reaching 0, pause every request until the server accepts them again.
+
+    The slots are reserved from a backend, which may share the rate limit budget with other processes or hosts.
+    The concurrency limit, the pauses and the adaptation of the rate remain specific to each RateLimiter.
+
+    Parameters
+    ----------
+    rate_limit:
+        Initial requests per second.
+
+    concurrency_limit:
+        Number of simultaneous requests.
+
+    burst:
+        Number of requests which may be sent at once, after the limiter has been idle. 1 spaces every request evenly.
+
+    adaptive:
+        If False, the rate stays at rate_limit, but the server pauses are still honoured.
+
+    min_rate, max_rate:
+        Bounds of the adaptive rate, in requests per second. Default to 1/4 and 3/2 of rate_limit.
+
+    additive_increase:
+        Requests per second gained after each second of successful requests.
+
+    multiplicative_decrease:
+        Factor applied to the rate when a request is throttled.
+
+    backend:
+        Defaults to a LocalBackend, for the requests of this RateLimiter only. See rate_limit_backends.
     """
+    decrease_cooldown = 1.0
+    """Seconds during which further throttled responses do not decrease the rate again, as they were already in flight."""
 
-    def __init__(self, rate_limit: int, concurrency_limit: int) -> None:
+    def __init__(self, rate_limit: int, concurrency_limit: int, *, burst: int = 1, adaptive: bool = True,
+                 min_rate: Optional[float] = None, max_rate: Optional[float] = None,
+                 additive_increase: float = 1.0, multiplicative_decrease: float = 0.5,
+                 backend: Optional[RateLimitBackend] = None) -> None:
         if not rate_limit or rate_limit < 1:
             raise ValueError('rate limit must be non zero positive number')
         if not concurrency_limit or concurrency_limit < 1:
             raise ValueError('concurrent limit must be non zero positive number')
+        if not burst or burst < 1:
+            raise ValueError('burst must be non zero positive number')
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError('multiplicative decrease must be between 0 and 1')
 
         self.rate_limit = rate_limit
-        self.tokens_queue = asyncio.Queue(rate_limit)
-        self.tokens_consumer_task = asyncio.create_task(self.consume_tokens())
+        self.burst = burst
+        self.adaptive = adaptive
+        self.min_rate = min_rate or rate_limit / 4
+        self.max_rate = max_rate or rate_limit * 1.5
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self._current_rate = float(rate_limit)
+        self.paused_until = 0.0
+        self.throttled_responses = 0
+        self._last_decrease_at = -math.inf
+        self.backend = backend or LocalBackend()
         self.semaphore = asyncio.Semaphore(concurrency_limit)
 
-    async def add_token(self) -> None:
-        await self.tokens_queue.put(1)
-        return None
-
-    async def consume_tokens(self):
-        try:
-            consumption_rate = 1 / self.rate_limit
-            last_consumption_time = 0
-
-            while True:
-                if self.tokens_queue.empty():
-                    await asyncio.sleep(consumption_rate)
-                    continue
-
-                current_consumption_time = time.monotonic()
-                total_tokens = self.tokens_queue.qsize()
-                tokens_to_consume = self.get_tokens_amount_to_consume(
-                    consumption_rate,
-                    current_consumption_time,
-                    last_consumption_time,
-                    total_tokens
-                )
-
-                for i in range(0, tokens_to_consume):
-                    self.tokens_queue.get_nowait()
-
-                last_consumption_time = time.monotonic()
-
-                await asyncio.sleep(consumption_rate)
-        except asyncio.CancelledError:
-            # you can ignore the error here and deal with closing this task later but this is not advised
-            raise
-        except Exception as e:
-            # do something with the error and re-raise
-            raise
-
-    @staticmethod
-    def get_tokens_amount_to_consume(consumption_rate, current_consumption_time, last_consumption_time, total_tokens):
-        time_from_last_consumption = current_consumption_time - last_consumption_time
-        calculated_tokens_to_consume = math.floor(time_from_last_consumption / consumption_rate)
-        tokens_to_consume = min(total_tokens, calculated_tokens_to_consume)
-        return tokens_to_consume
+    @property
+    def current_rate(self) -> float:
+        """Requests per second currently allowed."""
+        return self._current_rate
+
+    def on_response(self, status: int, headers: Mapping[str, str]) -> None:
+        """Adapts the rate to a response of the server."""
+        now = time.monotonic()
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.throttled_responses += 1
+            self._pause(now, seconds=parse_retry_after(headers.get('Retry-After')) or 1 / self._current_rate)
+            if self.adaptive and now - self._last_decrease_at > self.decrease_cooldown:
+                self._last_decrease_at = now
+                self._current_rate = max(self.min_rate, self._current_rate * self.multiplicative_decrease)
+                logger.info(f'Throttled by the server, decreased the rate to {self._current_rate:.2f} requests/s.')
+            return
+
+        if headers.get('X-RateLimit-Remaining') == '0':
+            self._pause(now, seconds=parse_rate_limit_reset(headers.get('X-RateLimit-Reset')) or 0)
+        if self.adaptive and 200 <= status < 300:
+            self._current_rate = min(self.max_rate, self._current_rate + self.additive_increase / self._current_rate)
+
+    def _pause(self, now: float, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, now + seconds)
+
+    async def _wait_until_resumed(self) -> None:
+        while (pause := self.paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(pause)
+
+    async def wait(self, cost: float = 1) -> None:
+        """Waits for the slot of a request, without the concurrency limit."""
+        while True:
+            await self._wait_until_resumed()
+            delay = await self.backend.reserve(cost, rate=self._current_rate, burst=self.burst)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.paused_until <= time.monotonic():
+                return  # otherwise the server paused the requests meanwhile, and the slot must be reserved again
 
     @asynccontextmanager
-    async def throttle(self):
-        await self.semaphore.acquire()
-        await self.add_token()
-        try:
+    async def throttle(self, cost: float = 1):
+        """
+        cost:
+            Weight of the request, in requests. For instance, a request counting as two against the quota of the server.
+        """
+        async with self.semaphore:
+            await self.wait(cost)
             yield
-        finally:
-            self.semaphore.release()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if exc_type:
-            # log error here and safely close the class
-            pass
-
         await self.close()
 
     async def close(self) -> None:
-        if self.tokens_consumer_task and not self.tokens_consumer_task.cancelled():
-            try:
-                self.tokens_consumer_task.cancel()
-                await self.tokens_consumer_task
-            except asyncio.CancelledError:
-                # we ignore this exception but it is good to log and signal the task was cancelled
-                pass
-            except Exception as e:
-                # log here and deal with the exception
-                raise
\ No newline at end of file
+        """Closes the connections of the backend. The limiter itself runs no background task."""
+        await self.backend.close()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait, from a Retry-After header holding either seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:  # dates in the -0000 zone, which are UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limit_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait, from a X-RateLimit-Reset header holding either seconds or a UNIX timestamp."""
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 1_000_000_000:  # a timestamp rather than a duration
+        reset -= time.time()
+    return max(0.0, reset)
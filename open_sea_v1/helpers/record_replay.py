@@ -0,0 +1,84 @@
+"""
+Recording of the responses of the API in a file, to replay crawls without network access.
+"""
+import asyncio
+from pathlib import Path
+from typing import Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+from open_sea_v1.helpers.checkpoint import _write_json_atomically
+from open_sea_v1.helpers.extended_classes import ExtendedStrEnum
+from open_sea_v1.helpers.json_backend import get_json_backend
+from open_sea_v1.helpers.response_cache import Request
+
+
+class CassetteMode(ExtendedStrEnum):
+    """
+    RECORD: requests are sent, and their responses recorded, replacing any previous recording.
+    REPLAY: responses are served from the recording, and requests which were not recorded fail.
+    ONCE: recorded responses are replayed, and the other requests are sent and recorded.
+    """
+    RECORD = 'record'
+    REPLAY = 'replay'
+    ONCE = 'once'
+
+
+class Cassette:
+    """
+    Responses of the API, keyed by the path and querystring of their request, stored in a JSON file.
+    The host is not part of the key, so that responses recorded from OpenSea can be replayed to a local stand-in,
+    and the other way around.
+    Replayed responses are served without any request, rate limiting nor retry, after latency seconds,
+    so that crawls replay deterministically, at the pace of the client.
+    Recorded responses are written to the file by save(), or on exit when the cassette is used as a context manager.
+
+        with Cassette('crawl.json', mode=CassetteMode.ONCE) as cassette:
+            EventsEndpoint(client_params=ClientParams(cassette=cassette), ...).get_parsed_pages()
+    """
+
+    def __init__(self, path: Union[str, Path], mode: CassetteMode = CassetteMode.REPLAY, latency: float = 0.0):
+        self.path = Path(path)
+        self.mode = CassetteMode(mode)
+        self.latency = latency
+        self.responses: dict[str, dict] = dict()
+        if self.mode != CassetteMode.RECORD and self.path.exists():
+            self.responses = get_json_backend().loads(self.path.read_bytes())['responses']
+        self.replayed = 0
+        self.recorded = 0
+
+    def __enter__(self) -> 'Cassette':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.save()
+
+    @staticmethod
+    def key(url: str) -> str:
+        split_url = urlsplit(url)
+        return f'{split_url.path}?{split_url.query}' if split_url.query else split_url.path
+
+    async def fetch(self, url: str, headers: dict, *, request: Request
+                    ) -> tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]:
+        """Replays the recorded response of the url, or sends the request, and records its response."""
+        key = self.key(url)
+        if self.mode != CassetteMode.RECORD and (recorded := self.responses.get(key)) is not None:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            self.replayed += 1
+            body = recorded['body'].encode()
+            return get_json_backend().loads(body), body, recorded['headers']
+        if self.mode == CassetteMode.REPLAY:
+            raise ConnectionError(f'No response recorded for {key} in {self.path}.')
+
+        json_resp, body, response_headers = await request(headers)
+        if json_resp is not None:  # 304 Not Modified responses are not worth replaying
+            recorded_headers = {str(name): value for name, value in response_headers.items()}
+            self.responses[key] = dict(body=body.decode(), headers=recorded_headers)
+            self.recorded += 1
+        return json_resp, body, response_headers
+
+    def save(self) -> None:
+        if self.mode == CassetteMode.REPLAY:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomically(self.path, dict(responses=self.responses))
@@ -0,0 +1,219 @@
+"""
+Cache of the responses of the API, keyed by querystring, so that repeated queries do not all go to the network.
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Awaitable, Callable, Mapping, Optional, Union
+
+from open_sea_v1.helpers.json_backend import get_json_backend
+
+Request = Callable[[dict], Awaitable[tuple[Optional[Union[dict, list]], bytes, Mapping[str, str]]]]
+"""Sends a request with extra headers, and returns the JSON (None if 304 Not Modified), raw body and headers of the response."""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    body: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def revalidable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def conditional_headers(self) -> dict:
+        """Headers asking the server to answer 304 Not Modified if the response did not change since it was cached."""
+        headers = dict()
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    """Responses served from the cache without any request."""
+    revalidations: int = 0
+    """Responses served from the cache, after the server answered 304 Not Modified."""
+    misses: int = 0
+    """Responses fetched from the server."""
+    evictions: int = 0
+    """Entries evicted from memory to stay under max_memory_bytes."""
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / lookups if lookups else 0.0
+
+
+class MemoryCache:
+    """Least recently used entries, evicted once their bodies weigh more than max_bytes in total."""
+
+    def __init__(self, max_bytes: int, stats: CacheStats):
+        self.max_bytes = max_bytes
+        self.stats = stats
+        self.size_bytes = 0
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        if (entry := self.entries.get(key)) is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self.delete(key)
+        if entry.size > self.max_bytes:
+            return
+        self.entries[key] = entry
+        self.size_bytes += entry.size
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size_bytes -= evicted.size
+            self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        if (entry := self.entries.pop(key, None)) is not None:
+            self.size_bytes -= entry.size
+
+
+class SqliteCache:
+    """
+    Entries stored in a sqlite database, which outlive the process, and may be shared by several processes.
+    Its methods block, and are meant to be run in an executor.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body BLOB, '
+                                     'expires_at REAL, etag TEXT, last_modified TEXT)')
+        return self._connection
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connect().execute('SELECT body, expires_at, etag, last_modified FROM responses WHERE key = ?',
+                                          (key,)).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._connect().execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                                    (key, entry.body, entry.expires_at, entry.etag, entry.last_modified))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
+
+
+class ResponseCache:
+    """
+    Responses of the API, keyed by querystring, shared by the endpoints whose client params hold this cache.
+    A response is served from the cache for ttl seconds after it was fetched. Once expired, it is revalidated
+    if the server sent an ETag or a Last-Modified header: the request is conditional, and the cached response is
+    served again if the server answers 304 Not Modified, which does not transfer the response again.
+
+    Parameters
+    ----------
+    max_memory_bytes:
+        Weight of the responses kept in memory. The least recently used responses are evicted first.
+
+    path:
+        Optional sqlite database, in which responses are also stored. It outlives the process,
+        and responses evicted from memory are still served from it.
+
+    default_ttl:
+        Seconds during which a response is served from the cache without revalidation.
+
+    ttls:
+        Seconds per endpoint class name, for instance {'CollectionsEndpoint': 300}, instead of default_ttl.
+        0 disables the cache for the endpoint.
+    """
+
+    def __init__(self, max_memory_bytes: int = 64 * 1024 * 1024, path: Optional[Union[str, Path]] = None,
+                 default_ttl: float = 60.0, ttls: Optional[Mapping[str, float]] = None):
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or dict())
+        self.stats = CacheStats()
+        self.memory = MemoryCache(max_memory_bytes, self.stats)
+        self.disk = SqliteCache(path) if path is not None else None
+
+    def ttl_for(self, endpoint_name: str) -> float:
+        return self.ttls.get(endpoint_name, self.default_ttl)
+
+    async def fetch(self, key: str, *, ttl: float, request: Request) -> Union[dict, list]:
+        """Serves the JSON response of the key from the cache if it is fresh or still valid, otherwise requests it."""
+        if ttl <= 0:
+            json_resp, _, _ = await request(dict())
+            return json_resp
+
+        entry = await self.get(key)
+        now = time.time()
+        if entry is not None and entry.is_fresh(now):
+            self.stats.hits += 1
+            return get_json_backend().loads(entry.body)
+
+        conditional_headers = entry.conditional_headers() if entry is not None else dict()
+        json_resp, body, headers = await request(conditional_headers)
+        if json_resp is None:  # 304 Not Modified
+            if entry is None:
+                raise ConnectionError(f'Unexpected 304 Not Modified response to an unconditional request: {key}')
+            self.stats.revalidations += 1
+            await self.set(key, replace(entry, expires_at=now + ttl))
+            return get_json_backend().loads(entry.body)
+
+        self.stats.misses += 1
+        await self.set(key, CacheEntry(body, expires_at=now + ttl, etag=headers.get('ETag'),
+                                       last_modified=headers.get('Last-Modified')))
+        return json_resp
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """The entry of the key, even if expired, as long as it is fresh or may be revalidated."""
+        if (entry := self.memory.get(key)) is None and self.disk is not None:
+            if (entry := await asyncio.to_thread(self.disk.get, key)) is not None:
+                self.memory.set(key, entry)
+        if entry is not None and not entry.is_fresh(time.time()) and not entry.revalidable:
+            await self.delete(key)
+            return None
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self.memory.set(key, entry)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, entry)
+
+    async def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.delete, key)
+
+    def close(self) -> None:
+        """Closes the sqlite database, which is opened again if the cache is used afterwards."""
+        if self.disk is not None:
+            self.disk.close()
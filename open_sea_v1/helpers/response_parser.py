@@ -1,8 +1,8 @@
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Type, Optional, Any, Union
 
+from open_sea_v1.helpers.json_backend import JsonBackend, get_json_backend
 from open_sea_v1.responses.abc import BaseResponse
 
 
@@ -13,6 +13,7 @@ class ResponseParser:
     """
     target_dir: Path
     response_type: Type[BaseResponse]
+    json_backend: JsonBackend = field(default_factory=get_json_backend)
 
     def __post_init__(self):
         if not self.target_dir.exists():
@@ -24,12 +25,12 @@ class ResponseParser:
         else:
             the_jsons = to_parse._json
         with open(str(self.target_dir / 'sample.json'), 'w') as f:
-            json.dump(the_jsons, f)
+            f.write(self.json_backend.dumps(the_jsons))
 
     def load(self, json_path: Optional[Path] = None) -> Any:
         json_path = self.target_dir if not json_path else json_path
-        with open(str(json_path), 'r') as f:
-            parsed_json = json.load(f)
+        with open(str(json_path), 'rb') as f:
+            parsed_json = self.json_backend.loads(f.read())
         return [self.response_type(collection) for collection in parsed_json]
 
     def load_from_dir(self) -> Any:
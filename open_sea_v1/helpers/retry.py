@@ -0,0 +1,114 @@
+"""
+Retries of the requests which fail transiently: server errors, timeouts and dropped connections.
+"""
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aiohttp import ClientConnectionError, ClientPayloadError, ContentTypeError
+
+from open_sea_v1.helpers.rate_limiter import parse_retry_after
+
+
+class RetryableStatusError(ConnectionError):
+    """Response with a status which may succeed if the request is sent again, such as 503 Service Unavailable."""
+
+    def __init__(self, status: int, url: str, retry_after: Optional[str] = None):
+        super().__init__(f'{status=} for {url}')
+        self.status = status
+        self.retry_after = parse_retry_after(retry_after)
+
+
+RETRYABLE_EXCEPTIONS = (
+    RetryableStatusError,
+    ClientConnectionError,  # refused or dropped connections
+    ClientPayloadError,  # truncated responses
+    ContentTypeError,  # HTML error pages of the proxies in front of the API, only retried for server errors
+    asyncio.TimeoutError,
+)
+
+
+class RetryBudget:
+    """
+    Limits the retries to a ratio of the requests, so that a storm of failures does not multiply the load on the server.
+    Each request deposits ratio retries in the budget, up to max_retries, and each retry withdraws one.
+    The budget starts with min_retries, for the first failures of a crawl.
+    """
+
+    def __init__(self, ratio: float, min_retries: int, max_retries: int):
+        self.ratio = ratio
+        self.max_retries = max_retries
+        self.available = float(min_retries)
+
+    def deposit(self) -> None:
+        self.available = min(self.max_retries, self.available + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.available < 1:
+            return False
+        self.available -= 1
+        return True
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How the requests which fail transiently are sent again.
+
+    max_attempts:
+        Number of times a request is sent, including the first one. 1 disables retries.
+
+    base_delay, max_delay:
+        The delay before the nth retry is base_delay * 2 ** (n - 1) seconds, capped at max_delay.
+        A Retry-After header sent by the server takes precedence if it is longer.
+
+    jitter:
+        Draws each delay at random between 0 and the delay above ("full jitter"),
+        so that the requests which failed together are not retried together.
+
+    timeout:
+        Seconds after which a request is abandoned, and retried.
+
+    budget_ratio, budget_min_retries:
+        Retries allowed per request sent, and before any request was sent. See RetryBudget.
+        The budget is shared by every endpoint using this policy.
+
+    retryable_statuses:
+        HTTP statuses of the responses which are retried.
+    """
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    jitter: bool = True
+    timeout: Optional[float] = 60.0
+    budget_ratio: float = 0.2
+    budget_min_retries: int = 10
+    retryable_statuses: frozenset[int] = frozenset({500, 502, 503, 504, 520, 522, 524})
+    budget: RetryBudget = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError(f'{self.max_attempts=} must be at least 1.')
+        if not 0 <= self.budget_ratio <= 1:
+            raise ValueError(f'{self.budget_ratio=} must be between 0 and 1.')
+        self.budget = RetryBudget(
+            ratio=self.budget_ratio,
+            min_retries=self.budget_min_retries,
+            max_retries=max(self.budget_min_retries, 100),
+        )
+
+    def backoff(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the retry_number-th retry of a request, starting at 1."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (retry_number - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return max(delay, retry_after or 0)
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Whether a request which failed on its attempt-th attempt is sent again. Withdraws the retry from the budget."""
+        if not isinstance(error, RETRYABLE_EXCEPTIONS) or attempt >= self.max_attempts:
+            return False
+        if isinstance(error, ContentTypeError) and error.status < 500:  # such as the HTML page of a 404 Not Found
+            return False
+        return self.budget.withdraw()
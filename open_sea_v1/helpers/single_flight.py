@@ -0,0 +1,43 @@
+"""
+Coalescing of identical calls: while a call is in flight, identical calls wait for its result instead of being made again.
+"""
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs a single call at a time per key. The callers of a key already in flight await the result of that call,
+    or its exception. The call runs in its own task, so it is only cancelled once every caller waiting for it is.
+    The key is forgotten as soon as the call is over: later callers make the call again.
+    """
+
+    def __init__(self):
+        self.in_flight: dict[Hashable, _Flight] = dict()
+        self.joined_calls = 0
+        """Calls which awaited the result of an identical call in flight, instead of being made."""
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        if (flight := self.in_flight.get(key)) is None:
+            flight = self.in_flight[key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(partial(self._land, key, flight))
+        else:
+            self.joined_calls += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+
+    def _land(self, key: Hashable, flight: _Flight, _task: asyncio.Task) -> None:
+        if self.in_flight.get(key) is flight:
+            del self.in_flight[key]
@@ -3,6 +3,7 @@ from typing import Type
 from unittest import TestCase
 
 from open_sea_v1.endpoints.abc import BaseEndpoint
+from open_sea_v1.helpers.testing_server import LocalOpenSeaServer
 from open_sea_v1.responses.abc import BaseResponse
 
 
@@ -21,4 +22,24 @@ class QueryTestCase(TestCase, ABC):
         """Shortcut"""
         client = self.endpoint(**kwargs)  # type: ignore
         flattened = client.get_parsed_pages(flat=True)
-        return flattened
\ No newline at end of file
+        return flattened
+
+
+class LocalServerTestCase(TestCase):
+    """
+    Runs the endpoints against a LocalOpenSeaServer built from server_kwargs, started once per class,
+    which the urls of every endpoint point to. Its counters and injected faults are reset before each test.
+    """
+
+    server_kwargs: dict = dict(total_items=12)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = LocalOpenSeaServer(**cls.server_kwargs)
+        cls.addClassCleanup(cls.server.stop)
+        cls.urls_patch = cls.server.patch_urls()
+        cls.urls_patch.__enter__()
+        cls.addClassCleanup(cls.urls_patch.__exit__, None, None, None)
+
+    def setUp(self) -> None:
+        self.server.reset()
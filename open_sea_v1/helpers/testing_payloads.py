@@ -0,0 +1,270 @@
+"""
+Factories for OpenSea API payloads, shaped like the JSON returned by the live API.
+Used to exercise the clients and the response objects without hitting the network.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+SAMPLE_CONTRACT = "0x76be3b62873462d2142405439777e971754e8e77"
+SAMPLE_WALLET = "0x5ca12f79e4d33b0bd153b40df59f6db9ee03482e"
+NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+_FIRST_EVENT_DATE = datetime(2021, 8, 1)
+
+
+def mk_address(seed: int) -> str:
+    return f"0x{seed:040x}"
+
+
+def mk_account_json(seed: int) -> dict:
+    return {
+        "user": {"username": f"user_{seed}"},
+        "profile_img_url": f"https://storage.googleapis.com/opensea-static/opensea-profile/{seed % 30}.png",
+        "address": mk_address(seed),
+        "config": "",
+    }
+
+
+def mk_payment_token_json() -> dict:
+    return {
+        "id": 1,
+        "symbol": "ETH",
+        "address": NULL_ADDRESS,
+        "image_url": "https://storage.opensea.io/files/6f8e2979d428180222796ff4a33ab929.svg",
+        "name": "Ether",
+        "decimals": 18,
+        "eth_price": "1.000000000000000",
+        "usd_price": "3182.840000000000146000",
+    }
+
+
+def mk_collection_json(slug: str = 'sample-collection', with_stats: bool = True) -> dict:
+    collection = {
+        "primary_asset_contracts": [mk_contract_json()],
+        "traits": {"background": {"blue": 12, "red": 7}},
+        "banner_image_url": "https://lh3.googleusercontent.com/banner",
+        "chat_url": None,
+        "created_date": "2021-07-18T22:19:32.158044",
+        "default_to_fiat": False,
+        "description": "A sample collection.",
+        "dev_buyer_fee_basis_points": "0",
+        "dev_seller_fee_basis_points": "500",
+        "discord_url": "https://discord.gg/sample",
+        "display_data": {"card_display_style": "contain"},
+        "external_url": "https://sample.io",
+        "featured": False,
+        "featured_image_url": None,
+        "hidden": False,
+        "safelist_request_status": "verified",
+        "image_url": "https://lh3.googleusercontent.com/image",
+        "is_subject_to_whitelist": False,
+        "large_image_url": None,
+        "medium_username": None,
+        "only_proxied_transfers": False,
+        "opensea_buyer_fee_basis_points": "0",
+        "opensea_seller_fee_basis_points": "250",
+        "payout_address": mk_address(7),
+        "require_email": False,
+        "short_description": None,
+        "slug": slug,
+        "telegram_url": None,
+        "twitter_username": "sample",
+        "instagram_username": None,
+        "wiki_url": None,
+        "name": slug.replace('-', ' ').title(),
+    }
+    if with_stats:
+        collection["stats"] = mk_collection_stats_json()
+    return collection
+
+
+def mk_collection_stats_json() -> dict:
+    return {
+        "one_day_volume": 120.5, "one_day_change": 0.12, "one_day_sales": 14.0, "one_day_average_price": 8.6,
+        "seven_day_volume": 940.2, "seven_day_change": -0.3, "seven_day_sales": 101.0,
+        "seven_day_average_price": 9.3, "thirty_day_volume": 3900.0, "thirty_day_change": 1.1,
+        "thirty_day_sales": 420.0, "thirty_day_average_price": 9.28, "total_volume": 10234.1, "total_sales": 1500.0,
+        "total_supply": 10000.0, "count": 10000.0, "num_owners": 4321, "average_price": 6.82, "num_reports": 0,
+        "market_cap": 92800.0, "floor_price": 7.5,
+    }
+
+
+def mk_contract_json() -> dict:
+    return {
+        "address": SAMPLE_CONTRACT,
+        "asset_contract_type": "non-fungible",
+        "created_date": "2021-07-18T22:15:47.127346",
+        "name": "Sample Contract",
+        "nft_version": "3.0",
+        "owner": 1234,
+        "schema_name": "ERC721",
+        "symbol": "SMPL",
+        "total_supply": "10000",
+        "description": "A sample contract.",
+        "external_link": "https://sample.io",
+        "image_url": "https://lh3.googleusercontent.com/contract",
+    }
+
+
+def mk_last_sale_json(token_id: int) -> dict:
+    return {
+        "asset": {"token_id": str(token_id), "decimals": None},
+        "asset_bundle": None,
+        "event_type": "successful",
+        "event_timestamp": mk_timestamp(token_id),
+        "auction_type": None,
+        "total_price": mk_wei_price(token_id),
+        "payment_token": mk_payment_token_json(),
+        "transaction": mk_transaction_json(token_id),
+        "created_date": mk_timestamp(token_id),
+        "quantity": "1",
+    }
+
+
+def mk_asset_json(token_id: int, with_orders: bool = True) -> dict:
+    return {
+        "id": 20_000_000 + token_id,
+        "token_id": str(token_id),
+        "num_sales": token_id % 7,
+        "background_color": None,
+        "image_url": f"https://lh3.googleusercontent.com/{token_id}",
+        "image_preview_url": f"https://lh3.googleusercontent.com/{token_id}=s250",
+        "image_thumbnail_url": f"https://lh3.googleusercontent.com/{token_id}=s128",
+        "image_original_url": f"https://ipfs.io/ipfs/{token_id}.png",
+        "animation_url": None,
+        "animation_original_url": None,
+        "name": f"Sample #{token_id}",
+        "description": "A sample asset.",
+        "external_link": None,
+        "asset_contract": mk_contract_json(),
+        "permalink": f"https://opensea.io/assets/{SAMPLE_CONTRACT}/{token_id}",
+        "collection": mk_collection_json(with_stats=False),
+        "decimals": 0,
+        "token_metadata": f"https://sample.io/metadata/{token_id}",
+        "owner": mk_account_json(token_id),
+        "sell_orders": [mk_order_json(token_id, with_asset=False)] if with_orders else None,
+        "creator": mk_account_json(1),
+        "traits": [{"trait_type": "background", "value": "blue", "display_type": None, "max_value": None,
+                    "trait_count": 12, "order": None}],
+        "last_sale": mk_last_sale_json(token_id),
+        "top_bid": None,
+        "listing_date": None,
+        "is_presale": False,
+        "transfer_fee_payment_token": None,
+        "transfer_fee": None,
+    }
+
+
+def mk_transaction_json(seed: int) -> dict:
+    return {
+        "block_hash": f"0x{seed:064x}",
+        "block_number": str(13_000_000 + seed),
+        "from_account": mk_account_json(seed + 1),
+        "id": 100_000 + seed,
+        "timestamp": mk_timestamp(seed),
+        "to_account": mk_account_json(seed + 2),
+        "transaction_hash": f"0x{seed + 1:064x}",
+        "transaction_index": str(seed % 100),
+    }
+
+
+def mk_timestamp(seed: int) -> str:
+    """Most recent seeds get the most recent dates, as OpenSea sorts its events by descending date."""
+    return (_FIRST_EVENT_DATE + timedelta(minutes=seed)).isoformat()
+
+
+def mk_wei_price(seed: int) -> str:
+    return str((seed % 50 + 1) * 10 ** 17 + seed)
+
+
+def mk_event_json(event_id: int, event_type: str = 'successful', token_id: Optional[int] = None) -> dict:
+    token_id = event_id % 10_000 if token_id is None else token_id
+    return {
+        "approved_account": None,
+        "asset": mk_asset_json(token_id, with_orders=False),
+        "asset_bundle": None,
+        "auction_type": None,
+        "bid_amount": None,
+        "collection_slug": "sample-collection",
+        "contract_address": SAMPLE_CONTRACT,
+        "created_date": mk_timestamp(event_id),
+        "custom_event_name": None,
+        "dev_fee_payment_event": None,
+        "duration": None,
+        "ending_price": None,
+        "event_type": event_type,
+        "from_account": None,
+        "id": event_id,
+        "is_private": False,
+        "owner_account": None,
+        "payment_token": mk_payment_token_json(),
+        "quantity": "1",
+        "seller": mk_account_json(event_id + 3),
+        "starting_price": None,
+        "to_account": None,
+        "total_price": mk_wei_price(event_id),
+        "transaction": mk_transaction_json(event_id),
+        "winner_account": mk_account_json(event_id + 4),
+    }
+
+
+def mk_order_json(seed: int, with_asset: bool = True) -> dict:
+    order = {
+        "id": 300_000 + seed,
+        "asset_bundle": None,
+        "created_date": mk_timestamp(seed),
+        "closing_date": None,
+        "closing_extendable": False,
+        "expiration_time": 0,
+        "listing_time": 1_627_776_000 + seed,
+        "order_hash": f"0x{seed + 2:064x}",
+        "metadata": {"asset": {"id": str(seed), "address": SAMPLE_CONTRACT}, "schema": "ERC721"},
+        "exchange": mk_address(8),
+        "maker": mk_account_json(seed + 5),
+        "taker": mk_account_json(0),
+        "current_price": f"{mk_wei_price(seed)}.000000000000000",
+        "current_bounty": "0.0",
+        "bounty_multiple": "0",
+        "maker_relayer_fee": "750",
+        "taker_relayer_fee": "0",
+        "maker_protocol_fee": "0",
+        "taker_protocol_fee": "0",
+        "maker_referrer_fee": "0",
+        "fee_recipient": mk_account_json(9),
+        "fee_method": 1,
+        "side": 1,
+        "sale_kind": 0,
+        "target": SAMPLE_CONTRACT,
+        "how_to_call": 0,
+        "calldata": "0x",
+        "replacement_pattern": "0x",
+        "static_target": NULL_ADDRESS,
+        "static_extradata": "0x",
+        "payment_token": NULL_ADDRESS,
+        "payment_token_contract": mk_payment_token_json(),
+        "base_price": mk_wei_price(seed),
+        "extra": "0",
+        "quantity": "1",
+        "salt": str(seed * 7919),
+        "v": 28,
+        "r": f"0x{seed + 3:064x}",
+        "s": f"0x{seed + 4:064x}",
+        "approved_on_chain": False,
+        "cancelled": False,
+        "finalized": False,
+        "marked_invalid": False,
+        "prefixed_hash": f"0x{seed + 5:064x}",
+    }
+    if with_asset:
+        order["asset"] = mk_asset_json(seed % 10_000, with_orders=False)
+    return order
+
+
+def mk_events_page(first_event_id: int, size: int, newest_first: bool = True) -> dict:
+    ids = range(first_event_id, first_event_id + size)
+    ids = sorted(ids, reverse=True) if newest_first else ids
+    return {"asset_events": [mk_event_json(i) for i in ids]}
+
+
+def mk_assets_page(token_ids: list[int]) -> dict:
+    return {"assets": [mk_asset_json(token_id) for token_id in token_ids]}
@@ -0,0 +1,332 @@
+"""
+Local stand-in for the OpenSea API, to test the clients without network access.
+"""
+import asyncio
+import hashlib
+import json
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from functools import partial
+from threading import Thread
+from typing import Optional, Sequence, Union
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from open_sea_v1.endpoints.assets import AssetsEndpoint
+from open_sea_v1.endpoints.collections import CollectionsEndpoint
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.orders import OrdersEndpoint
+from open_sea_v1.endpoints.urls import EndpointURLS
+from open_sea_v1.helpers.rate_limit_backends import RedisError, read_resp_reply
+from open_sea_v1.helpers.testing_payloads import (mk_asset_json, mk_collection_json, mk_event_json, mk_order_json,
+                                                  mk_timestamp)
+
+
+_RESOURCES = {
+    EndpointURLS.ASSETS: ('assets', mk_asset_json),
+    EndpointURLS.EVENTS: ('asset_events', mk_event_json),
+    EndpointURLS.COLLECTIONS: ('collections', lambda i: mk_collection_json(slug=f'sample-collection-{i}')),
+    EndpointURLS.ORDERS: ('orders', mk_order_json),
+}
+"""JSON key of the pages of each endpoint, and factory of its fake items, by seed."""
+
+
+@contextmanager
+def patch_endpoint_urls(urls: dict[EndpointURLS, str]):
+    """Points the url of the endpoints to the given urls, for instance those of a LocalOpenSeaServer of another process."""
+    endpoints = {EndpointURLS.ASSETS: AssetsEndpoint, EndpointURLS.EVENTS: EventsEndpoint,
+                 EndpointURLS.COLLECTIONS: CollectionsEndpoint, EndpointURLS.ORDERS: OrdersEndpoint}
+    with ExitStack() as stack:
+        for endpoint_url, url in urls.items():
+            stack.enter_context(patch.object(endpoints[endpoint_url], 'url', url))
+        yield
+
+
+class LocalOpenSeaServer:
+    """
+    Stand-in for the OpenSea API, served from a background thread: /api/v1/assets, /api/v1/events,
+    /api/v1/collections and /wyvern/v1/orders each serve total_items fake items, seeded from 0 to total_items - 1.
+    It records the client connections it receives, and counts the requests served, throttled and failed.
+    Each response is delayed by latency seconds, to reproduce the round trips to OpenSea.
+    If a max_limit is given, larger limit parameters are rejected with an HTTP 400, like OpenSea does.
+    If a quota is given, at most quota requests are served per quota_window seconds:
+    the others are throttled with an HTTP 429 and a Retry-After header, like OpenSea does.
+    Unless rate_limit_headers is False, the responses also tell the remaining quota (X-RateLimit-* headers).
+    Faults can be injected in the responses to given offsets, see inject_faults().
+    Events are filtered by the occurred_after and occurred_before parameters, which are exclusive bounds.
+    Assets and orders are filtered by the token_ids (or token_id) parameter.
+    If a max_offset is given, deeper offsets are rejected with an HTTP 400, like OpenSea does.
+    With newest_first, items are served from the most recent one, like OpenSea does, rather than by increasing seed.
+    Responses have an ETag, and conditional requests (If-None-Match) for unchanged responses get a 304 Not Modified.
+    Use patch_urls() to point the endpoints to the server.
+    """
+    slow_response_delay = 2.0
+
+    def __init__(self, total_items: int, quota: Optional[int] = None, quota_window: float = 1.0,
+                 rate_limit_headers: bool = True, max_offset: Optional[int] = None, newest_first: bool = False,
+                 latency: float = 0.0, max_limit: Optional[int] = None):
+        self.total_items = total_items
+        self.newest_first = newest_first
+        self.max_offset = max_offset
+        self.max_limit = max_limit
+        self.latency = latency
+        self.quota = quota
+        self.quota_window = quota_window
+        self.rate_limit_headers = rate_limit_headers
+        self.faults: dict[int, list[Union[int, str]]] = dict()
+        self.client_ports: set[int] = set()
+        self.served_requests = 0
+        self.throttled_requests = 0
+        self.faulty_requests = 0
+        self.not_modified_requests = 0
+        self._window_started_at = time.monotonic()
+        self._window_requests = 0
+        self.loop = asyncio.new_event_loop()
+        self.runner = web.AppRunner(self.mk_app())
+        self.loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        self.loop.run_until_complete(site.start())
+        self.base_url = f'http://127.0.0.1:{self.runner.addresses[0][1]}'
+        self.urls = {endpoint_url: self.base_url + urlsplit(endpoint_url.value).path for endpoint_url in _RESOURCES}
+        self.thread = Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def mk_app(self) -> web.Application:
+        app = web.Application()
+        for endpoint_url in _RESOURCES:
+            app.router.add_get(urlsplit(endpoint_url.value).path, partial(self.serve_page, endpoint_url))
+        return app
+
+    @contextmanager
+    def patch_urls(self):
+        """Points the url of every endpoint to the server, for the duration of the context."""
+        with patch_endpoint_urls(self.urls):
+            yield self
+
+    def inject_faults(self, offset: int, *faults: Union[int, str]) -> None:
+        """
+        The next requests of the page at offset fail, one fault per request:
+            - an HTTP status, for instance 503,
+            - 'html': an HTML 502 Bad Gateway page, as sent by proxies,
+            - 'html404': an HTML 404 Not Found page,
+            - 'disconnect': the connection is closed without response,
+            - 'slow': the response is delayed by slow_response_delay seconds.
+        """
+        self.faults.setdefault(offset, list()).extend(faults)
+
+    def reset(self) -> None:
+        self.faults.clear()
+        self.client_ports.clear()
+        self.served_requests, self.throttled_requests, self.faulty_requests = 0, 0, 0
+        self.not_modified_requests = 0
+        self._window_started_at, self._window_requests = time.monotonic(), 0
+
+    async def serve_page(self, endpoint_url: EndpointURLS, request: web.Request) -> web.Response:
+        self.client_ports.add(request.transport.get_extra_info('peername')[1])
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if throttled_response := self._enforce_quota():
+            return throttled_response
+        json_key, mk_item_json = _RESOURCES[endpoint_url]
+        offset, limit = int(request.query['offset']), int(request.query['limit'])
+        if self.faults.get(offset):
+            return await self._respond_with_fault(request, self.faults[offset].pop(0), json_key)
+        if self.max_offset is not None and offset > self.max_offset:
+            return web.json_response({'detail': f'offset must be lower than {self.max_offset}'}, status=400)
+        if self.max_limit is not None and limit > self.max_limit:
+            return web.json_response({'detail': f'Ensure limit is less than or equal to {self.max_limit}.'}, status=400)
+        seeds = self._filtered_seeds(endpoint_url, request.query)
+        seeds = (seeds[::-1] if self.newest_first else seeds)[offset:offset + limit]
+        body = json.dumps({json_key: [mk_item_json(seed) for seed in seeds]})
+        etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+        headers = {'ETag': etag, **self._quota_headers()}
+        if request.headers.get('If-None-Match') == etag:
+            self.not_modified_requests += 1
+            return web.Response(status=304, headers=headers)
+        self.served_requests += 1
+        return web.Response(text=body, content_type='application/json', headers=headers)
+
+    def _filtered_seeds(self, endpoint_url: EndpointURLS, query) -> Sequence[int]:
+        seeds = range(self.total_items)
+        if endpoint_url in (EndpointURLS.ASSETS, EndpointURLS.ORDERS):
+            token_ids = query.getall('token_ids', list()) + query.getall('token_id', list())
+            if token_ids:
+                requested = {int(token_id) for token_id in token_ids}
+                return [seed for seed in seeds if seed % 10_000 in requested]
+        if endpoint_url == EndpointURLS.EVENTS and ('occurred_after' in query or 'occurred_before' in query):
+            after = datetime.fromisoformat(query.get('occurred_after', datetime.min.isoformat()))
+            before = datetime.fromisoformat(query.get('occurred_before', datetime.max.isoformat()))
+            return [seed for seed in seeds if after < datetime.fromisoformat(mk_timestamp(seed)) < before]
+        return seeds
+
+    async def _respond_with_fault(self, request: web.Request, fault: Union[int, str],
+                                  json_key: str) -> web.StreamResponse:
+        self.faulty_requests += 1
+        if fault == 'html':
+            return web.Response(text='<html><body>502 Bad Gateway</body></html>', content_type='text/html', status=502)
+        if fault == 'html404':
+            return web.Response(text='<html><body>404 Not Found</body></html>', content_type='text/html', status=404)
+        if fault == 'disconnect':
+            request.transport.close()
+            return web.Response()
+        if fault == 'slow':
+            await asyncio.sleep(self.slow_response_delay)
+            return web.json_response({json_key: list()})
+        return web.json_response({'detail': 'Injected fault.'}, status=fault, headers={'Retry-After': '0'})
+
+    def _enforce_quota(self) -> Optional[web.Response]:
+        if self.quota is None:
+            return None
+        now = time.monotonic()
+        if now - self._window_started_at >= self.quota_window:
+            self._window_started_at, self._window_requests = now, 0
+        self._window_requests += 1
+        if self._window_requests <= self.quota:
+            return None
+        self.throttled_requests += 1
+        headers = {'Retry-After': f'{self._seconds_until_reset():.3f}', **self._quota_headers()}
+        return web.json_response({'detail': 'Request was throttled.'}, status=429, headers=headers)
+
+    def _quota_headers(self) -> dict:
+        if self.quota is None or not self.rate_limit_headers:
+            return dict()
+        return {
+            'X-RateLimit-Limit': str(self.quota),
+            'X-RateLimit-Remaining': str(max(0, self.quota - self._window_requests)),
+            'X-RateLimit-Reset': f'{self._seconds_until_reset():.3f}',
+        }
+
+    def _seconds_until_reset(self) -> float:
+        return max(0.0, self._window_started_at + self.quota_window - time.monotonic())
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class LocalEventsServer(LocalOpenSeaServer):
+    """LocalOpenSeaServer whose url is the one of its events endpoint, to patch the url of EventsEndpoint only."""
+
+    def __init__(self, total_items: int, **kwargs):
+        super().__init__(total_items, **kwargs)
+        self.url = self.urls[EndpointURLS.EVENTS]
+
+
+NULL_ARRAY = object()
+"""Reply of an aborted transaction."""
+
+
+class LocalRespServer:
+    """
+    Stand-in for a Redis server, served from a background thread.
+    Implements the commands used by RedisBackend only: PING, AUTH, SELECT, TIME, GET, SET (with PX),
+    and optimistic transactions (WATCH, MULTI, EXEC).
+    """
+
+    def __init__(self, password: Optional[str] = None):
+        self.password = password
+        self.values: dict[bytes, bytes] = dict()
+        self.expire_at: dict[bytes, float] = dict()
+        self.versions: dict[bytes, int] = dict()
+        self.commands: list[bytes] = list()
+        self.aborted_transactions = 0
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(asyncio.start_server(self.serve_client, '127.0.0.1', 0))
+        self.host, self.port = self.server.sockets[0].getsockname()[:2]
+        self.thread = Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = _RespClientState(authenticated=self.password is None)
+        try:
+            while True:
+                command, *args = await read_resp_reply(reader)
+                writer.write(encode_resp_reply(self.handle(client, command.upper(), *args)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def handle(self, client: '_RespClientState', command: bytes, *args: bytes):
+        self.commands.append(command)
+        if command == b'AUTH':
+            client.authenticated = args[0].decode() == self.password
+            return 'OK' if client.authenticated else RedisError('WRONGPASS invalid password')
+        if not client.authenticated:
+            return RedisError('NOAUTH Authentication required.')
+        if command == b'MULTI':
+            client.queued = list()
+            return 'OK'
+        if command == b'EXEC':
+            queued, watched = client.queued, client.watched
+            client.queued, client.watched = None, dict()
+            if any(self.versions.get(key, 0) != version for key, version in watched.items()):
+                self.aborted_transactions += 1
+                return NULL_ARRAY
+            return [self.execute(*queued_command) for queued_command in queued]
+        if client.queued is not None:
+            client.queued.append((command, *args))
+            return 'QUEUED'
+        if command == b'WATCH':
+            client.watched.update({key: self.versions.get(key, 0) for key in args})
+            return 'OK'
+        return self.execute(command, *args)
+
+    def execute(self, command: bytes, *args: bytes):
+        for key, expire_at in list(self.expire_at.items()):
+            if expire_at <= time.time():
+                del self.values[key], self.expire_at[key]
+        if command in (b'PING', b'SELECT'):
+            return 'PONG' if command == b'PING' else 'OK'
+        if command == b'TIME':
+            now = time.time()
+            return [str(int(now)).encode(), str(int(now % 1 * 1_000_000)).encode()]
+        if command == b'GET':
+            return self.values.get(args[0])
+        if command == b'SET':
+            key, value, *options = args
+            self.values[key] = value
+            self.versions[key] = self.versions.get(key, 0) + 1
+            self.expire_at.pop(key, None)
+            if options and options[0].upper() == b'PX':
+                self.expire_at[key] = time.time() + int(options[1]) / 1_000
+            return 'OK'
+        return RedisError(f'ERR unknown command {command.decode()!r}')
+
+    def stop(self) -> None:
+        self.server.close()
+        asyncio.run_coroutine_threadsafe(self.server.wait_closed(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class _RespClientState:
+    """State of a connection to the LocalRespServer."""
+
+    def __init__(self, authenticated: bool):
+        self.authenticated = authenticated
+        self.watched: dict[bytes, int] = dict()
+        self.queued: Optional[list[tuple]] = None
+
+
+def encode_resp_reply(reply: Union[str, int, bytes, list, None, RedisError, object]) -> bytes:
+    if isinstance(reply, RedisError):
+        return f'-{reply}\r\n'.encode()
+    if isinstance(reply, str):
+        return f'+{reply}\r\n'.encode()
+    if isinstance(reply, int):
+        return f':{reply}\r\n'.encode()
+    if reply is None:
+        return b'$-1\r\n'
+    if reply is NULL_ARRAY:
+        return b'*-1\r\n'
+    if isinstance(reply, list):
+        return b''.join([f'*{len(reply)}\r\n'.encode()] + [encode_resp_reply(item) for item in reply])
+    return b'$%d\r\n%s\r\n' % (len(reply), reply)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from open_sea_v1.helpers.checkpoint import CrawlCheckpoint, SyncWatermark
+from open_sea_v1.helpers.testing_payloads import mk_event_json, mk_events_page, mk_timestamp
+
+
+class TestCrawlCheckpoint(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.query = dict(endpoint='EventsEndpoint', params=dict(occurred_before=datetime(2021, 8, 1), offset=0))
+        self.checkpoint = CrawlCheckpoint.for_query(self.tmp_dir.name, self.query)
+
+    def test_pages_and_cursor_are_persisted(self):
+        pages = [mk_events_page(first_event_id=i * 5, size=5) for i in range(3)]
+        for i, page in enumerate(pages, start=1):
+            self.checkpoint.save_page(page, next_offset=i * 5, max_pages=None)
+
+        reloaded = CrawlCheckpoint.for_query(self.tmp_dir.name, self.query)
+        self.assertEqual(pages, list(reloaded.iter_pages()))
+        self.assertEqual(15, reloaded.state['next_offset'])
+        self.assertFalse(reloaded.is_complete)
+
+    def test_same_queries_share_their_checkpoint(self):
+        same_query = dict(params=dict(offset=0, occurred_before=datetime(2021, 8, 1)), endpoint='EventsEndpoint')
+        other_query = {**self.query, 'endpoint': 'AssetsEndpoint'}
+        self.assertEqual(self.checkpoint.directory, CrawlCheckpoint.for_query(self.tmp_dir.name, same_query).directory)
+        self.assertNotEqual(self.checkpoint.directory, CrawlCheckpoint.for_query(self.tmp_dir.name, other_query).directory)
+
+    def test_complete_and_clear(self):
+        self.checkpoint.save_page(mk_events_page(first_event_id=0, size=1), next_offset=5, max_pages=None)
+        self.checkpoint.mark_complete()
+        self.assertTrue(CrawlCheckpoint(self.checkpoint.directory).is_complete)
+        self.checkpoint.clear()
+        self.assertFalse(Path(self.checkpoint.directory).exists())
+        self.assertEqual([], list(self.checkpoint.iter_pages()))
+
+    def test_state_is_replaced_atomically(self):
+        self.checkpoint.save_page(mk_events_page(first_event_id=0, size=1), next_offset=5, max_pages=None)
+        self.assertEqual({'state.json', 'page-000001.json'}, {p.name for p in self.checkpoint.directory.iterdir()})
+
+
+class TestSyncWatermark(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.query = dict(endpoint='EventsEndpoint', params=dict(event_type='successful'))
+
+    def test_events_sharing_the_watermark_date_are_told_apart_by_id(self):
+        watermark = SyncWatermark.for_query(self.tmp_dir.name, self.query)
+        watermark.advance([mk_event_json(1), mk_event_json(2) | dict(created_date=mk_timestamp(1))])
+        self.assertEqual(mk_timestamp(1), watermark.created_date)
+        self.assertTrue(watermark.is_seen(mk_event_json(0)))
+        self.assertTrue(watermark.is_seen(mk_event_json(2) | dict(created_date=mk_timestamp(1))))
+        self.assertFalse(watermark.is_seen(mk_event_json(3) | dict(created_date=mk_timestamp(1))))
+        self.assertFalse(watermark.is_seen(mk_event_json(2)))
+
+    def test_watermark_is_persisted_per_query(self):
+        watermark = SyncWatermark.for_query(self.tmp_dir.name, self.query)
+        watermark.advance([mk_event_json(5), mk_event_json(3)])
+        watermark.save()
+
+        reloaded = SyncWatermark.for_query(self.tmp_dir.name, self.query)
+        self.assertEqual((mk_timestamp(5), {5}), (reloaded.created_date, reloaded.ids))
+        other_query = SyncWatermark.for_query(self.tmp_dir.name, {**self.query, 'params': dict()})
+        self.assertIsNone(other_query.created_date)
+        self.assertFalse(other_query.is_seen(mk_event_json(0)))
@@ -0,0 +1,80 @@
+from datetime import datetime
+from decimal import Decimal
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
+
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.helpers.columnar import Column, ColumnarExtractor, ColumnKind, to_datetime, to_exact_int
+from open_sea_v1.helpers.testing_payloads import mk_events_page
+
+
+class TestColumnarExtractor(TestCase):
+
+    def setUp(self) -> None:
+        self.events = mk_events_page(first_event_id=0, size=3)['asset_events']
+        self.events.append({'id': 3, 'event_type': 'transfer'})  # most nested objects are missing on transfers
+        self.extractor = ColumnarExtractor(EventsEndpoint._columns)
+        self.extractor.extend(self.events)
+
+    def test_values_are_read_from_dotted_paths(self):
+        self.assertEqual(4, len(self.extractor))
+        self.assertEqual([e['asset']['token_id'] for e in self.events[:3]], self.extractor.values['token_id'][:3])
+        self.assertEqual(
+            [e['seller']['address'] for e in self.events[:3]], self.extractor.values['seller'][:3])
+
+    def test_missing_keys_are_missing_values(self):
+        self.assertEqual({None}, {values[-1] for name, values in self.extractor.values.items() if name not in (
+            'id', 'event_type')})
+
+    def test_no_column_raises(self):
+        self.assertRaises(ValueError, ColumnarExtractor, dict())
+
+    def test_exact_int_parsing(self):
+        self.assertEqual(10 ** 30 + 1, to_exact_int(str(10 ** 30 + 1)))
+        self.assertEqual(1500, to_exact_int('1500.000'))
+        self.assertIsNone(to_exact_int(None))
+        self.assertIsNone(to_exact_int(''))
+
+    def test_datetime_parsing(self):
+        expected = datetime(2021, 8, 1, 12, 30, 5, 123000)
+        for value in ('2021-08-01T12:30:05.123', '2021-08-01T12:30:05.123Z', '2021-08-01T12:30:05.123+00:00',
+                      '2021-08-01T14:30:05.123+02:00', '2021-08-01T10:30:05.123-02:00'):
+            with self.subTest(value=value):
+                self.assertEqual(expected, to_datetime(value))
+        self.assertIsNone(to_datetime(None))
+
+    @skipIf(find_spec('numpy') is None, 'numpy is not installed')
+    def test_numpy_dtypes(self):
+        import numpy as np
+        columns = self.extractor.to_numpy()
+        self.assertEqual(np.int64, columns['id'].dtype)
+        self.assertEqual(np.dtype('datetime64[us]'), columns['created_date'].dtype)
+        self.assertTrue(np.isnat(columns['created_date'][-1]))
+        self.assertEqual(np.dtype('S42'), columns['seller'].dtype)
+        self.assertEqual(np.float64, columns['quantity'].dtype)
+        self.assertTrue(np.isnan(columns['quantity'][-1]))
+
+    @skipIf(find_spec('numpy') is None, 'numpy is not installed')
+    def test_wei_values_stay_exact_in_numpy(self):
+        wei = 1234567 * 10 ** 18 + 1  # beyond float64 precision
+        extractor = ColumnarExtractor(dict(price=Column('price', ColumnKind.WEI)))
+        extractor.extend([{'price': str(wei)}, {'price': None}])
+        self.assertEqual([wei, None], extractor.to_numpy()['price'].tolist())
+
+    @skipIf(find_spec('pandas') is None, 'pandas is not installed')
+    def test_pandas_dataframe(self):
+        df = self.extractor.to_pandas()
+        self.assertEqual(list(EventsEndpoint._columns), list(df.columns))
+        self.assertEqual(4, len(df))
+        self.assertEqual([0, 1, 2, 3], sorted(df['id'].tolist()))
+
+    @skipIf(find_spec('pyarrow') is None, 'pyarrow is not installed')
+    def test_arrow_table(self):
+        import pyarrow as pa
+        table = self.extractor.to_arrow()
+        self.assertEqual(pa.decimal128(38, 0), table.schema.field('total_price').type)
+        self.assertEqual(pa.binary(42), table.schema.field('seller').type)
+        self.assertEqual(pa.timestamp('us'), table.schema.field('created_date').type)
+        prices = table.column('total_price').to_pylist()
+        self.assertEqual([Decimal(e['total_price']) for e in self.events[:3]] + [None], prices)
+        self.assertEqual(1, table.column('quantity').null_count)
@@ -1,6 +1,8 @@
-from unittest import TestCase
+from decimal import Decimal
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
 
-from open_sea_v1.helpers.ether_converter import EtherConverter, EtherUnit
+from open_sea_v1.helpers.ether_converter import EtherArrayConverter, EtherConverter, EtherUnit, wei_to_ether
 
 
 class TestEtherUnitConverter(TestCase):
@@ -29,3 +31,63 @@ class TestEtherUnitConverter(TestCase):
 
     def test_to_ether(self):
         self.assertEqual(0.000_000_035, self.converter.ether)
+
+    def test_str_wei_quantities_keep_their_precision(self):
+        wei = '123456789012345678901'  # beyond float64 precision
+        self.assertEqual(123.456789012345678901, EtherConverter(quantity=wei, unit=EtherUnit.WEI).ether)
+        self.assertEqual(int(wei), EtherConverter(quantity=wei, unit=EtherUnit.WEI).wei)
+
+    def test_wei_to_ether(self):
+        self.assertEqual(1.5, wei_to_ether('1500000000000000000'))
+        self.assertEqual(1.5, wei_to_ether(1_500_000_000_000_000_000))
+
+
+@skipIf(find_spec('numpy') is None, 'numpy is not installed')
+class TestEtherArrayConverter(TestCase):
+
+    def setUp(self) -> None:
+        self.wei_quantities = ['35000000000', '1500000000000000001', '123456789012345678901', 10 ** 30, None, '']
+
+    def test_matches_the_scalar_converter(self):
+        import numpy as np
+        converter = EtherArrayConverter(self.wei_quantities[:4], unit=EtherUnit.WEI)
+        for unit in EtherUnit:
+            with self.subTest(unit=unit):
+                expected = [EtherConverter(quantity=q, unit=EtherUnit.WEI).convert_to(unit) for q in converter.quantities]
+                np.testing.assert_allclose(converter.convert_to(unit), np.array(expected, dtype=np.float64), rtol=1e-15)
+
+    def test_numpy_arrays_of_other_units(self):
+        import numpy as np
+        converter = EtherArrayConverter(np.array([35, 70]), unit=EtherUnit.GWEI)
+        self.assertEqual([35_000_000_000, 70_000_000_000], converter.wei.tolist())
+        self.assertEqual([0.000_000_035, 0.000_000_07], converter.ether.tolist())
+
+    def test_exact_mode_of_numpy_arrays(self):
+        import numpy as np
+        converter = EtherArrayConverter(np.array([35, 70], dtype=np.int64), unit=EtherUnit.GWEI, exact=True)
+        self.assertEqual([Decimal('3.5E-8'), Decimal('7.0E-8')], converter.ether)
+        self.assertEqual([Decimal('1.5'), Decimal('2.25')], EtherArrayConverter(np.array([1.5, 2.25]), exact=True).wei)
+
+    def test_missing_quantities_are_nan(self):
+        import numpy as np
+        ether = EtherArrayConverter(self.wei_quantities).ether
+        self.assertEqual([False, False, False, False, True, True], np.isnan(ether).tolist())
+
+    def test_exact_mode_is_never_rounded(self):
+        converter = EtherArrayConverter(self.wei_quantities, exact=True)
+        self.assertEqual(
+            [Decimal('3.5E-8'), Decimal('1.500000000000000001'), Decimal('123.456789012345678901'),
+             Decimal(10 ** 12), None, None],
+            converter.ether,
+        )
+        self.assertEqual(Decimal('1500000000.000000001'), converter.gwei[1])
+        self.assertEqual(10 ** 30, converter.wei[3])
+
+    def test_to_usd(self):
+        converter = EtherArrayConverter(['1500000000000000000', '2000000000000000000'])
+        self.assertEqual([3000.0, 4000.0], converter.to_usd(2000).tolist())
+        self.assertEqual([1500.0, 6000.0], converter.to_usd([1000, '3000']).tolist())
+
+    def test_exact_to_usd(self):
+        converter = EtherArrayConverter(['1500000000000000001', None], exact=True)
+        self.assertEqual([Decimal('3000.7500000000000020005'), None], converter.to_usd('2000.5'))
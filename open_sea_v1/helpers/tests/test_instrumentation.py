@@ -0,0 +1,121 @@
+from collections import defaultdict
+from unittest import TestCase
+
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.instrumentation import MetricsHooks, MetricsRegistry, OpenTelemetryHooks, RequestTimings
+from open_sea_v1.helpers.retry import RetryPolicy
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+
+
+class TestMetricsRegistry(TestCase):
+
+    def test_histograms_count_the_observations_by_bucket(self):
+        histogram = MetricsRegistry().histogram('latency_seconds', 'Latency.', ('endpoint',), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value, endpoint='EventsEndpoint')
+        self.assertEqual([1, 2, 1], histogram.counts[('EventsEndpoint',)])
+        self.assertEqual(4, histogram.count(endpoint='EventsEndpoint'))
+        self.assertAlmostEqual(4.25, histogram.sum(endpoint='EventsEndpoint'))
+
+    def test_metrics_are_exported_in_the_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter('requests_total', 'Requests.', ('status',)).inc(status=200)
+        registry.histogram('parse_seconds', 'Parsing.', buckets=(0.1,)).observe(0.05)
+        self.assertEqual(
+            '# HELP requests_total Requests.\n'
+            '# TYPE requests_total counter\n'
+            'requests_total{status="200"} 1\n'
+            '# HELP parse_seconds Parsing.\n'
+            '# TYPE parse_seconds histogram\n'
+            'parse_seconds_bucket{le="0.1"} 1\n'
+            'parse_seconds_bucket{le="+Inf"} 1\n'
+            'parse_seconds_sum 0.05\n'
+            'parse_seconds_count 1\n',
+            registry.to_prometheus())
+
+    def test_metrics_are_registered_once_per_name(self):
+        registry = MetricsRegistry()
+        self.assertIs(registry.counter('requests_total', 'Requests.'), registry.counter('requests_total', 'Requests.'))
+        with self.assertRaises(ValueError):
+            registry.histogram('requests_total', 'Requests.')
+        with self.assertRaises(ValueError):
+            registry.counter('requests_total', 'Requests.').inc(status=200)
+
+
+class TestMetricsHooksOfTheClient(LocalServerTestCase):
+
+    server_kwargs = dict(total_items=12, latency=0.01)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.server.quota, self.server.rate_limit_headers = None, True
+        self.hooks = MetricsHooks()
+
+    def crawl(self, **kwargs) -> list:
+        client_params = ClientParams(limit=5, page_size=5, concurrent_pagination=False, hooks=self.hooks, **kwargs)
+        with OpenSeaSession(rate_limit=200) as session:
+            return EventsEndpoint(client_params=client_params, session=session).get_parsed_pages()
+
+    def test_requests_and_parsing_are_recorded(self):
+        self.crawl()
+        endpoint = 'EventsEndpoint'
+        self.assertEqual(3, self.hooks.requests.value(endpoint=endpoint, status=200))
+        self.assertEqual(12, self.hooks.parsed_items.value(endpoint=endpoint))
+        self.assertEqual(3, self.hooks.parse_seconds.count(endpoint=endpoint))
+        self.assertGreater(self.hooks.received_bytes.value(endpoint=endpoint), 12 * 1_000)
+        self.assertGreaterEqual(self.hooks.request_phases.sum(endpoint=endpoint, phase='ttfb'), 3 * 0.01)
+        self.assertGreater(self.hooks.request_phases.sum(endpoint=endpoint, phase='connect'), 0)
+        self.assertIn('opensea_requests_total{endpoint="EventsEndpoint",status="200"} 3',
+                      self.hooks.registry.to_prometheus())
+
+    def test_retries_and_failed_requests_are_recorded(self):
+        self.server.inject_faults(5, 503)
+        self.crawl(retry_policy=RetryPolicy(base_delay=0.0))
+        self.assertEqual(1, self.hooks.requests.value(endpoint='EventsEndpoint', status=503))
+        self.assertEqual(1, self.hooks.retries.value(endpoint='EventsEndpoint'))
+
+    def test_throttled_requests_are_recorded(self):
+        self.server.quota, self.server.quota_window, self.server.rate_limit_headers = 2, 0.2, False
+        self.crawl()
+        throttled = self.hooks.throttled.value(endpoint='EventsEndpoint')
+        self.assertEqual(self.server.throttled_requests, throttled)
+        self.assertGreater(throttled, 0)
+        self.assertEqual(throttled, self.hooks.requests.value(endpoint='EventsEndpoint', status=429))
+
+
+class FakeInstrument:
+
+    def __init__(self):
+        self.values = defaultdict(float)
+
+    def add(self, value, attributes):
+        self.values[tuple(sorted(attributes.items()))] += value
+
+    record = add
+
+
+class FakeMeter:
+
+    def __init__(self):
+        self.instruments: dict[str, FakeInstrument] = dict()
+
+    def create_counter(self, name, unit='', description=''):
+        return self.instruments.setdefault(name, FakeInstrument())
+
+    create_histogram = create_counter
+
+
+class TestOpenTelemetryHooks(TestCase):
+
+    def test_requests_are_recorded_with_the_instruments_of_the_meter(self):
+        meter = FakeMeter()
+        hooks = OpenTelemetryHooks(meter)
+        hooks.on_request(RequestTimings(endpoint='EventsEndpoint', url='', status=200, ttfb=0.2, received_bytes=10))
+        hooks.on_request(RequestTimings(endpoint='EventsEndpoint', url='', error=TimeoutError()))
+        requests = meter.instruments['opensea.requests'].values
+        self.assertEqual(1, requests[(('endpoint', 'EventsEndpoint'), ('status', '200'))])
+        self.assertEqual(1, requests[(('endpoint', 'EventsEndpoint'), ('status', 'error'))])
+        phases = meter.instruments['opensea.request.phase.duration'].values
+        self.assertEqual(0.2, phases[(('endpoint', 'EventsEndpoint'), ('phase', 'ttfb'))])
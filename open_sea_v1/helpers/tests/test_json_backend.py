@@ -0,0 +1,60 @@
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from open_sea_v1.helpers.json_backend import get_installed_json_backends, get_json_backend
+from open_sea_v1.helpers.response_parser import ResponseParser
+from open_sea_v1.helpers.testing_payloads import mk_events_page
+from open_sea_v1.responses.event import EventResponse
+
+
+class TestJsonBackend(TestCase):
+
+    def setUp(self) -> None:
+        get_json_backend.cache_clear()
+        self.page = mk_events_page(first_event_id=0, size=5)
+
+    def tearDown(self) -> None:
+        get_json_backend.cache_clear()
+
+    def test_installed_backends_decode_pages_identically(self):
+        for backend in get_installed_json_backends():
+            with self.subTest(backend=backend.name):
+                encoded = backend.dumps(self.page)
+                self.assertEqual(self.page, backend.loads(encoded))
+                self.assertEqual(self.page, backend.loads(encoded.encode()))
+
+    def test_installed_backends_encode_integers_wider_than_64_bits(self):
+        document = {'wide': 2 ** 64 + 1, 'negative': -2 ** 64, 'wei': str(2 ** 70), 'price': 1.5}
+        stdlib_backend = get_json_backend('json')
+        for backend in get_installed_json_backends():
+            with self.subTest(backend=backend.name):
+                self.assertEqual(document, stdlib_backend.loads(backend.dumps(document)))
+                self.assertEqual({'1': 2 ** 64}, stdlib_backend.loads(backend.dumps({1: 2 ** 64})))  # keys become str
+
+    def test_default_backend_is_the_fastest_installed(self):
+        self.assertEqual(get_installed_json_backends()[0].name, get_json_backend().name)
+
+    def test_stdlib_backend_is_always_installed(self):
+        self.assertIn('json', [backend.name for backend in get_installed_json_backends()])
+
+    def test_backend_can_be_chosen_with_environment_variable(self):
+        with patch.dict(environ, {'OPENSEA_JSON_BACKEND': 'json'}):
+            self.assertEqual('json', get_json_backend().name)
+
+    def test_unknown_backend_raises_value_error(self):
+        self.assertRaises(ValueError, get_json_backend, 'simplejson')
+
+
+class TestResponseParser(TestCase):
+
+    def test_dump_and_load_with_each_installed_backend(self):
+        events = [EventResponse(e) for e in mk_events_page(first_event_id=0, size=3)['asset_events']]
+        for backend in get_installed_json_backends():
+            with self.subTest(backend=backend.name), TemporaryDirectory() as target_dir:
+                parser = ResponseParser(Path(target_dir), EventResponse, json_backend=backend)
+                parser.dump(events)
+                loaded = parser.load(Path(target_dir) / 'sample.json')
+                self.assertEqual([e._json for e in events], [e._json for e in loaded])
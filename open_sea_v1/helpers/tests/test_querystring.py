@@ -0,0 +1,52 @@
+from datetime import datetime
+from importlib.util import find_spec
+from unittest import TestCase, skipIf
+
+from open_sea_v1.endpoints.events import EventType
+from open_sea_v1.helpers.querystring import _encoded_around_offset, encode_params, mk_querystring
+
+URL = 'https://api.opensea.io/api/v1/events'
+PARAMS = dict(
+    asset_contract_address=None,
+    token_ids=[1, None, 2],
+    only_opensea=True,
+    occurred_after=datetime(2021, 8, 1),
+    event_type=EventType.SUCCESSFUL,
+    collection_slug='a b&c/é~',
+    offset=100,
+    limit=50,
+)
+
+
+class TestQuerystring(TestCase):
+
+    def test_params_are_encoded_as_requests_did(self):
+        self.assertEqual(
+            f'{URL}?token_ids=1&token_ids=2&only_opensea=True&occurred_after=2021-08-01+00%3A00%3A00'
+            f'&event_type=successful&collection_slug=a+b%26c%2F%C3%A9~&offset=100&limit=50',
+            mk_querystring(URL, PARAMS))
+
+    def test_the_params_around_the_offset_are_encoded_once(self):
+        _encoded_around_offset.cache_clear()
+        querystrings = [mk_querystring(URL, {**PARAMS, 'offset': offset}) for offset in (0, 50, 100)]
+        self.assertEqual(1, _encoded_around_offset.cache_info().misses)
+        self.assertEqual([encode_params({**PARAMS, 'offset': offset}) for offset in (0, 50, 100)],
+                         [querystring.split('?')[1] for querystring in querystrings])
+
+    def test_values_equal_but_of_other_types_are_not_confused(self):
+        self.assertEqual(f'{URL}?include_invalid=True&offset=0',
+                         mk_querystring(URL, dict(include_invalid=True, offset=0)))
+        self.assertEqual(f'{URL}?include_invalid=1&offset=0', mk_querystring(URL, dict(include_invalid=1, offset=0)))
+
+    def test_params_without_offset_or_values(self):
+        self.assertEqual(URL, mk_querystring(URL, dict(owner=None)))
+        self.assertEqual(f'{URL}?x=1&limit=5', mk_querystring(f'{URL}?x=1', dict(limit=5)))
+        self.assertEqual(f'{URL}?offset=0', mk_querystring(URL, dict(offset=0, token_ids=[])))
+
+    @skipIf(find_spec('requests') is None, 'requests is not installed')
+    def test_querystrings_are_identical_to_those_of_requests(self):
+        from requests.models import PreparedRequest
+        for params in (PARAMS, {**PARAMS, 'offset': 0}, dict(limit=5), dict(side=1, sale_kind=None, offset=7)):
+            prepared_request = PreparedRequest()
+            prepared_request.prepare_url(URL, params)
+            self.assertEqual(prepared_request.url, mk_querystring(URL, params))
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from open_sea_v1.helpers.rate_limit_backends import (FileLockBackend, LocalBackend, RateLimitBackend, RedisBackend,
+                                                     RedisError, RespConnection)
+from open_sea_v1.helpers.rate_limiter import RateLimiter
+from open_sea_v1.helpers.testing_server import LocalRespServer
+
+
+async def throttled_send_times(backend: RateLimitBackend, requests_count: int, rate: int) -> list[float]:
+    send_times = list()
+    async with RateLimiter(rate_limit=rate, concurrency_limit=5, adaptive=False, backend=backend) as limiter:
+        for _ in range(requests_count):
+            async with limiter.throttle():
+                send_times.append(time.time())
+    return send_times
+
+
+def send_from_another_process(path: str, requests_count: int, rate: int, send_times_queue) -> None:
+    send_times_queue.put(asyncio.run(throttled_send_times(FileLockBackend(path), requests_count, rate)))
+
+
+class TestLocalBackend(TestCase):
+    """The slots are computed from the timestamps passed to reserve_at(), so no time elapses in these tests."""
+
+    def setUp(self) -> None:
+        self.backend = LocalBackend()
+
+    def test_requests_are_spaced_evenly(self):
+        delays = [self.backend.reserve_at(100, cost=1, rate=10, burst=1) for _ in range(4)]
+        for expected, delay in zip([0, 0.1, 0.2, 0.3], delays):
+            self.assertAlmostEqual(expected, delay)
+
+    def test_idle_time_is_not_accumulated_beyond_the_burst(self):
+        self.backend.reserve_at(100, cost=1, rate=10, burst=3)
+        delays = [self.backend.reserve_at(200, cost=1, rate=10, burst=3) for _ in range(5)]
+        for expected, delay in zip([0, 0, 0, 0.1, 0.2], delays):
+            self.assertAlmostEqual(expected, delay)
+
+    def test_weighted_costs(self):
+        self.assertEqual(0, self.backend.reserve_at(100, cost=3, rate=10, burst=1))
+        self.assertAlmostEqual(0.3, self.backend.reserve_at(100, cost=1, rate=10, burst=1))
+
+
+class TestFileLockBackend(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = Path(self.tmp_dir.name) / 'rate_limit'
+
+    def test_schedule_is_persisted_in_the_file(self):
+        async def reserve_twice() -> list[float]:
+            return [await FileLockBackend(self.path).reserve(cost=1, rate=1, burst=1) for _ in range(2)]
+        first_delay, second_delay = asyncio.run(reserve_twice())
+        self.assertEqual(0, first_delay)
+        self.assertAlmostEqual(1, second_delay, delta=0.05)
+        self.assertAlmostEqual(time.time() + 2, float(self.path.read_text()), delta=0.1)
+
+    def test_processes_share_the_rate_limit_budget(self):
+        rate, requests_per_process, processes_count = 20, 8, 3
+        context = get_context()
+        send_times_queue = context.Queue()
+        processes = [
+            context.Process(target=send_from_another_process,
+                            args=(str(self.path), requests_per_process, rate, send_times_queue))
+            for _ in range(processes_count)
+        ]
+        for process in processes:
+            process.start()
+        send_times = sorted(t for _ in processes for t in send_times_queue.get(timeout=30))
+        for process in processes:
+            process.join()
+
+        intervals = [later - earlier for earlier, later in zip(send_times, send_times[1:])]
+        self.assertEqual(requests_per_process * processes_count, len(send_times))
+        self.assertGreater(min(intervals), 0.8 / rate)
+        self.assertLess((len(send_times) - 1) / (send_times[-1] - send_times[0]), rate * 1.1)
+
+
+class TestRedisBackend(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = LocalRespServer(password='secret')
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.stop()
+
+    def mk_backend(self, **kwargs) -> RedisBackend:
+        return RedisBackend(**{'host': self.server.host, 'port': self.server.port, 'password': 'secret',
+                               'key': self.id(), **kwargs})
+
+    def test_hosts_share_the_rate_limit_budget(self):
+        rate, requests_per_host = 40, 30
+
+        async def crawl_from_two_hosts() -> list[float]:
+            send_times = await asyncio.gather(*(
+                throttled_send_times(self.mk_backend(), requests_per_host, rate) for _ in range(2)))
+            return sorted(send_times[0] + send_times[1])
+
+        send_times = asyncio.run(crawl_from_two_hosts())
+        for window_start in send_times:
+            sent_in_window = sum(1 for t in send_times if window_start <= t < window_start + 1)
+            self.assertLessEqual(sent_in_window, rate + 1)
+        self.assertLess((len(send_times) - 1) / (send_times[-1] - send_times[0]), rate * 1.1)
+
+    def test_requests_are_spaced_evenly(self):
+        async def reserve() -> list[float]:
+            backend = self.mk_backend()
+            try:
+                return [await backend.reserve(cost=1, rate=10, burst=1) for _ in range(3)]
+            finally:
+                await backend.close()
+        for expected, delay in zip([0, 0.1, 0.2], asyncio.run(reserve())):
+            self.assertAlmostEqual(expected, delay, delta=0.02)
+
+    def test_key_expires_once_its_schedule_is_over(self):
+        async def reserve():
+            backend = self.mk_backend()
+            await backend.reserve(cost=10, rate=10, burst=1)
+            await backend.close()
+        asyncio.run(reserve())
+        self.assertAlmostEqual(time.time() + 2, self.server.expire_at[self.id().encode()], delta=0.1)
+
+    def test_concurrent_updates_are_retried(self):
+        async def reserve_from_two_hosts() -> list[float]:
+            backends = [self.mk_backend() for _ in range(2)]
+            try:
+                return sorted(await asyncio.gather(*(
+                    backend.reserve(cost=1, rate=10, burst=1) for backend in backends for _ in range(5))))
+            finally:
+                await asyncio.gather(*(backend.close() for backend in backends))
+        for expected, delay in zip([i / 10 for i in range(10)], asyncio.run(reserve_from_two_hosts())):
+            self.assertAlmostEqual(expected, delay, delta=0.03)
+
+    def test_reservations_cancelled_mid_transaction_do_not_corrupt_the_next_ones(self):
+        async def cancel_then_reserve() -> list[float]:
+            backend = self.mk_backend()
+            try:
+                await backend.reserve(cost=1, rate=10, burst=1)  # connects
+                cancelled = asyncio.create_task(backend.reserve(cost=1, rate=10, burst=1))
+                await asyncio.sleep(0)  # the transaction is sent, its replies are not read yet
+                cancelled.cancel()
+                await asyncio.gather(cancelled, return_exceptions=True)
+                return [await backend.reserve(cost=1, rate=10, burst=1) for _ in range(2)]
+            finally:
+                await backend.close()
+        first_delay, second_delay = asyncio.run(cancel_then_reserve())
+        self.assertAlmostEqual(0.1, second_delay - first_delay, delta=0.02)
+
+    def test_wrong_password_raises(self):
+        async def reserve():
+            await self.mk_backend(password='wrong').reserve(cost=1, rate=10, burst=1)
+        self.assertRaises(RedisError, asyncio.run, reserve())
+
+    def test_resp_replies(self):
+        async def execute() -> list:
+            connection = await RespConnection.open(self.server.host, self.server.port)
+            try:
+                return await connection.execute(('AUTH', 'secret'), ('PING',), ('GET', 'missing'), ('TIME',))
+            finally:
+                await connection.close()
+        auth, ping, missing, server_time = asyncio.run(execute())
+        self.assertEqual(('OK', 'PONG', None), (auth, ping, missing))
+        self.assertAlmostEqual(time.time(), int(server_time[0]), delta=2)
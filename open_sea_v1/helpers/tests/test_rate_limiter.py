@@ -0,0 +1,130 @@
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.rate_limiter import RateLimiter, parse_rate_limit_reset, parse_retry_after
+from open_sea_v1.helpers.testing_server import LocalEventsServer
+
+
+class TestRateLimiterScheduling(TestCase):
+
+    @staticmethod
+    def mk_limiter(**kwargs) -> RateLimiter:
+        return RateLimiter(**{'rate_limit': 10, 'concurrency_limit': 5, 'adaptive': False, **kwargs})
+
+    def test_invalid_burst_raises(self):
+        self.assertRaises(ValueError, self.mk_limiter, burst=0)
+
+    def test_throttle_waits_for_the_slot(self):
+        async def test():
+            async with self.mk_limiter(rate_limit=20) as limiter:
+                started_at = time.monotonic()
+                for _ in range(5):
+                    async with limiter.throttle():
+                        pass
+                return time.monotonic() - started_at
+        self.assertAlmostEqual(0.2, asyncio.run(test()), delta=0.05)
+
+
+class TestAdaptiveRateLimiter(TestCase):
+
+    @staticmethod
+    def run_with_limiter(test, **limiter_kwargs):
+        async def with_limiter():
+            async with RateLimiter(**{'rate_limit': 10, 'concurrency_limit': 5, **limiter_kwargs}) as limiter:
+                return await test(limiter)
+        return asyncio.run(with_limiter())
+
+    def test_rate_increases_additively_while_requests_succeed(self):
+        async def test(limiter: RateLimiter):
+            for _ in range(10):
+                limiter.on_response(200, {})
+            return limiter.current_rate
+        self.assertAlmostEqual(11, self.run_with_limiter(test), delta=0.1)
+
+    def test_rate_is_capped_by_max_rate(self):
+        async def test(limiter: RateLimiter):
+            for _ in range(10_000):
+                limiter.on_response(200, {})
+            return limiter.current_rate
+        self.assertEqual(12, self.run_with_limiter(test, max_rate=12))
+
+    def test_throttled_response_decreases_the_rate_once_per_cooldown(self):
+        async def test(limiter: RateLimiter):
+            for _ in range(5):  # requests which were in flight together
+                limiter.on_response(429, {'Retry-After': '0'})
+            return limiter.current_rate, limiter.throttled_responses
+        self.assertEqual((5, 5), self.run_with_limiter(test))
+
+    def test_rate_is_floored_by_min_rate(self):
+        async def test(limiter: RateLimiter):
+            for _ in range(10):
+                limiter.on_response(429, {'Retry-After': '0'})
+                limiter._last_decrease_at = float('-inf')
+            return limiter.current_rate
+        self.assertEqual(4, self.run_with_limiter(test, min_rate=4))
+
+    def test_non_adaptive_rate_is_constant(self):
+        async def test(limiter: RateLimiter):
+            limiter.on_response(429, {'Retry-After': '0'})
+            limiter.on_response(200, {})
+            return limiter.current_rate
+        self.assertEqual(10, self.run_with_limiter(test, adaptive=False))
+
+    def test_retry_after_pauses_every_request(self):
+        async def test(limiter: RateLimiter):
+            limiter.on_response(429, {'Retry-After': '0.2'})
+            started_at = time.monotonic()
+            async with limiter.throttle():
+                return time.monotonic() - started_at
+        self.assertGreaterEqual(self.run_with_limiter(test, adaptive=False), 0.19)
+
+    def test_exhausted_rate_limit_headers_pause_until_reset(self):
+        async def test(limiter: RateLimiter):
+            limiter.on_response(200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0.2'})
+            started_at = time.monotonic()
+            async with limiter.throttle():
+                return time.monotonic() - started_at
+        self.assertGreaterEqual(self.run_with_limiter(test), 0.19)
+
+    def test_header_parsing(self):
+        in_two_minutes = datetime.now(timezone.utc) + timedelta(minutes=2)
+        self.assertEqual(3, parse_retry_after('3'))
+        self.assertAlmostEqual(120, parse_retry_after(format_datetime(in_two_minutes, usegmt=True)), delta=2)
+        in_the_unknown_zone = format_datetime(in_two_minutes.replace(tzinfo=None))  # UTC, but formatted as -0000
+        self.assertAlmostEqual(120, parse_retry_after(in_the_unknown_zone), delta=2)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertIsNone(parse_retry_after(None))
+        self.assertEqual(1.5, parse_rate_limit_reset('1.5'))
+        self.assertAlmostEqual(120, parse_rate_limit_reset(str(in_two_minutes.timestamp())), delta=2)
+
+
+class TestAdaptiveRateLimiterAgainstAQuota(TestCase):
+
+    def crawl(self, server: LocalEventsServer) -> RateLimiter:
+        self.addCleanup(server.stop)
+        with patch.object(EventsEndpoint, 'url', server.url):
+            with OpenSeaSession(rate_limit=40, concurrency_limit=5) as session:
+                endpoint = EventsEndpoint(client_params=ClientParams(limit=5, page_size=5), session=session)
+                events = endpoint.get_parsed_pages()
+                rate_limiter = session.rate_limiter
+        self.assertEqual(list(range(server.total_items)), sorted(int(event.id) for event in events))
+        return rate_limiter
+
+    def test_crawl_slows_down_when_throttled(self):
+        server = LocalEventsServer(total_items=100, quota=5, quota_window=0.5, rate_limit_headers=False)
+        rate_limiter = self.crawl(server)
+        self.assertGreater(server.throttled_requests, 0)
+        self.assertLess(server.throttled_requests, server.served_requests)
+        self.assertLess(rate_limiter.current_rate, 40)
+
+    def test_crawl_waits_for_the_quota_reset_announced_by_the_server(self):
+        server = LocalEventsServer(total_items=100, quota=5, quota_window=0.5)
+        self.crawl(server)
+        self.assertLessEqual(server.throttled_requests, 1)
@@ -0,0 +1,54 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.record_replay import Cassette, CassetteMode
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+
+
+class TestCassette(LocalServerTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'cassette.json'
+        self.session = OpenSeaSession(rate_limit=200)
+        self.session.open()
+        self.addCleanup(self.session.close)
+
+    def crawl(self, cassette: Cassette, page_size: int = 5) -> list:
+        client_params = ClientParams(limit=page_size, page_size=page_size, concurrent_pagination=False,
+                                     cassette=cassette)
+        return EventsEndpoint(client_params=client_params, session=self.session).get_parsed_pages()
+
+    def test_recorded_crawls_are_replayed_without_requests(self):
+        with Cassette(self.path, mode=CassetteMode.RECORD) as cassette:
+            recorded_events = self.crawl(cassette)
+        self.assertEqual((3, 3), (cassette.recorded, self.server.served_requests))
+
+        replayed_events = self.crawl(replaying_cassette := Cassette(self.path))
+        self.assertEqual([int(e.id) for e in recorded_events], [int(e.id) for e in replayed_events])
+        self.assertEqual((3, 3), (replaying_cassette.replayed, self.server.served_requests))
+
+    def test_requests_which_were_not_recorded_fail_in_replay_mode(self):
+        with Cassette(self.path, mode=CassetteMode.RECORD) as cassette:
+            self.crawl(cassette)
+        with self.assertRaisesRegex(ConnectionError, 'No response recorded'):
+            self.crawl(Cassette(self.path), page_size=4)
+        self.assertEqual(3, self.server.served_requests)
+
+    def test_once_mode_records_the_requests_which_were_not_recorded(self):
+        with Cassette(self.path, mode=CassetteMode.ONCE) as cassette:
+            self.crawl(cassette)
+        with Cassette(self.path, mode=CassetteMode.ONCE) as cassette:
+            self.assertEqual(12, len(self.crawl(cassette, page_size=4)))
+            self.assertEqual(12, len(self.crawl(cassette)))
+        self.assertEqual((4, 3), (cassette.recorded, cassette.replayed))
+        self.assertEqual(3 + 4, self.server.served_requests)
+
+    def test_recordings_are_keyed_independently_of_the_host(self):
+        self.assertEqual(Cassette.key('https://api.opensea.io/api/v1/events?offset=0&limit=5'),
+                         Cassette.key(f'{self.server.base_url}/api/v1/events?offset=0&limit=5'))
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.response_cache import CacheEntry, CacheStats, MemoryCache, ResponseCache
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+
+
+class TestMemoryCache(TestCase):
+
+    def test_least_recently_used_entries_are_evicted_beyond_max_bytes(self):
+        cache = MemoryCache(max_bytes=10, stats=CacheStats())
+        for key in 'abc':
+            cache.set(key, CacheEntry(b'1234', expires_at=0))
+        self.assertEqual(['b', 'c'], list(cache.entries))
+        cache.get('b')
+        cache.set('d', CacheEntry(b'1234', expires_at=0))
+        self.assertEqual(['b', 'd'], list(cache.entries))
+        self.assertEqual((8, 2), (cache.size_bytes, cache.stats.evictions))
+
+    def test_entries_heavier_than_max_bytes_are_not_kept(self):
+        cache = MemoryCache(max_bytes=3, stats=CacheStats())
+        cache.set('a', CacheEntry(b'1234', expires_at=0))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, cache.size_bytes)
+
+
+class TestResponseCache(TestCase):
+
+    def setUp(self) -> None:
+        self.requests = list()
+        self.response = ({'assets': [1]}, b'{"assets": [1]}', {'ETag': '"v1"'})
+
+    async def request(self, headers: dict):
+        self.requests.append(headers)
+        if 'If-None-Match' in headers and headers['If-None-Match'] == self.response[2].get('ETag'):
+            return None, b'', self.response[2]
+        return self.response
+
+    def fetch(self, cache: ResponseCache, ttl: float = 60) -> dict:
+        return asyncio.run(cache.fetch('https://api.opensea.io/api/v1/assets?limit=1', ttl=ttl, request=self.request))
+
+    def test_fresh_responses_are_served_without_requests(self):
+        cache = ResponseCache()
+        self.assertEqual([{'assets': [1]}] * 3, [self.fetch(cache) for _ in range(3)])
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual((2, 1), (cache.stats.hits, cache.stats.misses))
+
+    def test_expired_responses_are_revalidated_with_their_etag(self):
+        cache = ResponseCache()
+        self.fetch(cache, ttl=0.01)
+        time.sleep(0.02)
+        self.assertEqual({'assets': [1]}, self.fetch(cache, ttl=0.01))
+        self.assertEqual([dict(), {'If-None-Match': '"v1"'}], self.requests)
+        self.assertEqual(1, cache.stats.revalidations)
+
+        self.response = ({'assets': [2]}, b'{"assets": [2]}', {'ETag': '"v2"'})
+        time.sleep(0.02)
+        self.assertEqual({'assets': [2]}, self.fetch(cache, ttl=0.01))
+        self.assertEqual(2, cache.stats.misses)
+
+    def test_expired_responses_without_validators_are_fetched_again(self):
+        self.response = ({'assets': [1]}, b'{"assets": [1]}', dict())
+        cache = ResponseCache()
+        self.fetch(cache, ttl=0.01)
+        time.sleep(0.02)
+        self.fetch(cache, ttl=0.01)
+        self.assertEqual([dict(), dict()], self.requests)
+
+    def test_zero_ttl_disables_the_cache(self):
+        cache = ResponseCache(ttls={'CollectionsEndpoint': 0})
+        self.fetch(cache, ttl=cache.ttl_for('CollectionsEndpoint'))
+        self.fetch(cache, ttl=cache.ttl_for('CollectionsEndpoint'))
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(60, cache.ttl_for('AssetsEndpoint'))
+
+    def test_responses_evicted_from_memory_are_served_from_disk(self):
+        with TemporaryDirectory() as tmp_dir:
+            cache = ResponseCache(max_memory_bytes=1, path=Path(tmp_dir) / 'cache.sqlite')
+            self.fetch(cache)
+            self.assertEqual(0, cache.memory.size_bytes)
+            self.assertEqual({'assets': [1]}, self.fetch(cache))
+            cache.close()
+
+            restarted_cache = ResponseCache(path=Path(tmp_dir) / 'cache.sqlite')
+            self.fetch(restarted_cache)
+            restarted_cache.close()
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual(1, restarted_cache.stats.hits)
+
+
+class TestResponseCacheOfTheClient(LocalServerTestCase):
+
+    def crawl(self, session: OpenSeaSession, cache: ResponseCache) -> list:
+        client_params = ClientParams(limit=5, page_size=5, concurrent_pagination=False, response_cache=cache)
+        return EventsEndpoint(client_params=client_params, session=session).get_parsed_pages()
+
+    def test_repeated_queries_are_served_from_the_cache(self):
+        cache = ResponseCache()
+        with OpenSeaSession(rate_limit=200) as session:
+            events = [self.crawl(session, cache) for _ in range(3)]
+        self.assertEqual(12, len(events[2]))
+        self.assertEqual([e.id for e in events[0]], [e.id for e in events[2]])
+        self.assertEqual(3, self.server.served_requests)
+        self.assertEqual((6, 3), (cache.stats.hits, cache.stats.misses))
+
+    def test_expired_pages_are_revalidated_by_the_server(self):
+        cache = ResponseCache(default_ttl=0.01)
+        with OpenSeaSession(rate_limit=200) as session:
+            self.crawl(session, cache)
+            time.sleep(0.02)
+            self.assertEqual(12, len(self.crawl(session, cache)))
+        self.assertEqual((3, 3), (self.server.served_requests, self.server.not_modified_requests))
+        self.assertEqual(3, cache.stats.revalidations)
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from aiohttp import ContentTypeError
+
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.retry import RetryableStatusError, RetryBudget, RetryPolicy
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+
+
+class TestRetryPolicy(TestCase):
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=False)
+        self.assertEqual([0.5, 1, 2, 3, 3], [policy.backoff(n) for n in range(1, 6)])
+
+    def test_jitter_draws_delays_below_the_backoff(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        delays = [policy.backoff(3) for _ in range(100)]
+        self.assertTrue(all(0 <= delay <= 4 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_retry_after_takes_precedence_when_longer(self):
+        policy = RetryPolicy(base_delay=1, jitter=False)
+        self.assertEqual(5, policy.backoff(1, retry_after=5))
+        self.assertEqual(1, policy.backoff(1, retry_after=0.1))
+
+    def test_only_transient_errors_are_retried(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertTrue(policy.should_retry(RetryableStatusError(503, 'url'), attempt=1))
+        self.assertTrue(policy.should_retry(TimeoutError(), attempt=2))
+        self.assertFalse(policy.should_retry(RetryableStatusError(503, 'url'), attempt=3))
+        self.assertFalse(policy.should_retry(ValueError(), attempt=1))
+
+    def test_html_pages_are_only_retried_for_server_errors(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry(ContentTypeError(None, (), status=520), attempt=1))
+        self.assertFalse(policy.should_retry(ContentTypeError(None, (), status=404), attempt=1))
+        self.assertFalse(policy.should_retry(ContentTypeError(None, (), status=200), attempt=1))
+
+    def test_budget_limits_the_ratio_of_retries(self):
+        budget = RetryBudget(ratio=0.5, min_retries=1, max_retries=10)
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        for _ in range(4):
+            budget.deposit()
+        self.assertEqual([True, True, False], [budget.withdraw() for _ in range(3)])
+
+    def test_invalid_policies_raise(self):
+        self.assertRaises(ValueError, RetryPolicy, max_attempts=0)
+        self.assertRaises(ValueError, RetryPolicy, budget_ratio=2)
+
+
+class TestRetriesAgainstAFaultyServer(LocalServerTestCase):
+
+    server_kwargs = dict(total_items=30)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.server.slow_response_delay = 1
+
+    def crawl(self, **retry_policy_kwargs) -> list:
+        retry_policy = RetryPolicy(**{'base_delay': 0.01, 'timeout': 0.5, **retry_policy_kwargs})
+        with OpenSeaSession(rate_limit=100) as session:
+            client_params = ClientParams(limit=5, page_size=5, retry_policy=retry_policy)
+            return EventsEndpoint(client_params=client_params, session=session).get_parsed_pages()
+
+    def test_transient_faults_are_retried(self):
+        self.server.inject_faults(10, 503, 'html')
+        self.server.inject_faults(20, 'disconnect', 502)
+        events = self.crawl()
+        self.assertEqual(list(range(30)), sorted(int(event.id) for event in events))
+        self.assertEqual(4, self.server.faulty_requests)
+
+    def test_timed_out_requests_are_retried(self):
+        self.server.inject_faults(5, 'slow')
+        events = self.crawl(timeout=0.2)
+        self.assertEqual(30, len(events))
+
+    def test_persistent_faults_raise_after_the_last_attempt(self):
+        self.server.inject_faults(10, *[503] * 10)
+        with self.assertRaises(ConnectionError):
+            self.crawl(max_attempts=3)
+        self.assertEqual(3, self.server.faulty_requests)
+
+    def test_client_errors_are_not_retried(self):
+        self.server.inject_faults(10, 400, 400)
+        with self.assertRaises(ConnectionError):
+            self.crawl()
+        self.assertEqual(1, self.server.faulty_requests)
+
+    def test_html_pages_of_client_errors_are_not_retried(self):
+        self.server.inject_faults(10, 'html404', 'html404')
+        with self.assertRaisesRegex(ConnectionError, 'status.opensea.io'):
+            self.crawl()
+        self.assertEqual(1, self.server.faulty_requests)
+
+    def test_exhausted_budget_stops_retries(self):
+        self.server.inject_faults(10, 503, 503)
+        with self.assertRaises(ConnectionError):
+            self.crawl(budget_min_retries=1, budget_ratio=0)
+        self.assertEqual(2, self.server.faulty_requests)
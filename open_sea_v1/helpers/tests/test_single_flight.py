@@ -0,0 +1,64 @@
+import asyncio
+from unittest import TestCase
+
+from open_sea_v1.helpers.single_flight import SingleFlight
+
+
+class TestSingleFlight(TestCase):
+
+    def setUp(self) -> None:
+        self.calls = 0
+
+    async def call(self, result='result', error: Exception = None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if error:
+            raise error
+        return result
+
+    def test_identical_calls_in_flight_are_made_once(self):
+        async def run() -> list:
+            single_flight = SingleFlight()
+            results = await asyncio.gather(*(single_flight.do('key', self.call) for _ in range(5)))
+            self.assertEqual((4, dict()), (single_flight.joined_calls, single_flight.in_flight))
+            return results
+
+        self.assertEqual(['result'] * 5, asyncio.run(run()))
+        self.assertEqual(1, self.calls)
+
+    def test_calls_are_made_again_once_over(self):
+        async def run() -> None:
+            single_flight = SingleFlight()
+            await single_flight.do('key', self.call)
+            await single_flight.do('key', self.call)
+
+        asyncio.run(run())
+        self.assertEqual(2, self.calls)
+
+    def test_exceptions_are_raised_to_every_caller(self):
+        async def run() -> list:
+            single_flight = SingleFlight()
+            call = lambda: self.call(error=ConnectionError('failed'))
+            return await asyncio.gather(*(single_flight.do('key', call) for _ in range(3)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ConnectionError) for result in asyncio.run(run())))
+        self.assertEqual(1, self.calls)
+
+    def test_call_is_only_cancelled_with_its_last_caller(self):
+        async def run() -> tuple:
+            single_flight = SingleFlight()
+            first = asyncio.create_task(single_flight.do('key', self.call))
+            second = asyncio.create_task(single_flight.do('key', self.call))
+            await asyncio.sleep(0)
+            flight = single_flight.in_flight['key']
+            first.cancel()
+            result = await second
+            third = asyncio.create_task(single_flight.do('other', self.call))
+            await asyncio.sleep(0)
+            other_flight = single_flight.in_flight['other']
+            third.cancel()
+            await asyncio.gather(third, return_exceptions=True)
+            await asyncio.sleep(0)
+            return result, flight.task.cancelled(), other_flight.task.cancelled()
+
+        self.assertEqual(('result', False, True), asyncio.run(run()))
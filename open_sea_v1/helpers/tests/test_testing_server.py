@@ -0,0 +1,61 @@
+import time
+
+from open_sea_v1.endpoints.assets import AssetsEndpoint
+from open_sea_v1.endpoints.client import ClientParams
+from open_sea_v1.endpoints.collections import CollectionsEndpoint
+from open_sea_v1.endpoints.events import EventsEndpoint
+from open_sea_v1.endpoints.orders import OrdersEndpoint
+from open_sea_v1.endpoints.session import OpenSeaSession
+from open_sea_v1.helpers.testing_class import LocalServerTestCase
+from open_sea_v1.helpers.testing_payloads import SAMPLE_CONTRACT
+
+
+class TestLocalOpenSeaServer(LocalServerTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.server.latency, self.server.max_limit = 0.0, None
+        self.session = OpenSeaSession(rate_limit=200)
+        self.session.open()
+        self.addCleanup(self.session.close)
+
+    def client_params(self, **kwargs) -> ClientParams:
+        return ClientParams(**{'limit': 5, 'page_size': 5, 'concurrent_pagination': False, **kwargs})
+
+    def test_every_endpoint_paginates_over_its_fixture_items(self):
+        endpoints = [
+            AssetsEndpoint(client_params=self.client_params(), asset_contract_address=SAMPLE_CONTRACT,
+                           session=self.session),
+            EventsEndpoint(client_params=self.client_params(), session=self.session),
+            CollectionsEndpoint(client_params=self.client_params(), session=self.session),
+            OrdersEndpoint(client_params=self.client_params(), session=self.session),
+        ]
+        for endpoint in endpoints:
+            with self.subTest(type(endpoint).__name__):
+                self.assertEqual(12, len(endpoint.get_parsed_pages()))
+        self.assertEqual(4 * 3, self.server.served_requests)
+
+    def test_assets_and_orders_are_filtered_by_token_ids(self):
+        assets = AssetsEndpoint(client_params=self.client_params(), asset_contract_address=SAMPLE_CONTRACT,
+                                token_ids=[3, 7], session=self.session).get_parsed_pages()
+        orders = OrdersEndpoint(client_params=self.client_params(), asset_contract_address=SAMPLE_CONTRACT,
+                                token_id='5', session=self.session).get_parsed_pages()
+        self.assertEqual(['3', '7'], [asset.token_id for asset in assets])
+        self.assertEqual(['5'], [order.asset.token_id for order in orders])
+
+    def test_responses_are_delayed_by_the_latency(self):
+        self.server.latency = 0.1
+        started_at = time.monotonic()
+        EventsEndpoint(client_params=self.client_params(), session=self.session).get_parsed_pages()
+        self.assertGreaterEqual(time.monotonic() - started_at, 3 * 0.1)
+
+    def test_limits_over_the_max_limit_are_rejected(self):
+        self.server.max_limit = 4
+        with self.assertRaisesRegex(ConnectionError, 'less than or equal to 4'):
+            EventsEndpoint(client_params=self.client_params(), session=self.session).get_parsed_pages()
+
+    def test_faults_are_injected_in_every_endpoint(self):
+        self.server.inject_faults(5, 503)
+        collections = CollectionsEndpoint(client_params=self.client_params(), session=self.session).get_parsed_pages()
+        self.assertEqual(12, len(collections))
+        self.assertEqual((1, 3), (self.server.faulty_requests, self.server.served_requests))
@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from open_sea_v1.helpers.time_windows import TimeWindow
+
+
+class TestTimeWindow(TestCase):
+    window = TimeWindow(datetime(2021, 8, 1), datetime(2021, 8, 2))
+
+    def test_split_covers_the_window_with_equal_parts(self):
+        parts = self.window.split(4)
+        self.assertEqual(4, len(parts))
+        self.assertEqual(self.window.start, parts[0].start)
+        self.assertEqual(self.window.end, parts[-1].end)
+        self.assertTrue(all(part.duration == timedelta(hours=6) for part in parts))
+        self.assertTrue(all(left.end == right.start for left, right in zip(parts, parts[1:])))
+
+    def test_split_parts_overlap_within_the_window(self):
+        parts = self.window.split(2, overlap=timedelta(seconds=1))
+        self.assertEqual(datetime(2021, 8, 1, 12, 0, 1), parts[0].end)
+        self.assertEqual(datetime(2021, 8, 1, 12), parts[1].start)
+        self.assertEqual(self.window.end, parts[1].end)
+
+    def test_invalid_windows_raise(self):
+        self.assertRaises(ValueError, TimeWindow, self.window.end, self.window.start)
+        self.assertRaises(ValueError, self.window.split, 0)
@@ -0,0 +1,32 @@
+"""
+Time windows, into which the crawls of time ranges are sliced, to be fetched concurrently.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """Range of time between start and end, as passed to the occurred_after and occurred_before parameters."""
+    start: datetime
+    end: datetime
+
+    def __post_init__(self):
+        if not self.start < self.end:
+            raise ValueError(f'{self.start=} must be before {self.end=}.')
+
+    @property
+    def duration(self) -> timedelta:
+        return self.end - self.start
+
+    def split(self, parts: int, overlap: timedelta = timedelta(0)) -> list['TimeWindow']:
+        """
+        Splits the window into parts of equal duration.
+        Each part but the last one is extended by overlap, so that the events occurring on a boundary
+        are not missed by both parts when the bounds of the API are exclusive.
+        """
+        if parts < 1:
+            raise ValueError(f'{parts=} must be at least 1.')
+        part_duration = self.duration / parts
+        boundaries = [self.start + part_duration * i for i in range(parts)] + [self.end]
+        return [TimeWindow(start, min(self.end, end + overlap)) for start, end in zip(boundaries, boundaries[1:])]
@@ -1,8 +1,92 @@
 from abc import ABC
+from typing import Any, Callable, Optional
+
+_REQUIRED = object()
+
+
+class JsonField:
+    """
+    Response attribute which is read from the JSON dictionnary of the response when accessed,
+    instead of being copied into the instance on construction.
+    Like _json[key], a missing key raises a KeyError, unless a default value is given, like _json.get(key, default).
+    """
+    __slots__ = ('key', 'default', 'convert', 'name')
+
+    def __init__(self, key: Optional[str] = None, *, default: Any = _REQUIRED, convert: Callable[[Any], Any] = None):
+        self.key = key
+        self.default = default
+        self.convert = convert
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        self.key = self.key or name
+
+    def __get__(self, instance, owner) -> Any:
+        if instance is None:
+            return self
+        if self.default is _REQUIRED:
+            value = instance._json[self.key]
+        else:
+            value = instance._json.get(self.key, self.default)
+        return self.convert(value) if self.convert else value
+
+    def __set__(self, instance, value: Any) -> None:
+        instance._json[self.key] = value
+
+
+class memoized_property:
+    """
+    Property which is computed once per instance, for the nested response objects.
+    The value is kept in the _memo slot of the instance, as the responses have no instance dict for cached_property.
+    """
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner) -> Any:
+        if instance is None:
+            return self
+        memo = instance._memo
+        if memo is None:
+            memo = instance._memo = dict()
+        try:
+            return memo[self.name]
+        except KeyError:
+            value = memo[self.name] = self.func(instance)
+            return value
+
+
+def str_or_empty(value: Any) -> str:
+    return str(value or '')
+
+
+class JsonObject:
+    """Parent class of the objects nested in OpenSea API Responses, which only hold their JSON dictionnary."""
+    __slots__ = ('_json', '_memo')
+
+    def __init__(self, _json: dict):
+        self._json = _json
+        self._memo = None
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._json == other._json
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(_json={self._json!r})'
 
 
 class BaseResponse(ABC):
     """Parent class for OpenSea API Responses."""
+    __slots__ = ('_json', '_memo')
 
     def __init__(self, _json: dict = None):
         self._json = _json
+        self._memo = None
+
+    def __post_init__(self):
+        self._memo = None
@@ -4,83 +4,81 @@ Assigns attributes to dictionnary values for easier object navigation.
 from dataclasses import dataclass
 from typing import Optional
 
-from open_sea_v1.responses.abc import BaseResponse
+from open_sea_v1.responses.abc import BaseResponse, JsonField, JsonObject, memoized_property
 
 
-@dataclass
-class _CollectionStats:
-    _json: dict
+class _CollectionStats(JsonObject):
+    __slots__ = ()
+
+    one_day_volume = JsonField()
+    one_day_change = JsonField()
+    one_day_average_price = JsonField()
+    one_day_sales = JsonField()
+    seven_day_volume = JsonField()
+    seven_day_change = JsonField()
+    seven_day_sales = JsonField()
+    seven_day_average_price = JsonField()
+    thirty_day_volume = JsonField()
+    thirty_day_change = JsonField()
+    thirty_day_sales = JsonField()
+    thirty_day_average_price = JsonField()
+    total_volume = JsonField()
+    total_sales = JsonField()
+    total_supply = JsonField()
+    count = JsonField()
+    num_owners = JsonField()
+    average_price = JsonField()
+    num_reports = JsonField()
+    market_cap = JsonField()
+    floor_price = JsonField()
 
     def __str__(self) -> str:
         return f"{self.floor_price=}    {self.average_price=}   {self.market_cap=})"
 
-    def __post_init__(self):
-        self.one_day_volume = self._json["one_day_volume"]
-        self.one_day_change = self._json["one_day_change"]
-        self.one_day_average_price = self._json["one_day_average_price"]
-        self.one_day_sales = self._json["one_day_sales"]
-        self.seven_day_volume = self._json["seven_day_volume"]
-        self.seven_day_change = self._json["seven_day_change"]
-        self.seven_day_sales = self._json["seven_day_sales"]
-        self.seven_day_average_price = self._json["seven_day_average_price"]
-        self.thirty_day_volume = self._json["thirty_day_volume"]
-        self.thirty_day_change = self._json["thirty_day_change"]
-        self.thirty_day_sales = self._json["thirty_day_sales"]
-        self.thirty_day_average_price = self._json["thirty_day_average_price"]
-        self.total_volume = self._json["total_volume"]
-        self.total_sales = self._json["total_sales"]
-        self.total_supply = self._json["total_supply"]
-        self.count = self._json["count"]
-        self.num_owners = self._json["num_owners"]
-        self.average_price = self._json["average_price"]
-        self.num_reports = self._json["num_reports"]
-        self.market_cap = self._json["market_cap"]
-        self.floor_price = self._json["floor_price"]
-
 
 @dataclass
 class CollectionResponse(BaseResponse):
+    __slots__ = ()
     _json: dict
 
+    primary_asset_contracts = JsonField(default=None)
+    traits = JsonField(default=None)
+    banner_image_url = JsonField()
+    chat_url = JsonField()
+    created_date = JsonField()
+    default_to_fiat = JsonField()
+    description = JsonField()
+    dev_buyer_fee_basis_points = JsonField()
+    dev_seller_fee_basis_points = JsonField()
+    discord_url = JsonField()
+    display_data = JsonField()
+    external_url = JsonField()
+    featured = JsonField()
+    featured_image_url = JsonField()
+    hidden = JsonField()
+    safelist_request_status = JsonField()
+    image_url = JsonField()
+    is_subject_to_whitelist = JsonField()
+    large_image_url = JsonField()
+    medium_username = JsonField()
+    only_proxied_transfers = JsonField()
+    opensea_buyer_fee_basis_points = JsonField()
+    opensea_seller_fee_basis_points = JsonField()
+    payout_address = JsonField()
+    require_email = JsonField()
+    short_description = JsonField()
+    slug = JsonField()
+    telegram_url = JsonField()
+    twitter_username = JsonField()
+    instagram_username = JsonField()
+    wiki_url = JsonField()
+    name = JsonField()
+    owned_asset_count = JsonField(default=None)
+
     def __str__(self) -> str:
         return f"{self.name=}   {self.short_description=})"
 
-    def __post_init__(self):
-        self.primary_asset_contracts: Optional[list] = self._json.get('primary_asset_contracts')
-        self.traits: Optional[dict] = self._json.get('traits')
-        self.banner_image_url = self._json["banner_image_url"]
-        self.chat_url = self._json["chat_url"]
-        self.created_date = self._json["created_date"]
-        self.default_to_fiat = self._json["default_to_fiat"]
-        self.description = self._json["description"]
-        self.dev_buyer_fee_basis_points = self._json["dev_buyer_fee_basis_points"]
-        self.dev_seller_fee_basis_points = self._json["dev_seller_fee_basis_points"]
-        self.discord_url = self._json["discord_url"]
-        self.display_data = self._json["display_data"]
-        self.external_url = self._json["external_url"]
-        self.featured = self._json["featured"]
-        self.featured_image_url = self._json["featured_image_url"]
-        self.hidden = self._json["hidden"]
-        self.safelist_request_status = self._json["safelist_request_status"]
-        self.image_url = self._json["image_url"]
-        self.is_subject_to_whitelist = self._json["is_subject_to_whitelist"]
-        self.large_image_url = self._json["large_image_url"]
-        self.medium_username = self._json["medium_username"]
-        self.only_proxied_transfers = self._json["only_proxied_transfers"]
-        self.opensea_buyer_fee_basis_points = self._json["opensea_buyer_fee_basis_points"]
-        self.opensea_seller_fee_basis_points = self._json["opensea_seller_fee_basis_points"]
-        self.payout_address = self._json["payout_address"]
-        self.require_email = self._json["require_email"]
-        self.short_description = self._json["short_description"]
-        self.slug = self._json["slug"]
-        self.telegram_url = self._json["telegram_url"]
-        self.twitter_username = self._json["twitter_username"]
-        self.instagram_username = self._json["instagram_username"]
-        self.wiki_url = self._json["wiki_url"]
-        self.name = self._json["name"]
-        self.owned_asset_count = self._json.get('owned_asset_count')
-
-    @property
+    @memoized_property
     def stats(self) -> Optional[_CollectionStats]:
         stats = self._json.get('stats')
         return _CollectionStats(stats) if stats else None
@@ -2,8 +2,8 @@ import locale
 import logging
 from dataclasses import dataclass
 
-from open_sea_v1.helpers.ether_converter import EtherConverter, EtherUnit
-from open_sea_v1.responses.abc import BaseResponse
+from open_sea_v1.helpers.ether_converter import wei_to_ether
+from open_sea_v1.responses.abc import BaseResponse, JsonField, memoized_property
 from open_sea_v1.responses.asset import AssetResponse
 
 logger = logging.getLogger(__name__)
@@ -11,8 +11,30 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class EventResponse(BaseResponse):
+    __slots__ = ()
     _json: dict
 
+    approved_account = JsonField()
+    asset_bundle = JsonField()
+    auction_type = JsonField()
+    collection_slug = JsonField()
+    contract_address = JsonField()
+    created_date = JsonField()
+    custom_event_name = JsonField()
+    dev_fee_payment_event = JsonField()
+    duration = JsonField()
+    ending_price = JsonField()
+    event_type = JsonField()
+    from_account = JsonField()
+    id = JsonField(convert=str)
+    owner_account = JsonField()
+    quantity = JsonField()
+    starting_price = JsonField()
+    to_account = JsonField()
+    total_price = JsonField()
+    bid_amount = JsonField()
+    is_private = JsonField(default=None)
+
     def __str__(self) -> str:
         locale.setlocale(locale.LC_ALL, '')  # big number str formater
 
@@ -28,35 +50,12 @@ class EventResponse(BaseResponse):
         str_representation = "    ".join([name, transaction_date, usd_price, eth_price])
         return str_representation
 
-    def __post_init__(self):
-        self.approved_account = self._json['approved_account']
-        self.asset_bundle = self._json['asset_bundle']
-        self.auction_type = self._json['auction_type']
-        self.collection_slug = self._json['collection_slug']
-        self.contract_address = self._json['contract_address']
-        self.created_date = self._json['created_date']
-        self.custom_event_name = self._json['custom_event_name']
-        self.dev_fee_payment_event = self._json['dev_fee_payment_event']
-        self.duration = self._json['duration']
-        self.ending_price = self._json['ending_price']
-        self.event_type = self._json['event_type']
-        self.from_account = self._json['from_account']
-        self.id = str(self._json['id'])
-        self.owner_account = self._json['owner_account']
-        self.quantity = self._json['quantity']
-        self.starting_price = self._json['starting_price']
-        self.to_account = self._json['to_account']
-        self.total_price = self._json['total_price']
-        self.bid_amount = self._json['bid_amount']
-        self.is_private = self._json.get('is_private')
-
     @property
     def eth_price(self) -> float:
         if not self.total_price:
             logger.debug(f'Event {self.id} for asset {self.asset.name} ({self.asset.id}) has no ETH price. Returning 0.')
             return 0.0
-        eth_price = EtherConverter(quantity=self.total_price, unit=EtherUnit.WEI).ether
-        return eth_price
+        return wei_to_ether(self.total_price)
 
     @property
     def usd_price(self):
@@ -67,7 +66,7 @@ class EventResponse(BaseResponse):
         usd_price = round(self.eth_price * eth_to_usd_price, 2)
         return usd_price
 
-    @property
+    @memoized_property
     def asset(self) -> AssetResponse:
         return AssetResponse(self._json['asset'])
 
@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from open_sea_v1.helpers.testing_payloads import mk_asset_json, mk_collection_json, mk_event_json, mk_order_json
+from open_sea_v1.responses.abc import JsonField
+from open_sea_v1.responses.asset import AssetResponse, OrderResponse
+from open_sea_v1.responses.collection import CollectionResponse
+from open_sea_v1.responses.event import EventResponse
+from open_sea_v1.responses.tests._response_helpers import ResponseTestHelper
+
+
+class TestLazyResponseFields(ResponseTestHelper):
+
+    def setUp(self) -> None:
+        self.responses = [
+            EventResponse(mk_event_json(12)),
+            AssetResponse(mk_asset_json(12)),
+            OrderResponse(mk_order_json(12)),
+            CollectionResponse(mk_collection_json()),
+        ]
+
+    def test_fields_are_read_from_the_json(self):
+        for response in self.responses:
+            fields = {name: f for name, f in vars(type(response)).items() if isinstance(f, JsonField)}
+            for name, field in fields.items():
+                with self.subTest(response=type(response).__name__, field=name):
+                    expected = response._json.get(field.key)
+                    expected = field.convert(expected) if field.convert else expected
+                    self.assertEqual(expected, getattr(response, name))
+
+    def test_responses_do_not_copy_fields_into_an_instance_dict(self):
+        for response in self.responses:
+            with self.subTest(response=type(response).__name__):
+                self.assertFalse(hasattr(response, '__dict__'))
+
+    def test_attributes_do_not_raise_unexpected_exceptions(self):
+        for response in self.responses:
+            with self.subTest(response=type(response).__name__):
+                self.assert_attributes_do_not_raise_unexpected_exceptions(response)
+                self.assert_no_missing_class_attributes_from_original_json_keys(response, response._json)
+
+    def test_conversions_are_kept(self):
+        event, asset, order, _ = self.responses
+        self.assertEqual('12', event.id)
+        self.assertEqual('12', asset.token_id)
+        self.assertEqual('', AssetResponse({}).token_id)
+        self.assertIsNone(AssetResponse({}).name)
+
+    def test_missing_required_key_raises_key_error_when_accessed(self):
+        event_json = mk_event_json(1)
+        del event_json['total_price']
+        event = EventResponse(event_json)
+        self.assertRaises(KeyError, getattr, event, 'total_price')
+
+    def test_assigning_a_field_updates_the_json(self):
+        event = EventResponse(mk_event_json(1))
+        event.total_price = '1'
+        self.assertEqual('1', event.total_price)
+        self.assertEqual('1', event._json['total_price'])
+
+    def test_responses_compare_by_json(self):
+        self.assertEqual(EventResponse(mk_event_json(1)), EventResponse(mk_event_json(1)))
+        self.assertNotEqual(EventResponse(mk_event_json(1)), EventResponse(mk_event_json(2)))
+        self.assertEqual(AssetResponse(mk_asset_json(1)).owner, AssetResponse(mk_asset_json(1)).owner)
+
+
+class TestMemoizedNestedResponses(TestCase):
+
+    def setUp(self) -> None:
+        self.event = EventResponse(mk_event_json(12))
+        self.asset = AssetResponse(mk_asset_json(12))
+        self.order = OrderResponse(mk_order_json(12))
+
+    def test_nested_responses_are_built_once_per_instance(self):
+        nested = [
+            (self.event, 'asset'), (self.order, 'asset'), (self.asset, 'asset_contract'), (self.asset, 'owner'),
+            (self.asset, 'traits'), (self.asset, 'last_sale'), (self.asset, 'collection'),
+            (self.asset, 'sell_orders'), (CollectionResponse(mk_collection_json()), 'stats'),
+        ]
+        for response, name in nested:
+            with self.subTest(response=type(response).__name__, nested=name):
+                self.assertIsNotNone(getattr(response, name))
+                self.assertIs(getattr(response, name), getattr(response, name))
+
+    def test_str_builds_the_nested_asset_once(self):
+        str(self.event)
+        asset = self.event.asset
+        str(self.event)
+        self.assertIs(asset, self.event.asset)
+
+    def test_memoized_values_are_not_shared_between_instances(self):
+        other_event = EventResponse(mk_event_json(13))
+        self.assertIsNot(self.event.asset, other_event.asset)
+        self.assertEqual('13', other_event.asset.token_id)
+
+    def test_memoized_values_do_not_affect_equality(self):
+        other_event = EventResponse(mk_event_json(12))
+        self.event.asset  # memoized on one side only
+        self.assertEqual(self.event, other_event)